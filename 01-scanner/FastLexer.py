@@ -0,0 +1 @@
+../04-semantic-erros/FastLexer.py
\ No newline at end of file
@@ -0,0 +1 @@
+../04-semantic-erros/TokenStream.py
\ No newline at end of file
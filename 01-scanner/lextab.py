@@ -0,0 +1 @@
+../02-parser/lextab.py
\ No newline at end of file
@@ -2,27 +2,43 @@
 import sys
 import ply.lex as lex
 import scanner  # scanner.py is a file you create, (it is not an external library)
+import TokenStream
 
 
 if __name__ == '__main__':
 
+    # --mmap lexes straight from a memory map of the file
+    use_mmap = '--mmap' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--mmap']
+    # --binary OUT writes the tokens to OUT as a TokenStream instead
+    binary = None
+    if '--binary' in args[:-1]:
+        position = args.index('--binary')
+        binary = args[position + 1]
+        del args[position:position + 2]
     try:
-        filename = sys.argv[1] if len(sys.argv) > 1 else "example.txt"
+        filename = args[0] if args else "example.txt"
         file = open(filename, "r")
     except IOError:
         print("Cannot open {0} file".format(filename))
         sys.exit(0)
 
-    text = file.read()
+    text = scanner.map_file(file) if use_mmap else file.read()
+    if binary is not None:
+        with open(binary, "wb") as stream:
+            TokenStream.write_tokens(scanner.lexer, text, stream)
+        sys.exit(0)
+
     lexer = scanner.lexer  
     lexer.input(text) # Give the lexer some input
+    line_index = scanner.LineIndex(text)
 
     # Tokenize
     while True:
         tok = lexer.token()
         if not tok: 
             break    # No more input
-        column = scanner.find_column(text,tok)
+        column = line_index.column(tok.lexpos)
         print("(%d,%d): %s(%s)" %(tok.lineno, column, tok.type, tok.value))
 
         
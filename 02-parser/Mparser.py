@@ -1,6 +1,7 @@
 #!/usr/bin/python
 
 from __future__ import print_function
+import os
 import scanner
 import ply.yacc as yacc
 
@@ -38,7 +39,7 @@ def p_error(p):
 
 def p_instructions(p):
     """instructions : instruction
-                    | instruction instructions"""
+                    | instructions instruction"""
 
 
 def p_instruction(p):
@@ -78,8 +79,8 @@ def p_print(p):
 def p_print_body(p):
     """print_body : string
                   | expression
-                  | string ',' print_body
-                  | expression ',' print_body"""
+                  | print_body ',' string
+                  | print_body ',' expression"""
 
 
 def p_return(p):
@@ -251,4 +252,14 @@ def p_comparison_expression(p):
            | '(' comparison_expression ')'"""
 
 
-parser = yacc.yacc()
+# tables are loaded from parsetab.py next to this module; when the grammar
+# signature no longer matches, ply builds them in memory, and running this
+# module writes them
+parser = yacc.yacc(debug=False, write_tables=False,
+                   outputdir=os.path.dirname(os.path.abspath(__file__)))
+
+
+if __name__ == '__main__':
+    scanner.write_table()
+    yacc.yacc(debug=False,
+              outputdir=os.path.dirname(os.path.abspath(__file__)))
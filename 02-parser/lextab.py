@@ -0,0 +1 @@
+../03-ast/lextab.py
\ No newline at end of file
@@ -5,13 +5,16 @@ import Mparser
 
 if __name__ == '__main__':
 
+    # --mmap lexes straight from a memory map of the file
+    use_mmap = '--mmap' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--mmap']
     try:
-        filename = sys.argv[1] if len(sys.argv) > 1 else "example1.m"
+        filename = args[0] if args else "example1.m"
         file = open(filename, "r")
     except IOError:
         print("Cannot open {0} file".format(filename))
         sys.exit(0)
 
     parser = Mparser.parser
-    text = file.read()
+    text = scanner.map_file(file) if use_mmap else file.read()
     parser.parse(text, lexer=scanner.lexer)
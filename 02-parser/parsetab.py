@@ -0,0 +1,113 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "nonassocIFnonassocELSEright=ADDASSIGNSUBASSIGNMULASSIGNDIVASSIGNnonassoc<>EQNEQGEQLEQleft+-leftDOTADDDOTSUBleft*/leftDOTMULDOTDIVrightUMINUSright'ADDASSIGN BREAK CONTINUE DIVASSIGN DOTADD DOTDIV DOTMUL DOTSUB ELSE EQ EYE FLOATNUM FOR GEQ ID IF INTNUM LEQ MULASSIGN NEQ ONES PRINT RETURN STRING SUBASSIGN WHILE ZEROSinstructions : instruction\n                    | instructions instructioninstruction : block\n                   | conditional\n                   | loop\n                   | statement ';'\n                   | error ';'statement : assignment\n                 | flow_keyword\n                 | return\n                 | printflow_keyword : BREAK\n                    | CONTINUEexpression : comparison_expression\n                  | numeric_expressionblock : '{' instructions '}'\n             | '{' error '}'print : PRINT print_bodyprint_body : string\n                  | expression\n                  | print_body ',' string\n                  | print_body ',' expressionreturn : RETURN expression\n              | RETURNstring : STRINGvector : '[' vector_body ']'\n              | '[' ']'vector_body : numeric_expression\n                   | vector_body ',' numeric_expressionmatrix : '[' matrix_body ']'\n              | '[' ']'matrix_body : vector\n                   | matrix_body ',' vectorarray_range : var '[' expression ',' expression ']'fun : fun_name '(' numeric_expression ')'\n           | fun_name '(' error ')'fun_name : ZEROS\n                | ONES\n                | EYEloop : while\n            | forwhile : WHILE '(' expression ')' instructionfor : FOR ID '=' numeric_expression ':' numeric_expression instructionconditional : IF '(' expression ')' instruction %prec IF\n                   | IF '(' expression ')' instruction ELSE instructionassignment_lhs : var\n                      | array_rangeassignment : assignment_lhs assignment_operator expression\n                  | assignment_lhs '=' stringassignment_operator : '='\n                           | ADDASSIGN\n                           | SUBASSIGN\n                           | MULASSIGN\n                           | DIVASSIGNvar : ID\n           | var '[' numeric_expression ']'num : INTNUM\n           | FLOATNUM\n           | varunary_op : negation\n                | transpositionnegation : '-' numeric_expression %prec UMINUStransposition : numeric_expression '\\''numeric_expression : num\n                          | matrix\n                          | unary_op\n                          | fun\n                          | '(' numeric_expression ')'numeric_expression : numeric_expression '+' numeric_expression\n                          | numeric_expression '-' numeric_expression\n                          | numeric_expression '*' numeric_expression\n                          | numeric_expression '/' numeric_expression\n                          | numeric_expression DOTADD numeric_expression\n                          | numeric_expression DOTSUB numeric_expression\n                          | numeric_expression DOTMUL numeric_expression\n                          | numeric_expression DOTDIV numeric_expressioncomparison_expression : numeric_expression '<' numeric_expression\n           | numeric_expression '>' numeric_expression\n           | numeric_expression EQ numeric_expression\n           | numeric_expression NEQ numeric_expression\n           | numeric_expression GEQ numeric_expression\n           | numeric_expression LEQ numeric_expression\n           | '(' comparison_expression ')'"
+    
+_lr_action_items = {'SUBASSIGN':([5,14,15,17,129,144,],[50,-46,-55,-47,-56,-34,]),'DOTDIV':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,136,137,142,143,],[-55,-58,-64,-66,64,-57,-65,-60,-59,-61,-67,-63,64,-62,-31,64,-76,64,-75,64,64,64,64,64,64,64,64,64,64,64,-68,64,64,-30,64,64,64,-56,64,-35,-36,64,64,]),'RETURN':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[1,-4,-41,1,-55,-1,-40,-5,1,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,1,-63,-62,-31,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,1,-56,1,-35,-36,-42,-44,1,1,-43,-45,]),'FLOATNUM':([1,3,33,34,49,50,51,52,53,54,55,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[27,27,27,27,27,-52,-54,-53,27,-51,-50,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'DOTADD':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,136,137,142,143,],[-55,-58,-64,-66,73,-57,-65,-60,-59,-61,-67,-63,73,-62,-31,73,-76,73,-75,73,-71,73,-72,-74,-73,73,73,73,73,73,-68,73,73,-30,73,73,73,-56,73,-35,-36,73,73,]),'WHILE':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[4,-4,-41,4,-55,-1,-40,-5,4,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,4,-63,-62,-31,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,4,-56,4,-35,-36,-42,-44,4,4,-43,-45,]),'PRINT':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[3,-4,-41,3,-55,-1,-40,-5,3,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,3,-63,-62,-31,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,3,-56,3,-35,-36,-42,-44,3,3,-43,-45,]),'DOTMUL':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,136,137,142,143,],[-55,-58,-64,-66,66,-57,-65,-60,-59,-61,-67,-63,66,-62,-31,66,-76,66,-75,66,66,66,66,66,66,66,66,66,66,66,-68,66,66,-30,66,66,66,-56,66,-35,-36,66,66,]),'NEQ':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,102,103,104,105,106,107,108,115,118,129,130,136,137,],[-55,-58,-64,-66,78,-57,-65,-60,-59,-61,-67,-63,78,-62,-31,78,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,-56,78,-35,-36,]),'GEQ':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,102,103,104,105,106,107,108,115,118,129,130,136,137,],[-55,-58,-64,-66,65,-57,-65,-60,-59,-61,-67,-63,65,-62,-31,65,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,-56,65,-35,-36,]),'INTNUM':([1,3,33,34,49,50,51,52,53,54,55,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[31,31,31,31,31,-52,-54,-53,31,-51,-50,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),"'":([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,136,137,142,143,],[-55,-58,-64,-66,67,-57,-65,-60,-59,-61,-67,-63,67,67,-31,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-68,67,67,-30,67,67,67,-56,67,-35,-36,67,67,]),']':([15,26,27,28,29,30,31,32,35,36,40,41,43,67,81,84,85,86,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,117,118,120,121,122,129,133,134,136,137,140,142,],[-55,-14,-58,-64,-66,-15,-57,-65,-60,-59,87,-61,-67,-63,-62,118,-32,122,-31,129,-76,-81,-75,-69,-71,-70,-72,-74,-73,-82,-78,-79,-77,-80,-83,-68,129,-30,134,-28,-27,-56,-33,-26,-35,-36,144,-29,]),')':([15,26,27,28,29,30,31,32,35,36,41,43,67,79,80,81,87,90,97,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,123,124,129,130,136,137,],[-55,-14,-58,-64,-66,-15,-57,-65,-60,-59,-61,-67,-63,114,115,-62,-31,127,132,-76,-81,-75,-69,-71,-70,-72,-74,-73,-82,-78,-79,-77,-80,-83,-68,115,-30,136,137,-56,115,-35,-36,]),'(':([1,3,4,16,33,34,37,38,39,42,49,50,51,52,53,54,55,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[33,33,49,60,33,82,-39,-38,-37,88,33,-52,-54,-53,33,-51,-50,95,33,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,33,82,95,33,82,82,]),'+':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,136,137,142,143,],[-55,-58,-64,-66,68,-57,-65,-60,-59,-61,-67,-63,68,-62,-31,68,-76,68,-75,-69,-71,-70,-72,-74,-73,68,68,68,68,68,-68,68,68,-30,68,68,68,-56,68,-35,-36,68,68,]),'*':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,136,137,142,143,],[-55,-58,-64,-66,69,-57,-65,-60,-59,-61,-67,-63,69,-62,-31,69,-76,69,-75,69,-71,69,-72,69,69,69,69,69,69,69,-68,69,69,-30,69,69,69,-56,69,-35,-36,69,69,]),'-':([1,3,15,27,28,29,30,31,32,33,34,35,36,41,43,49,50,51,52,53,54,55,59,60,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,80,81,82,83,86,87,88,89,93,94,95,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,131,135,136,137,139,142,143,],[34,34,-55,-58,-64,-66,70,-57,-65,34,34,-60,-59,-61,-67,34,-52,-54,-53,34,-51,-50,34,34,34,34,34,-63,34,34,34,34,34,34,34,34,34,34,34,70,-62,34,34,34,-31,34,34,34,70,34,-76,70,-75,-69,-71,-70,-72,-74,-73,70,70,70,70,70,-68,70,70,-30,70,70,70,-56,70,34,34,-35,-36,34,70,70,]),',':([15,26,27,28,29,30,31,32,35,36,41,43,45,46,47,48,67,81,84,85,87,94,96,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,118,120,121,122,125,126,129,133,134,136,137,142,],[-55,-14,-58,-64,-66,-15,-57,-65,-60,-59,-61,-67,-25,-19,89,-20,-63,-62,119,-32,-31,-15,131,-76,-81,-75,-69,-71,-70,-72,-74,-73,-82,-78,-79,-77,-80,-83,-68,-30,135,-28,-27,-21,-22,-56,-33,-26,-35,-36,-29,]),'/':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,136,137,142,143,],[-55,-58,-64,-66,71,-57,-65,-60,-59,-61,-67,-63,71,-62,-31,71,-76,71,-75,71,-71,71,-72,71,71,71,71,71,71,71,-68,71,71,-30,71,71,71,-56,71,-35,-36,71,71,]),'DIVASSIGN':([5,14,15,17,129,144,],[51,-46,-55,-47,-56,-34,]),'ADDASSIGN':([5,14,15,17,129,144,],[54,-46,-55,-47,-56,-34,]),';':([1,7,8,10,12,13,15,19,21,23,26,27,28,29,30,31,32,35,36,41,43,44,45,46,47,48,63,67,81,87,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,118,125,126,129,136,137,],[-24,56,-11,-10,-8,-9,-55,-12,-13,61,-14,-58,-64,-66,-15,-57,-65,-60,-59,-61,-67,-23,-25,-19,-18,-20,61,-63,-62,-31,-48,-49,-76,-81,-75,-69,-71,-70,-72,-74,-73,-82,-78,-79,-77,-80,-83,-68,-30,-21,-22,-56,-35,-36,]),':':([15,27,28,29,31,32,35,36,41,43,67,81,87,100,102,103,104,105,106,107,108,115,118,128,129,136,137,],[-55,-58,-64,-66,-57,-65,-60,-59,-61,-67,-63,-62,-31,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,139,-56,-35,-36,]),'=':([5,14,15,17,58,129,144,],[55,-46,-55,-47,93,-56,-34,]),'<':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,102,103,104,105,106,107,108,115,118,129,130,136,137,],[-55,-58,-64,-66,77,-57,-65,-60,-59,-61,-67,-63,77,-62,-31,77,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,-56,77,-35,-36,]),'$end':([2,6,9,18,20,22,25,56,57,61,98,99,138,141,146,147,],[-4,-41,0,-1,-40,-5,-3,-6,-2,-7,-16,-17,-42,-44,-43,-45,]),'EYE':([1,3,33,34,49,50,51,52,53,54,55,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[37,37,37,37,37,-52,-54,-53,37,-51,-50,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'STRING':([3,55,89,],[45,45,45,]),'FOR':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[11,-4,-41,11,-55,-1,-40,-5,11,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,11,-63,-62,-31,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,11,-56,11,-35,-36,-42,-44,11,11,-43,-45,]),'ELSE':([2,6,20,22,25,56,61,98,99,138,141,146,147,],[-4,-41,-40,-5,-3,-6,-7,-16,-17,-42,145,-43,-45,]),'ONES':([1,3,33,34,49,50,51,52,53,54,55,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[38,38,38,38,38,-52,-54,-53,38,-51,-50,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'ZEROS':([1,3,33,34,49,50,51,52,53,54,55,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[39,39,39,39,39,-52,-54,-53,39,-51,-50,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'[':([1,3,14,15,33,34,36,40,49,50,51,52,53,54,55,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,119,129,131,135,139,],[40,40,59,-55,40,40,83,86,40,-52,-54,-53,40,-51,-50,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,86,-56,40,40,40,]),'DOTSUB':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,121,123,128,129,130,136,137,142,143,],[-55,-58,-64,-66,72,-57,-65,-60,-59,-61,-67,-63,72,-62,-31,72,-76,72,-75,72,-71,72,-72,-74,-73,72,72,72,72,72,-68,72,72,-30,72,72,72,-56,72,-35,-36,72,72,]),'EQ':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,102,103,104,105,106,107,108,115,118,129,130,136,137,],[-55,-58,-64,-66,76,-57,-65,-60,-59,-61,-67,-63,76,-62,-31,76,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,-56,76,-35,-36,]),'ID':([0,1,2,3,6,9,11,15,18,20,22,24,25,27,28,29,31,32,33,34,35,36,41,43,49,50,51,52,53,54,55,56,57,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,82,83,86,87,88,89,93,95,98,99,100,102,103,104,105,106,107,108,115,118,127,129,131,132,135,136,137,138,139,141,143,145,146,147,],[15,15,-4,15,-41,15,58,-55,-1,-40,-5,15,-3,-58,-64,-66,-57,-65,15,15,-60,-59,-61,-67,15,-52,-54,-53,15,-51,-50,-6,-2,15,15,-7,15,15,15,15,-63,15,15,15,15,15,15,15,15,15,15,15,-62,15,15,15,-31,15,15,15,15,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,15,-56,15,15,15,-35,-36,-42,15,-44,15,15,-43,-45,]),'IF':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[16,-4,-41,16,-55,-1,-40,-5,16,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,16,-63,-62,-31,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,16,-56,16,-35,-36,-42,-44,16,16,-43,-45,]),'BREAK':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[19,-4,-41,19,-55,-1,-40,-5,19,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,19,-63,-62,-31,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,19,-56,19,-35,-36,-42,-44,19,19,-43,-45,]),'LEQ':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,102,103,104,105,106,107,108,115,118,129,130,136,137,],[-55,-58,-64,-66,74,-57,-65,-60,-59,-61,-67,-63,74,-62,-31,74,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,-56,74,-35,-36,]),'CONTINUE':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[21,-4,-41,21,-55,-1,-40,-5,21,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,21,-63,-62,-31,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,21,-56,21,-35,-36,-42,-44,21,21,-43,-45,]),'MULASSIGN':([5,14,15,17,129,144,],[52,-46,-55,-47,-56,-34,]),'error':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,88,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[23,-4,-41,23,-55,-1,-40,-5,63,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,23,-63,-62,-31,124,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,23,-56,23,-35,-36,-42,-44,23,23,-43,-45,]),'{':([0,2,6,9,15,18,20,22,24,25,27,28,29,31,32,35,36,41,43,56,57,61,62,67,81,87,98,99,100,102,103,104,105,106,107,108,115,118,127,129,132,136,137,138,141,143,145,146,147,],[24,-4,-41,24,-55,-1,-40,-5,24,-3,-58,-64,-66,-57,-65,-60,-59,-61,-67,-6,-2,-7,24,-63,-62,-31,-16,-17,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,24,-56,24,-35,-36,-42,-44,24,24,-43,-45,]),'>':([15,27,28,29,30,31,32,35,36,41,43,67,80,81,87,94,100,102,103,104,105,106,107,108,115,118,129,130,136,137,],[-55,-58,-64,-66,75,-57,-65,-60,-59,-61,-67,-63,75,-62,-31,75,-76,-75,-69,-71,-70,-72,-74,-73,-68,-30,-56,75,-35,-36,]),'}':([2,6,18,20,22,25,56,57,61,62,63,98,99,138,141,146,147,],[-4,-41,-1,-40,-5,-3,-6,-2,-7,98,99,-16,-17,-42,-44,-43,-45,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'matrix_body':([40,],[84,]),'conditional':([0,9,24,62,127,132,143,145,],[2,2,2,2,2,2,2,2,]),'comparison_expression':([1,3,33,49,53,59,60,89,95,131,],[26,26,79,26,26,26,26,26,79,26,]),'vector_body':([86,],[120,]),'num':([1,3,33,34,49,53,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'unary_op':([1,3,33,34,49,53,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'numeric_expression':([1,3,33,34,49,53,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[30,30,80,81,30,30,94,30,100,101,102,103,104,105,106,107,108,109,110,111,112,113,116,117,121,123,30,128,130,30,142,143,]),'assignment_lhs':([0,9,24,62,127,132,143,145,],[5,5,5,5,5,5,5,5,]),'matrix':([1,3,33,34,49,53,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'for':([0,9,24,62,127,132,143,145,],[6,6,6,6,6,6,6,6,]),'negation':([1,3,33,34,49,53,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'vector':([40,119,],[85,133,]),'statement':([0,9,24,62,127,132,143,145,],[7,7,7,7,7,7,7,7,]),'var':([0,1,3,9,24,33,34,49,53,59,60,62,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,127,131,132,135,139,143,145,],[14,36,36,14,14,36,36,36,36,36,36,14,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,14,36,14,36,36,14,14,]),'assignment_operator':([5,],[53,]),'return':([0,9,24,62,127,132,143,145,],[10,10,10,10,10,10,10,10,]),'string':([3,55,89,],[46,92,125,]),'assignment':([0,9,24,62,127,132,143,145,],[12,12,12,12,12,12,12,12,]),'flow_keyword':([0,9,24,62,127,132,143,145,],[13,13,13,13,13,13,13,13,]),'print':([0,9,24,62,127,132,143,145,],[8,8,8,8,8,8,8,8,]),'instructions':([0,24,],[9,62,]),'print_body':([3,],[47,]),'array_range':([0,9,24,62,127,132,143,145,],[17,17,17,17,17,17,17,17,]),'instruction':([0,9,24,62,127,132,143,145,],[18,57,18,57,138,141,146,147,]),'while':([0,9,24,62,127,132,143,145,],[20,20,20,20,20,20,20,20,]),'fun_name':([1,3,33,34,49,53,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'loop':([0,9,24,62,127,132,143,145,],[22,22,22,22,22,22,22,22,]),'fun':([1,3,33,34,49,53,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'expression':([1,3,49,53,59,60,89,131,],[44,48,90,91,96,97,126,140,]),'transposition':([1,3,33,34,49,53,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,82,83,86,88,89,93,95,131,135,139,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'block':([0,9,24,62,127,132,143,145,],[25,25,25,25,25,25,25,25,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> instructions","S'",1,None,None,None),
+  ('instructions -> instruction','instructions',1,'p_instructions','Mparser.py',41),
+  ('instructions -> instructions instruction','instructions',2,'p_instructions','Mparser.py',42),
+  ('instruction -> block','instruction',1,'p_instruction','Mparser.py',46),
+  ('instruction -> conditional','instruction',1,'p_instruction','Mparser.py',47),
+  ('instruction -> loop','instruction',1,'p_instruction','Mparser.py',48),
+  ('instruction -> statement ;','instruction',2,'p_instruction','Mparser.py',49),
+  ('instruction -> error ;','instruction',2,'p_instruction','Mparser.py',50),
+  ('statement -> assignment','statement',1,'p_statement','Mparser.py',54),
+  ('statement -> flow_keyword','statement',1,'p_statement','Mparser.py',55),
+  ('statement -> return','statement',1,'p_statement','Mparser.py',56),
+  ('statement -> print','statement',1,'p_statement','Mparser.py',57),
+  ('flow_keyword -> BREAK','flow_keyword',1,'p_flow_keyword','Mparser.py',61),
+  ('flow_keyword -> CONTINUE','flow_keyword',1,'p_flow_keyword','Mparser.py',62),
+  ('expression -> comparison_expression','expression',1,'p_expression','Mparser.py',66),
+  ('expression -> numeric_expression','expression',1,'p_expression','Mparser.py',67),
+  ('block -> { instructions }','block',3,'p_block','Mparser.py',71),
+  ('block -> { error }','block',3,'p_block','Mparser.py',72),
+  ('print -> PRINT print_body','print',2,'p_print','Mparser.py',76),
+  ('print_body -> string','print_body',1,'p_print_body','Mparser.py',80),
+  ('print_body -> expression','print_body',1,'p_print_body','Mparser.py',81),
+  ('print_body -> print_body , string','print_body',3,'p_print_body','Mparser.py',82),
+  ('print_body -> print_body , expression','print_body',3,'p_print_body','Mparser.py',83),
+  ('return -> RETURN expression','return',2,'p_return','Mparser.py',87),
+  ('return -> RETURN','return',1,'p_return','Mparser.py',88),
+  ('string -> STRING','string',1,'p_string','Mparser.py',92),
+  ('vector -> [ vector_body ]','vector',3,'p_vector','Mparser.py',100),
+  ('vector -> [ ]','vector',2,'p_vector','Mparser.py',101),
+  ('vector_body -> numeric_expression','vector_body',1,'p_vector_body','Mparser.py',105),
+  ('vector_body -> vector_body , numeric_expression','vector_body',3,'p_vector_body','Mparser.py',106),
+  ('matrix -> [ matrix_body ]','matrix',3,'p_matrix','Mparser.py',110),
+  ('matrix -> [ ]','matrix',2,'p_matrix','Mparser.py',111),
+  ('matrix_body -> vector','matrix_body',1,'p_matrix_body','Mparser.py',115),
+  ('matrix_body -> matrix_body , vector','matrix_body',3,'p_matrix_body','Mparser.py',116),
+  ('array_range -> var [ expression , expression ]','array_range',6,'p_array_range','Mparser.py',124),
+  ('fun -> fun_name ( numeric_expression )','fun',4,'p_fun','Mparser.py',132),
+  ('fun -> fun_name ( error )','fun',4,'p_fun','Mparser.py',133),
+  ('fun_name -> ZEROS','fun_name',1,'p_fun_name','Mparser.py',137),
+  ('fun_name -> ONES','fun_name',1,'p_fun_name','Mparser.py',138),
+  ('fun_name -> EYE','fun_name',1,'p_fun_name','Mparser.py',139),
+  ('loop -> while','loop',1,'p_loop','Mparser.py',147),
+  ('loop -> for','loop',1,'p_loop','Mparser.py',148),
+  ('while -> WHILE ( expression ) instruction','while',5,'p_while','Mparser.py',152),
+  ('for -> FOR ID = numeric_expression : numeric_expression instruction','for',7,'p_for','Mparser.py',156),
+  ('conditional -> IF ( expression ) instruction','conditional',5,'p_conditional','Mparser.py',164),
+  ('conditional -> IF ( expression ) instruction ELSE instruction','conditional',7,'p_conditional','Mparser.py',165),
+  ('assignment_lhs -> var','assignment_lhs',1,'p_assignment_lhs','Mparser.py',173),
+  ('assignment_lhs -> array_range','assignment_lhs',1,'p_assignment_lhs','Mparser.py',174),
+  ('assignment -> assignment_lhs assignment_operator expression','assignment',3,'p_assignment','Mparser.py',178),
+  ('assignment -> assignment_lhs = string','assignment',3,'p_assignment','Mparser.py',179),
+  ('assignment_operator -> =','assignment_operator',1,'p_assignment_operator','Mparser.py',183),
+  ('assignment_operator -> ADDASSIGN','assignment_operator',1,'p_assignment_operator','Mparser.py',184),
+  ('assignment_operator -> SUBASSIGN','assignment_operator',1,'p_assignment_operator','Mparser.py',185),
+  ('assignment_operator -> MULASSIGN','assignment_operator',1,'p_assignment_operator','Mparser.py',186),
+  ('assignment_operator -> DIVASSIGN','assignment_operator',1,'p_assignment_operator','Mparser.py',187),
+  ('var -> ID','var',1,'p_var','Mparser.py',195),
+  ('var -> var [ numeric_expression ]','var',4,'p_var','Mparser.py',196),
+  ('num -> INTNUM','num',1,'p_num','Mparser.py',200),
+  ('num -> FLOATNUM','num',1,'p_num','Mparser.py',201),
+  ('num -> var','num',1,'p_num','Mparser.py',202),
+  ('unary_op -> negation','unary_op',1,'p_unary_op','Mparser.py',210),
+  ('unary_op -> transposition','unary_op',1,'p_unary_op','Mparser.py',211),
+  ('negation -> - numeric_expression','negation',2,'p_neg','Mparser.py',215),
+  ("transposition -> numeric_expression '",'transposition',2,'p_transposition','Mparser.py',219),
+  ('numeric_expression -> num','numeric_expression',1,'p_numeric_expression','Mparser.py',223),
+  ('numeric_expression -> matrix','numeric_expression',1,'p_numeric_expression','Mparser.py',224),
+  ('numeric_expression -> unary_op','numeric_expression',1,'p_numeric_expression','Mparser.py',225),
+  ('numeric_expression -> fun','numeric_expression',1,'p_numeric_expression','Mparser.py',226),
+  ('numeric_expression -> ( numeric_expression )','numeric_expression',3,'p_numeric_expression','Mparser.py',227),
+  ('numeric_expression -> numeric_expression + numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',231),
+  ('numeric_expression -> numeric_expression - numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',232),
+  ('numeric_expression -> numeric_expression * numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',233),
+  ('numeric_expression -> numeric_expression / numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',234),
+  ('numeric_expression -> numeric_expression DOTADD numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',235),
+  ('numeric_expression -> numeric_expression DOTSUB numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',236),
+  ('numeric_expression -> numeric_expression DOTMUL numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',237),
+  ('numeric_expression -> numeric_expression DOTDIV numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',238),
+  ('comparison_expression -> numeric_expression < numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',246),
+  ('comparison_expression -> numeric_expression > numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',247),
+  ('comparison_expression -> numeric_expression EQ numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',248),
+  ('comparison_expression -> numeric_expression NEQ numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',249),
+  ('comparison_expression -> numeric_expression GEQ numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',250),
+  ('comparison_expression -> numeric_expression LEQ numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',251),
+  ('comparison_expression -> ( comparison_expression )','comparison_expression',3,'p_comparison_expression','Mparser.py',252),
+]
@@ -0,0 +1 @@
+../04-semantic-erros/lextab.py
\ No newline at end of file
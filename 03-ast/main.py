@@ -7,15 +7,18 @@ from TreePrinter import TreePrinter
 
 if __name__ == '__main__':
 
+    # --mmap lexes straight from a memory map of the file
+    use_mmap = '--mmap' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--mmap']
     try:
-        filename = sys.argv[1] if len(sys.argv) > 1 else "example.txt"
+        filename = args[0] if args else "example.txt"
         file = open(filename, "r")
     except IOError:
         print("Cannot open {0} file".format(filename))
         sys.exit(0)
 
     parser = Mparser.parser
-    text = file.read()
+    text = Mparser.scanner.map_file(file) if use_mmap else file.read()
     lexer = Mparser.scanner.lexer
     lexer.encountered_error = False
     ast = parser.parse(text, lexer=lexer)
@@ -0,0 +1 @@
+../04-semantic-erros/parsetab.py
\ No newline at end of file
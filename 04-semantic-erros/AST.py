@@ -1,28 +1,39 @@
 
 
 class Node(object):
-    pass
+    __slots__ = ()
 
 
 class Instructions(Node):
+    __slots__ = ('lineno', 'nodes', 'spans')
+
     def __init__(self, lineno, nodes):
         self.lineno = lineno
         self.nodes = nodes
+        """(first, last) token lexpos of every node, recorded
+        for the top-level instructions when parsing with tracking=True"""
+        self.spans = []
 
 
 class FlowKeyword(Node):
+    __slots__ = ('lineno', 'keyword')
+
     def __init__(self, lineno, keyword):
         self.lineno = lineno
         self.keyword = keyword.upper()
 
 
 class Print(Node):
+    __slots__ = ('lineno', 'arguments')
+
     def __init__(self, lineno, arguments):
         self.lineno = lineno
         self.arguments = arguments
 
 
 class Return(Node):
+    __slots__ = ('lineno', 'value')
+
     def __init__(self, lineno, value=None):
         self.lineno = lineno
         """argument may be None for return statement
@@ -31,24 +42,30 @@ class Return(Node):
 
 
 class String(Node):
+    __slots__ = ('lineno', 'value')
+
     def __init__(self, lineno, value):
         self.lineno = lineno
         self.value = value
 
 
 class Vector(Node):
+    __slots__ = ('lineno', 'elements')
+
     def __init__(self, lineno, elements):
         self.lineno = lineno
         self.elements = elements
 
 
 class Matrix(Vector):
-    pass
+    __slots__ = ()
 
 
 class Reference(Node):
     """A matrix cell reference"""
 
+    __slots__ = ('lineno', 'name', 'coords')
+
     def __init__(self, lineno, name, coords):
         self.lineno = lineno
         self.name = name
@@ -56,6 +73,8 @@ class Reference(Node):
 
 
 class FunctionCall(Node):
+    __slots__ = ('lineno', 'name', 'arguments')
+
     def __init__(self, lineno, func_name, arguments):
         self.lineno = lineno
         self.name = func_name
@@ -63,6 +82,8 @@ class FunctionCall(Node):
 
 
 class While(Node):
+    __slots__ = ('lineno', 'condition', 'body')
+
     def __init__(self, lineno, condition, body):
         self.lineno = lineno
         self.condition = condition
@@ -70,6 +91,8 @@ class While(Node):
 
 
 class For(Node):
+    __slots__ = ('lineno', 'iterator', 'range', 'body')
+
     def __init__(self, lineno, iterator, start, end, body):
         self.lineno = lineno
         self.iterator = iterator
@@ -78,6 +101,8 @@ class For(Node):
 
 
 class Range(Node):
+    __slots__ = ('lineno', 'start', 'end')
+
     def __init__(self, lineno, start, end):
         self.lineno = lineno
         self.start = start
@@ -85,12 +110,16 @@ class Range(Node):
 
 
 class Variable(Node):
+    __slots__ = ('lineno', 'name')
+
     def __init__(self, lineno, name):
         self.lineno = lineno
         self.name = name
 
 
 class If(Node):
+    __slots__ = ('lineno', 'condition', 'body', 'else_body')
+
     def __init__(self, lineno, condition, body, else_body=None):
         self.lineno = lineno
         self.condition = condition
@@ -99,6 +128,8 @@ class If(Node):
 
 
 class BinExpr(Node):
+    __slots__ = ('lineno', 'op', 'left', 'right')
+
     def __init__(self, lineno, op, left, right):
         self.lineno = lineno
         self.op = op
@@ -107,36 +138,54 @@ class BinExpr(Node):
 
 
 class ArithmeticOperation(BinExpr):
-    pass
+    __slots__ = ()
 
 
 class Assignment(BinExpr):
-    pass
+    __slots__ = ()
 
 
 class IntNum(Node):
+    __slots__ = ('lineno', 'value')
+
     def __init__(self, lineno, value):
         self.lineno = lineno
         self.value = value
 
 
 class FloatNum(Node):
+    __slots__ = ('lineno', 'value')
+
     def __init__(self, lineno, value):
         self.lineno = lineno
         self.value = value
 
 
 class UnaryExpr(Node):
+    __slots__ = ('lineno', 'operation', 'operand')
+
     def __init__(self, lineno, operation, operand):
         self.lineno = lineno
         self.operation = operation
         self.operand = operand
 
 
+class Constant(Node):
+    """A vector or matrix computed by Optimizer.ConstantFolder"""
+
+    __slots__ = ('lineno', 'value')
+
+    def __init__(self, lineno, value):
+        self.lineno = lineno
+        self.value = value
+
+
 class Comparison(BinExpr):
-    pass
+    __slots__ = ()
 
 
 class Error(Node):
+    __slots__ = ()
+
     def __init__(self):
         pass
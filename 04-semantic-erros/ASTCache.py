@@ -0,0 +1,172 @@
+#!/usr/bin/env python2
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import Arena
+
+# bumped when the layout of cache entries changes
+FORMAT_VERSION = 2
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+
+def source_version(modules):
+    """Hash of the sources of the named modules of this directory"""
+    digest = hashlib.sha1(str(FORMAT_VERSION))
+    for module in modules:
+        with open(os.path.join(here, module + '.py'), 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def grammar_version():
+    """Hash of the modules that determine the tree parsed from a text"""
+    return source_version(('scanner', 'Mparser', 'AST', 'Arena'))
+
+
+def default_directory(kind='ast'):
+    cache_home = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'agh-compilation-theory', kind)
+
+
+class ASTCache(object):
+    """Parse results stored on disk, one file per source text.
+
+    An entry holds the messages printed while parsing and the tree, if
+    there was one, as a serialized Arena; trees of AST objects are copied
+    into one to be stored, and any tree is loaded as Arena views. Entries are named after a hash
+    of the text and of grammar_version(), so any change to the lexer,
+    grammar or tree layout invalidates them. Once the entries take more
+    than max_size bytes, the least recently used ones are removed; a hit
+    refreshes the modification time of an entry to mark its use.
+
+    The cache is only an optimization: entries that cannot be read or
+    written are treated as missing.
+    """
+
+    def __init__(self, directory=None, max_size=64 * 1024 * 1024):
+        self.directory = directory or default_directory()
+        self.max_size = max_size
+        self.version = grammar_version()
+
+    def path(self, text):
+        digest = hashlib.sha1(self.version)
+        digest.update(text)
+        return os.path.join(self.directory, digest.hexdigest())
+
+    def load(self, text):
+        """Returns (messages, tree) stored for text, with the tree None if
+        parsing failed, or None if there is no entry"""
+        entry = self.read(text)
+        if entry is None:
+            return None
+        messages, tree = entry
+        return messages, self.view(tree)
+
+    def store(self, text, messages, ast):
+        """Stores the messages and the tree, an Arena view, AST nodes or
+        None, of text"""
+        self.write(text, (messages, self.tree(ast)))
+
+    @staticmethod
+    def tree(ast):
+        """The value stored for ast, an Arena view, AST nodes or None"""
+        if ast is None:
+            return None
+        if type(ast) in Arena.VIEWS:
+            return ast.index, ast.arena.dumps()
+        arena = Arena.Arena()
+        return arena.store(ast), arena.dumps()
+
+    @staticmethod
+    def view(tree):
+        """The tree stored as tree by ASTCache.tree, as an Arena view"""
+        if tree is None:
+            return None
+        root, data = tree
+        return Arena.Arena.loads(data).view(root)
+
+    def read(self, text):
+        """Returns the value stored for text, or None if there is none"""
+        path = self.path(text)
+        try:
+            with open(path, 'rb') as entry:
+                value = marshal.loads(entry.read())
+            os.utime(path, None)
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return None
+        return value
+
+    def write(self, text, value):
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            # entries are renamed into place so that readers never see
+            # partly written ones
+            handle, temporary = tempfile.mkstemp(dir=self.directory,
+                                                 suffix='.tmp')
+            with os.fdopen(handle, 'wb') as entry:
+                entry.write(marshal.dumps(value))
+            os.rename(temporary, self.path(text))
+            self.evict()
+        except (IOError, OSError):
+            pass
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            status = os.stat(os.path.join(self.directory, name))
+            entries.append((status.st_mtime, status.st_size, name))
+        size = sum(entry[1] for entry in entries)
+        for mtime, entry_size, name in sorted(entries):
+            if size <= self.max_size:
+                break
+            os.remove(os.path.join(self.directory, name))
+            size -= entry_size
+
+
+class CodeCache(ASTCache):
+    """Programs compiled by CodeGen stored on disk, one file per source
+    text, in the same way as trees in an ASTCache.
+
+    An entry holds the messages printed while parsing and checking the
+    text and, if there were no errors, the code object and line table of
+    the program, or its checked tree as in an ASTCache if CPython could not
+    compile it. As code objects are specific to a Python version, entries
+    are also named after sys.version, and after whether the programs are
+    optimized.
+    """
+
+    def __init__(self, directory=None, max_size=64 * 1024 * 1024,
+                 optimize=False):
+        super(CodeCache, self).__init__(directory or default_directory('code'),
+                                        max_size)
+        self.version = source_version((
+            'scanner', 'Mparser', 'AST', 'Arena', 'TypeChecker', 'SymbolTable',
+            'Interpreter', 'CodeGen', 'Optimizer')) + sys.version
+        if optimize:
+            self.version += ' optimized'
+
+    def load(self, text):
+        """Returns (messages, program) stored for text, the program being a
+        (code, lines) pair, a tree of Arena views or None if there were
+        errors, or None if there is no entry"""
+        entry = self.read(text)
+        if entry is None:
+            return None
+        messages, code, tree = entry
+        if tree is not None:
+            return messages, self.view(tree)
+        return messages, code
+
+    def store(self, text, messages, program):
+        """Stores the messages and the program, a (code, lines) pair, a
+        tree or None, of text"""
+        if program is None or isinstance(program, tuple):
+            self.write(text, (messages, program, None))
+        else:
+            self.write(text, (messages, None, self.tree(program)))
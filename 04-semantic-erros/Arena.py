@@ -0,0 +1,237 @@
+#!/usr/bin/env python2
+
+from array import array
+import marshal
+import AST
+
+
+# For every node class: the field kept in the value column, the fields
+# stored as single children and the field whose list of nodes follows them
+LAYOUT = [
+    (AST.Instructions, None, (), 'nodes'),
+    (AST.FlowKeyword, 'keyword', (), None),
+    (AST.Print, None, (), 'arguments'),
+    (AST.Return, None, ('value',), None),
+    (AST.String, 'value', (), None),
+    (AST.Vector, None, (), 'elements'),
+    (AST.Matrix, None, (), 'elements'),
+    (AST.Reference, None, ('name',), 'coords'),
+    (AST.FunctionCall, 'name', (), 'arguments'),
+    (AST.While, None, ('condition', 'body'), None),
+    (AST.For, None, ('iterator', 'range', 'body'), None),
+    (AST.Range, None, ('start', 'end'), None),
+    (AST.Variable, 'name', (), None),
+    (AST.If, None, ('condition', 'body', 'else_body'), None),
+    (AST.BinExpr, 'op', ('left', 'right'), None),
+    (AST.ArithmeticOperation, 'op', ('left', 'right'), None),
+    (AST.Assignment, 'op', ('left', 'right'), None),
+    (AST.Comparison, 'op', ('left', 'right'), None),
+    (AST.IntNum, 'value', (), None),
+    (AST.FloatNum, 'value', (), None),
+    (AST.UnaryExpr, 'operation', ('operand',), None),
+    (AST.Error, None, (), None),
+]
+
+# marks a missing optional child, such as an If without else
+NONE = -1
+
+
+class PendingInstructions(object):
+    """Instruction list still being extended by the parser; it is stored
+    in the arena once it is used as a child or the parse is finished"""
+
+    __slots__ = ('lineno', 'nodes', 'spans')
+
+    def __init__(self, lineno, nodes):
+        self.lineno = lineno
+        self.nodes = nodes
+        self.spans = []
+
+
+class Arena(object):
+    """AST stored in parallel arrays instead of one object per node.
+
+    Node i has kind[i] (its position in LAYOUT), lineno[i], value[i] (an
+    index into pool, or NONE) and child_count[i] children, stored at
+    children[child_start[i]:child_start[i] + child_count[i]].
+
+    An Arena is used as the parser's node builder: it has a method named
+    after every AST class taking the same arguments as its constructor and
+    returning the index of the new node. view() wraps a node index in an
+    object behaving like the corresponding AST node.
+    """
+
+    def __init__(self):
+        self.kind = array('B')
+        self.lineno = array('i')
+        self.value = array('i')
+        self.child_start = array('i')
+        self.child_count = array('i')
+        self.children = array('i')
+        self.pool = []
+        self.pool_index = {}
+
+    def __len__(self):
+        return len(self.kind)
+
+    def intern(self, value):
+        # type is part of the key so that 1 and 1.0 stay apart
+        key = (type(value), value)
+        index = self.pool_index.get(key)
+        if index is None:
+            index = self.pool_index[key] = len(self.pool)
+            self.pool.append(value)
+        return index
+
+    def ref(self, child):
+        if child is None:
+            return NONE
+        if isinstance(child, PendingInstructions):
+            return self.add(INSTRUCTIONS_KIND, child.lineno, None, child.nodes)
+        if isinstance(child, int):
+            return child
+        # error tokens left by syntax error recovery
+        return self.add(ERROR_KIND, 0, None, [])
+
+    def add(self, kind, lineno, value, children):
+        children = [self.ref(child) for child in children]
+        self.kind.append(kind)
+        self.lineno.append(lineno)
+        self.value.append(NONE if value is None else self.intern(value))
+        self.child_start.append(len(self.children))
+        self.child_count.append(len(children))
+        self.children.extend(children)
+        return len(self.kind) - 1
+
+    def finish(self, root):
+        """Stores the root returned by the parser, returns its index"""
+        return self.ref(root)
+
+    def store(self, root):
+        """Copies the tree of AST nodes under root, returns the index of
+        root. Nodes are added children first, from an explicit stack, as
+        the trees of long expressions are deeper than the recursion limit."""
+        order, stack = [], [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if type(node) in KINDS:
+                stack.extend(node_children(node))
+        indices = {}
+        for node in reversed(order):
+            if node is None:
+                continue
+            if type(node) not in KINDS:
+                # error tokens left by syntax error recovery
+                indices[id(node)] = self.ref(node)
+                continue
+            kind = KINDS[type(node)]
+            value_field = LAYOUT[kind][1]
+            indices[id(node)] = self.add(
+                kind, getattr(node, 'lineno', 0),
+                getattr(node, value_field) if value_field else None,
+                [NONE if child is None else indices[id(child)]
+                 for child in node_children(node)])
+        return NONE if root is None else indices[id(root)]
+
+    def columns(self):
+        return (self.kind, self.lineno, self.value, self.child_start,
+                self.child_count, self.children)
+
+    def nbytes(self):
+        return sum(column.itemsize * len(column) for column in self.columns())
+
+    def dumps(self):
+        """Serializes the nodes to a string for loads"""
+        return marshal.dumps(([column.tostring() for column in self.columns()],
+                              self.pool))
+
+    @classmethod
+    def loads(cls, data):
+        """Arena with the nodes serialized by dumps"""
+        arena = cls()
+        columns, arena.pool = marshal.loads(data)
+        for column, data in zip(arena.columns(), columns):
+            column.fromstring(data)
+        return arena
+
+    def view(self, index):
+        if index == NONE:
+            return None
+        node = VIEWS[self.kind[index]].__new__(VIEWS[self.kind[index]])
+        node.arena = self
+        node.index = index
+        return node
+
+    # builders with arguments that differ from the generic layout
+
+    def Instructions(self, lineno, nodes):
+        return PendingInstructions(lineno, nodes)
+
+    def FlowKeyword(self, lineno, keyword):
+        return self.add(KINDS[AST.FlowKeyword], lineno, keyword.upper(), [])
+
+    def For(self, lineno, iterator, start, end, body):
+        node_range = self.add(KINDS[AST.Range], lineno, None, [start, end])
+        return self.add(KINDS[AST.For], lineno, None, [iterator, node_range, body])
+
+
+KINDS = dict((layout[0], kind) for kind, layout in enumerate(LAYOUT))
+INSTRUCTIONS_KIND = KINDS[AST.Instructions]
+ERROR_KIND = KINDS[AST.Error]
+
+
+def node_children(node):
+    """The children of an AST node in the order an arena stores them"""
+    _, _, fields, list_field = LAYOUT[KINDS[type(node)]]
+    children = [getattr(node, field) for field in fields]
+    if list_field:
+        children.extend(getattr(node, list_field))
+    return children
+
+
+def make_builder(kind, value_field, fields, list_field):
+
+    def build(self, lineno, *args):
+        args = list(args)
+        value = args.pop(0) if value_field else None
+        args += [None] * (len(fields) + bool(list_field) - len(args))
+        children = args[:len(fields)]
+        if list_field:
+            children.extend(args[len(fields)])
+        return self.add(kind, lineno, value, children)
+    return build
+
+
+def make_view(cls, value_field, fields, list_field):
+    attributes = {
+        '__slots__': ('arena', 'index'),
+        'lineno': property(lambda self: self.arena.lineno[self.index]),
+    }
+    if value_field:
+        attributes[value_field] = property(
+            lambda self: self.arena.pool[self.arena.value[self.index]])
+    for position, field in enumerate(fields):
+        attributes[field] = property(
+            lambda self, position=position: self.arena.view(
+                self.arena.children[self.arena.child_start[self.index] + position]))
+    if list_field:
+        def elements(self):
+            arena = self.arena
+            start = arena.child_start[self.index]
+            end = start + arena.child_count[self.index]
+            return [arena.view(child)
+                    for child in arena.children[start + len(fields):end]]
+        attributes[list_field] = property(elements)
+    if cls is AST.Instructions:
+        attributes['spans'] = property(lambda self: [])
+    # views keep the class name, which the visitors dispatch on
+    return type(cls.__name__, (cls,), attributes)
+
+
+VIEWS = []
+for kind, (cls, value_field, fields, list_field) in enumerate(LAYOUT):
+    if not hasattr(Arena, cls.__name__):
+        setattr(Arena, cls.__name__,
+                make_builder(kind, value_field, fields, list_field))
+    VIEWS.append(make_view(cls, value_field, fields, list_field))
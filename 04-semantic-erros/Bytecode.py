@@ -0,0 +1,273 @@
+#!/usr/bin/env python2
+"""Compilation of checked programs to bytecode for VM.VM.
+
+A Code is a flat array of instructions, each an opcode followed by one
+argument, with the constant pool and the variable names the arguments
+refer to. Every variable name has a slot, and jumps take the offset of
+their target in the array. Instructions work on a stack of values:
+
+    LOAD_CONST k      push constant k
+    LOAD s            push the value of slot s, which must be set
+    STORE s           pop a value into slot s
+    COPY              copy the array on top, the value of a variable
+    COPY_VIEW         copy the array on top if it is a view of another
+    BINARY i          apply operator i to the two values on top
+    AUGMENT i         apply compound assignment i, in place if possible
+    NEGATE            negate the value on top
+    TRANSPOSE         transpose the value on top, as a view
+    BUILD_VECTOR n    pop n values into an array
+    CALL n            pop n sizes and a function name and allocate
+    INDEX n           pop n coords and index the array below them
+    LOAD_ITEM n       push the item at the n coords and array on top
+    STORE_ITEM n      pop a value, n coords and an array, set the item
+    JUMP t            continue at t
+    JUMP_IF_FALSE t   pop a condition, continue at t if it is false
+    RANGE             replace the start and end on top by ints
+    FOR_NEXT t        push the next value of the range on top and advance
+                      it, or pop the range and continue at t if it is done
+    POP n             pop n values
+    PRINT n           pop and print n values
+    RETURN            pop a value and stop with it
+"""
+
+from array import array
+import AST
+import Interpreter
+from TypeChecker import NodeVisitor
+
+OPNAMES = ('LOAD_CONST', 'LOAD', 'STORE', 'COPY', 'COPY_VIEW', 'BINARY',
+           'AUGMENT', 'NEGATE', 'TRANSPOSE', 'BUILD_VECTOR', 'CALL', 'INDEX',
+           'LOAD_ITEM', 'STORE_ITEM', 'JUMP', 'JUMP_IF_FALSE', 'RANGE',
+           'FOR_NEXT', 'POP', 'PRINT', 'RETURN')
+
+(LOAD_CONST, LOAD, STORE, COPY, COPY_VIEW, BINARY,
+ AUGMENT, NEGATE, TRANSPOSE, BUILD_VECTOR, CALL, INDEX,
+ LOAD_ITEM, STORE_ITEM, JUMP, JUMP_IF_FALSE, RANGE,
+ FOR_NEXT, POP, PRINT, RETURN) = range(len(OPNAMES))
+
+# arguments of BINARY and AUGMENT
+OPERATORS = tuple(sorted(Interpreter.operations))
+AUGMENTS = tuple(sorted(Interpreter.in_place_operations))
+OPERATOR_IDS = dict((op, index) for index, op in enumerate(OPERATORS))
+AUGMENT_IDS = dict((op, index) for index, op in enumerate(AUGMENTS))
+
+
+class Code(object):
+
+    def __init__(self):
+        # opcode, argument, opcode, argument, ...
+        self.code = array('i')
+        self.consts = []
+        # variable name of every slot
+        self.names = []
+        # line of the statement of every instruction
+        self.lines = array('i')
+
+    def disassemble(self):
+        """Returns a listing of the instructions, one per line"""
+        lines = []
+        for pc in range(0, len(self.code), 2):
+            op, arg = self.code[pc], self.code[pc + 1]
+            if op == LOAD_CONST:
+                detail = repr(self.consts[arg])
+            elif op in (LOAD, STORE):
+                detail = self.names[arg]
+            elif op == BINARY:
+                detail = OPERATORS[arg]
+            elif op == AUGMENT:
+                detail = AUGMENTS[arg]
+            else:
+                detail = ''
+            lines.append("{:>6} {:>4} {:<14} {:>6} {}".format(
+                self.lines[pc // 2], pc, OPNAMES[op], arg, detail))
+        return '\n'.join(lines)
+
+
+class BytecodeCompiler(NodeVisitor):
+    """Compiles checked programs to a Code, with the semantics of
+    Interpreter.Interpreter"""
+
+    def __init__(self):
+        super(BytecodeCompiler, self).__init__()
+        self.code = Code()
+        # name -> slot
+        self.slots = {}
+        # (type, value) -> index in the constant pool
+        self.constants = {}
+        # (continue target, offsets of the jumps of its breaks) of the
+        # loops being compiled, innermost last
+        self.loops = []
+        self.lineno = 0
+
+    def compile(self, ast):
+        self.visit(ast)
+        self.emit(LOAD_CONST, self.const(None))
+        self.emit(RETURN)
+        return self.code
+
+    def emit(self, op, arg=0):
+        """Appends an instruction, returns its offset"""
+        self.code.code.append(op)
+        self.code.code.append(arg)
+        self.code.lines.append(self.lineno)
+        return len(self.code.code) - 2
+
+    def here(self):
+        return len(self.code.code)
+
+    def patch(self, offset, target):
+        self.code.code[offset + 1] = target
+
+    def const(self, value):
+        # repr tells 0.0 from -0.0, which folded constants may be
+        key = (type(value), repr(value))
+        index = self.constants.get(key)
+        if index is None:
+            index = self.constants[key] = len(self.code.consts)
+            self.code.consts.append(value)
+        return index
+
+    def slot(self, name):
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = len(self.code.names)
+            self.code.names.append(name)
+        return slot
+
+    def exit_loop(self, break_target):
+        _, breaks = self.loops.pop()
+        for offset in breaks:
+            self.patch(offset, break_target)
+
+    def visit_Instructions(self, node):
+        for n in node.nodes:
+            self.lineno = n.lineno
+            yield n
+
+    def visit_FlowKeyword(self, node):
+        if node.keyword == 'BREAK':
+            self.loops[-1][1].append(self.emit(JUMP))
+        else:
+            self.emit(JUMP, self.loops[-1][0])
+
+    def visit_Print(self, node):
+        for argument in node.arguments:
+            yield argument
+        self.emit(PRINT, len(node.arguments))
+
+    def visit_Return(self, node):
+        if node.value is None:
+            self.emit(LOAD_CONST, self.const(None))
+        else:
+            yield node.value
+        self.emit(RETURN)
+
+    def visit_String(self, node):
+        self.emit(LOAD_CONST, self.const(node.value[1:-1]))
+
+    def visit_Vector(self, node):
+        for element in node.elements:
+            yield element
+        self.emit(BUILD_VECTOR, len(node.elements))
+
+    def visit_Reference(self, node):
+        yield node.name
+        for coord in node.coords:
+            yield coord
+        self.emit(INDEX, len(node.coords))
+
+    def visit_FunctionCall(self, node):
+        self.emit(LOAD_CONST, self.const(node.name))
+        for argument in node.arguments:
+            yield argument
+        self.emit(CALL, len(node.arguments))
+
+    def visit_While(self, node):
+        self.loops.append((self.here(), []))
+        yield node.condition
+        test = self.emit(JUMP_IF_FALSE)
+        yield node.body
+        self.emit(JUMP, self.loops[-1][0])
+        self.patch(test, self.here())
+        self.exit_loop(self.here())
+
+    def visit_For(self, node):
+        yield node.range.start
+        yield node.range.end
+        self.emit(RANGE)
+        iterator = self.slot(node.iterator.name)
+        self.loops.append((self.here(), []))
+        step = self.emit(FOR_NEXT)
+        self.emit(STORE, iterator)
+        yield node.body
+        self.emit(JUMP, step)
+        # a break leaves the range on the stack
+        self.exit_loop(self.emit(POP, 2))
+        self.patch(step, self.here())
+
+    def visit_If(self, node):
+        yield node.condition
+        test = self.emit(JUMP_IF_FALSE)
+        yield node.body
+        if node.else_body is not None:
+            skip = self.emit(JUMP)
+            self.patch(test, self.here())
+            yield node.else_body
+            self.patch(skip, self.here())
+        else:
+            self.patch(test, self.here())
+
+    def visit_Variable(self, node):
+        self.emit(LOAD, self.slot(node.name))
+
+    def visit_BinExpr(self, node):
+        yield node.left
+        yield node.right
+        self.emit(BINARY, OPERATOR_IDS[node.op])
+
+    def visit_Assignment(self, node):
+        target, op = node.left, node.op
+        if isinstance(target, AST.Reference):
+            yield target.name
+            for coord in target.coords:
+                yield coord
+            if op != '=':
+                self.emit(LOAD_ITEM, len(target.coords))
+            yield node.right
+            if op != '=':
+                self.emit(BINARY, OPERATOR_IDS[op[:-1]])
+            self.emit(STORE_ITEM, len(target.coords))
+            return
+        slot = self.slot(target.name)
+        if op == '=':
+            yield node.right
+            # only variables, references and transpositions give arrays
+            # that other variables may share
+            if isinstance(node.right, AST.Variable):
+                self.emit(COPY)
+            elif isinstance(node.right, (AST.Reference, AST.UnaryExpr)):
+                self.emit(COPY_VIEW)
+        else:
+            self.emit(LOAD, slot)
+            yield node.right
+            self.emit(AUGMENT, AUGMENT_IDS[op])
+        self.emit(STORE, slot)
+
+    def visit_IntNum(self, node):
+        self.emit(LOAD_CONST, self.const(node.value))
+
+    def visit_FloatNum(self, node):
+        self.emit(LOAD_CONST, self.const(node.value))
+
+    def visit_Constant(self, node):
+        # arrays are not hashable, and each use copies the array anyway
+        self.emit(LOAD_CONST, len(self.code.consts))
+        self.code.consts.append(node.value)
+        self.emit(COPY)
+
+    def visit_UnaryExpr(self, node):
+        yield node.operand
+        self.emit(NEGATE if node.operation == 'NEGATE' else TRANSPOSE)
+
+    def visit_Error(self, node):
+        pass
@@ -0,0 +1,402 @@
+#!/usr/bin/env python2
+"""Translation of checked programs to Python source, compiled to a code
+object so that CPython's own bytecode loop runs them.
+
+A program becomes one function whose locals are its variables, named with
+a v_ prefix so that they clash neither with Python keywords nor with the
+runtime helpers and temporaries, which start with an underscore. For loops
+become loops over xrange and operations on arrays NumPy calls, with the
+helpers of Interpreter where the meaning of an operator depends on the
+values: the product of two matrices, transposition, compound assignment
+and the truth of a condition.
+
+The expressions of a statement that nest deeper than MAX_DEPTH are
+translated one operation per line, each value going to a temporary _sN in
+the order the interpreter evaluates it, so that no line nests deeper than
+CPython can compile and long sums do not exhaust the C stack of its
+compiler.
+"""
+
+from __future__ import print_function
+import math
+import re
+import sys
+import numpy as np
+import AST
+import Interpreter
+from Optimizer import STATEMENTS, children
+from TypeChecker import NodeVisitor
+
+# file name of the code objects, to find their frames in tracebacks
+FILENAME = '<program>'
+
+PREFIX = 'v_'
+
+# deepest expression translated in one line: the parser of CPython
+# overflows its stack at about 90 nested brackets, printing to stderr, and a
+# node opens at most two of them
+MAX_DEPTH = 40
+
+# names the generated source refers to besides its variables
+RUNTIME = {
+    '_np': np,
+    '_ndarray': np.ndarray,
+    '_allocate': Interpreter.allocate,
+    '_augment': Interpreter.augment,
+    '_multiply': Interpreter.multiply,
+    '_truth': Interpreter.truth,
+}
+
+# operators that are Python operators on all the values they apply to
+OPERATORS = {
+    '+': '+', '-': '-', '/': '/',
+    '.+': '+', '.-': '-', '.*': '*', './': '/',
+    '<': '<', '>': '>', '==': '==', '!=': '!=', '<=': '<=', '>=': '>=',
+}
+
+UNDEFINED = re.compile(r"'{}(\w+)'".format(PREFIX))
+
+
+def _copy(value):
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return value
+
+
+def _copy_view(value):
+    if isinstance(value, np.ndarray) and value.base is not None:
+        return value.copy()
+    return value
+
+
+def _transpose(value):
+    if isinstance(value, np.ndarray):
+        return value.T
+    return value
+
+
+RUNTIME.update(_copy=_copy, _copy_view=_copy_view, _transpose=_transpose)
+
+
+def local(name):
+    """Name of the local of the variable name; those of the variables added
+    by Optimizer.LoopOptimizer start with $"""
+    if name.startswith('$'):
+        return '_' + name[1:]
+    return PREFIX + name
+
+
+def depth(statement):
+    """Depth of the most deeply nested expression of statement, leaving out
+    the statements of its body"""
+    deepest = 0
+    stack = [(child, 1) for child in children(statement)
+             if not isinstance(child, STATEMENTS + (AST.Instructions,))]
+    while stack:
+        node, level = stack.pop()
+        deepest = max(deepest, level)
+        stack.extend((child, level + 1) for child in children(node))
+    return deepest
+
+
+def literal(node):
+    return isinstance(node, (AST.IntNum, AST.FloatNum))
+
+
+def coordinate(node, source):
+    """Source of the int of the coordinate node"""
+    if isinstance(node, AST.IntNum):
+        return source
+    return 'int({})'.format(source)
+
+
+def index(coords):
+    """Source of the tuple of coords, without parentheses"""
+    return ', '.join(coords) + (',' if len(coords) == 1 else '')
+
+
+class Program(object):
+    """A program translated by CodeGenerator: the code object of its module
+    and the line of the statement of every line of its source"""
+
+    def __init__(self, code, lines):
+        self.code = code
+        self.lines = lines
+
+    def run(self):
+        """Runs the program and returns the value of its return statement,
+        or None if it has none or stops on an error"""
+        namespace = dict(RUNTIME)
+        exec(self.code, namespace)
+        try:
+            return namespace['program']()
+        except NameError as e:
+            match = UNDEFINED.search(str(e))
+            if match is None:
+                raise
+            message = "undefined variable {}".format(match.group(1))
+        except (ArithmeticError, IndexError, ValueError) as e:
+            message = e
+        print("Runtime error in line {}: {}".format(self.lineno(sys.exc_info()[2]), message))
+        return None
+
+    def lineno(self, traceback):
+        """Line of the statement of the innermost frame of the program"""
+        line = None
+        while traceback is not None:
+            if traceback.tb_frame.f_code.co_filename == FILENAME:
+                line = traceback.tb_lineno
+            traceback = traceback.tb_next
+        return self.lines[line - 1]
+
+
+class CodeGenerator(NodeVisitor):
+    """Translates checked programs to Python source with the semantics of
+    Interpreter.Interpreter. Expressions are visited for their source,
+    statements append lines to the function being generated."""
+
+    def __init__(self):
+        super(CodeGenerator, self).__init__()
+        # [indent, text, line of the statement]
+        self.code = []
+        self.indent = 1
+        # sources of the arrays of Constant nodes, made once per run
+        self.constants = []
+        self.lineno = 0
+        # whether the statement being translated goes one operation per
+        # line, and the number of temporaries it has used
+        self.spill = False
+        self.temporaries = 0
+
+    def generate(self, ast):
+        """Returns the source of a module defining the function program,
+        and the line of the statement of every line of the source"""
+        self.visit(ast)
+        self.emit('return None')
+        source = ['from __future__ import division, print_function']
+        for index, array in enumerate(self.constants):
+            source.append('_k{} = {}'.format(index, array))
+        source.append('def program():')
+        lines = [0] * len(source)
+        for indent, text, lineno in self.code:
+            source.append('    ' * indent + text)
+            lines.append(lineno)
+        return '\n'.join(source) + '\n', lines
+
+    def translate(self, ast):
+        """Returns the Program of ast, or None if CPython cannot compile its
+        source, as for blocks nested too deeply"""
+        source, lines = self.generate(ast)
+        try:
+            code = compile(source, FILENAME, 'exec')
+        except (MemoryError, SyntaxError, RuntimeError):
+            # indentation and nested loops are limited with a SyntaxError,
+            # and recursion with a RuntimeError; the parser stack could still
+            # overflow with a MemoryError
+            return None
+        return Program(code, lines)
+
+    def emit(self, text):
+        """Appends a line, returns its index"""
+        self.code.append([self.indent, text, self.lineno])
+        return len(self.code) - 1
+
+    def statement(self, node):
+        """Starts the translation of the expressions of statement node"""
+        self.spill = depth(node) > MAX_DEPTH
+        self.temporaries = 0
+
+    def value(self, source):
+        """Source of the value of source where it is used: source itself,
+        or a temporary assigned it when the statement is spilled"""
+        if not self.spill:
+            return source
+        name = '_s{}'.format(self.temporaries)
+        self.temporaries += 1
+        self.emit('{} = {}'.format(name, source))
+        return name
+
+    def visit_Instructions(self, node):
+        if not node.nodes:
+            # the optimizer may empty a block
+            self.emit('pass')
+        for n in node.nodes:
+            self.lineno = n.lineno
+            yield n
+
+    def visit_FlowKeyword(self, node):
+        self.emit('break' if node.keyword == 'BREAK' else 'continue')
+
+    def visit_Print(self, node):
+        self.statement(node)
+        values = []
+        for argument in node.arguments:
+            values.append((yield argument))
+        self.emit('print({})'.format(', '.join(values)))
+
+    def visit_Return(self, node):
+        self.statement(node)
+        if node.value is None:
+            self.emit('return None')
+        else:
+            self.emit('return {}'.format((yield node.value)))
+
+    def visit_String(self, node):
+        return repr(node.value[1:-1])
+
+    def visit_Vector(self, node):
+        elements = []
+        for element in node.elements:
+            elements.append((yield element))
+        yield self.value('_np.array([{}], dtype=float)'.format(', '.join(elements)))
+
+    def visit_Reference(self, node):
+        name = yield node.name
+        coords = []
+        for coord in node.coords:
+            value = yield coord
+            coords.append(self.value(coordinate(coord, value)))
+        yield self.value('{}[{}]'.format(name, index(coords)))
+
+    def visit_FunctionCall(self, node):
+        name = node.name.lower()
+        literal_shape = name in Interpreter.functions and all(
+            isinstance(argument, AST.IntNum) for argument in node.arguments)
+        arguments = []
+        for argument in node.arguments:
+            source = yield argument
+            if not literal_shape:
+                source = self.value(coordinate(argument, source))
+            arguments.append(source)
+        if literal_shape:
+            if len(arguments) == 1:
+                arguments *= 2
+            if name == 'eye':
+                yield '_np.eye({})'.format(', '.join(arguments))
+            else:
+                yield '_np.{}(({}))'.format(name, ', '.join(arguments))
+        else:
+            yield self.value('_allocate({!r}, [{}])'.format(
+                node.name, ', '.join(arguments)))
+
+    def visit_While(self, node):
+        self.statement(node)
+        if not self.spill:
+            self.emit('while _truth({}):'.format((yield node.condition)))
+            self.indent += 1
+            yield node.body
+            self.indent -= 1
+            return
+        # the lines of the condition run before every iteration
+        self.emit('while True:')
+        self.indent += 1
+        self.emit('if not _truth({}):'.format((yield node.condition)))
+        self.indent += 1
+        self.emit('break')
+        self.indent -= 1
+        yield node.body
+        self.indent -= 1
+
+    def visit_For(self, node):
+        self.statement(node)
+        start = yield node.range.start
+        start = self.value(coordinate(node.range.start, start))
+        end = yield node.range.end
+        if isinstance(node.range.end, AST.IntNum):
+            end = str(node.range.end.value + 1)
+        else:
+            end = 'int({}) + 1'.format(end)
+        # the iterator keeps its last value after the loop, as in Python
+        self.emit('for {} in xrange({}, {}):'.format(local(node.iterator.name), start, end))
+        self.indent += 1
+        yield node.body
+        self.indent -= 1
+
+    def visit_If(self, node):
+        self.statement(node)
+        self.emit('if _truth({}):'.format((yield node.condition)))
+        self.indent += 1
+        yield node.body
+        if node.else_body is not None:
+            self.indent -= 1
+            self.emit('else:')
+            self.indent += 1
+            yield node.else_body
+        self.indent -= 1
+
+    def visit_Variable(self, node):
+        # spilled, as reading an undefined variable fails
+        return self.value(local(node.name))
+
+    def visit_BinExpr(self, node):
+        left = yield node.left
+        right = yield node.right
+        op = OPERATORS.get(node.op)
+        if op is not None:
+            yield self.value('({} {} {})'.format(left, op, right))
+        elif literal(node.left) or literal(node.right):
+            # a number times anything is elementwise
+            yield self.value('({} * {})'.format(left, right))
+        else:
+            yield self.value('_multiply({}, {})'.format(left, right))
+
+    def visit_Assignment(self, node):
+        # the target is evaluated before the value, as by the interpreter
+        self.statement(node)
+        target, op = node.left, node.op
+        if isinstance(target, AST.Reference):
+            self.emit('_a = {}'.format((yield target.name)))
+            coords = []
+            for coord in target.coords:
+                value = yield coord
+                coords.append(self.value(coordinate(coord, value)))
+            self.emit('_c = ({})'.format(index(coords)))
+            value = yield node.right
+            if op == '=':
+                self.emit('_a[_c] = {}'.format(value))
+            elif op == '*=':
+                self.emit('_a[_c] = _multiply(_a[_c], {})'.format(value))
+            else:
+                self.emit('_a[_c] = _a[_c] {} {}'.format(op[:-1], value))
+            return
+        name = local(target.name)
+        value = yield node.right
+        if op == '=':
+            # only variables, references and transpositions give arrays
+            # that other variables may share
+            if isinstance(node.right, AST.Variable):
+                value = '_copy({})'.format(value)
+            elif isinstance(node.right, (AST.Reference, AST.UnaryExpr)):
+                value = '_copy_view({})'.format(value)
+            self.emit('{} = {}'.format(name, value))
+        else:
+            # when the variable is not an array, its old value is a number
+            # and the operator is a Python operator
+            self.emit('{0} = ({0} {1} {2}) if {0}.__class__ is not _ndarray '
+                      'else _augment({3!r}, {0}, {2})'.format(name, op[:-1], value, op))
+
+    def visit_IntNum(self, node):
+        return repr(node.value)
+
+    def visit_FloatNum(self, node):
+        if math.isinf(node.value) or math.isnan(node.value):
+            return "float('{!r}')".format(node.value)
+        return repr(node.value)
+
+    def visit_Constant(self, node):
+        value = node.value
+        array = '_np.array({!r}, dtype=float)'.format(value.tolist())
+        if not value.size:
+            array += '.reshape({!r})'.format(value.shape)
+        self.constants.append(array)
+        return '_k{}.copy()'.format(len(self.constants) - 1)
+
+    def visit_UnaryExpr(self, node):
+        operand = yield node.operand
+        if node.operation == 'NEGATE':
+            yield self.value('(-{})'.format(operand))
+        else:
+            yield self.value('_transpose({})'.format(operand))
+
+    def visit_Error(self, node):
+        self.emit('pass')
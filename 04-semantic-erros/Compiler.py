@@ -0,0 +1,270 @@
+#!/usr/bin/env python2
+
+from copy import copy
+import sys
+import Arena
+import AST
+import FastLexer
+import Interner
+import Mparser
+import TreePrinter  # adds printTree to the AST classes
+from TypeChecker import TypeChecker
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+class Compiler(object):
+    """Parsing and checking session with its own lexer and parser state.
+
+    The lexer is cloned and the parser shallow-copied from the module-level
+    instances, so the tables are shared while line counters, parser stacks
+    and error flags are not. One Compiler can process any number of files
+    in turn; threads need one Compiler each.
+
+    With an ASTCache, compile looks the text up in the cache before parsing
+    it. Texts are parsed as without one, and trees loaded from the cache
+    are Arena views.
+
+    With optimize set, programs are run after the passes of Optimizer.
+    """
+
+    def __init__(self, arena=False, fast_lexer=False, cache=None,
+                 share=False, optimize=False):
+        if fast_lexer:
+            self.lexer = FastLexer.FastLexer()
+        else:
+            self.lexer = Mparser.scanner.lexer.clone()
+        self.parser = copy(Mparser.parser)
+        self.cache = cache
+        # store trees in an Arena.Arena rather than as AST objects
+        self.arena = arena
+        # share repeated subtrees with an Interner.Interner, unless trees
+        # are kept in an Arena
+        self.share = share
+        # check results of the shared subtrees of the last tree
+        self.results = None
+        self.optimize = optimize
+        # nodes eliminated by the optimizer from the last program run, and
+        # the other transformations it applied, one line each
+        self.eliminated = None
+        self.transformations = None
+
+    def parse(self, text, lineno=1):
+        """Returns the AST of text or None if there were syntax errors"""
+        self.lexer.lineno = lineno
+        return self.run_parser(self.lexer, text)
+
+    def parse_tokens(self, reader):
+        """Like parse, for the tokens of a TokenStream.TokenReader"""
+        reader.rewind()
+        return self.run_parser(reader, None)
+
+    def parse_cached(self, text):
+        """Like parse, through the cache; the messages printed by the lexer
+        and the parser are stored with the tree and printed on a hit"""
+        entry = self.cache.load(text)
+        if entry is not None:
+            messages, ast = entry
+            sys.stdout.write(messages)
+            return ast
+        stdout, sys.stdout = sys.stdout, StringIO()
+        try:
+            ast = self.parse(text)
+            messages = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+        sys.stdout.write(messages)
+        self.cache.store(text, messages, ast)
+        return ast
+
+    def run_parser(self, lexer, text):
+        lexer.encountered_error = False
+        self.results = None
+        if self.arena:
+            self.parser.builder = Arena.Arena()
+        elif self.share:
+            self.parser.builder = Interner.Interner()
+            self.results = self.parser.builder.results
+        ast = self.parser.parse(text, lexer=lexer, tracking=True)
+        if lexer.encountered_error:
+            return None
+        if self.arena and ast is not None:
+            builder = self.parser.builder
+            return builder.view(builder.finish(ast))
+        return ast
+
+    def check(self, ast):
+        """Type checks ast, returns the number of errors reported"""
+        checker = TypeChecker(self.results)
+        checker.visit(ast)
+        return checker.errors
+
+    def optimized(self, ast):
+        """Returns the checked program ast, optimized if the compiler
+        optimizes"""
+        if not self.optimize:
+            return ast
+        from Optimizer import ConstantFolder, DeadCodeEliminator, LoopOptimizer
+        folder = ConstantFolder()
+        ast = folder.fold(ast)
+        eliminator = DeadCodeEliminator()
+        ast = eliminator.eliminate(ast)
+        optimizer = LoopOptimizer()
+        ast = optimizer.optimize(ast)
+        self.eliminated = folder.eliminated
+        self.transformations = eliminator.transformations + optimizer.transformations
+        return ast
+
+    def compile(self, text, print_tree=True):
+        if self.cache is not None:
+            return self.report(self.parse_cached(text), print_tree)
+        return self.report(self.parse(text), print_tree)
+
+    def run(self, text, vm=False):
+        """Parses and checks text and, if there were no errors, interprets
+        it, or compiles it to bytecode and runs it on a VM.VM if vm is set;
+        returns the value of its return statement"""
+        # NumPy is only needed to run programs
+        from Interpreter import Interpreter
+        if self.cache is not None:
+            ast = self.parse_cached(text)
+        else:
+            ast = self.parse(text)
+        if ast is None or self.check(ast):
+            return None
+        ast = self.optimized(ast)
+        if vm:
+            from Bytecode import BytecodeCompiler
+            from VM import VM
+            return VM().run(BytecodeCompiler().compile(ast))
+        return Interpreter().run(ast)
+
+    def translate(self, text):
+        """Parses and checks text and, if there were no errors, returns it
+        translated to a CodeGen.Program, or compiled to a Bytecode.Code if
+        CPython cannot compile its translation"""
+        ast = self.parse(text)
+        if ast is None or self.check(ast):
+            return None
+        return self.translate_checked(ast)
+
+    def translate_checked(self, ast):
+        """Like translate, for the tree of a checked program"""
+        from CodeGen import CodeGenerator
+        ast = self.optimized(ast)
+        program = CodeGenerator().translate(ast)
+        if program is None:
+            return self.compile_bytecode(ast)
+        return program
+
+    def compile_bytecode(self, ast):
+        from Bytecode import BytecodeCompiler
+        return BytecodeCompiler().compile(ast)
+
+    def run_python(self, text, cache=None):
+        """Like run, with the program translated to Python by CodeGen and
+        run by CPython, or run on a VM.VM when it cannot be. With an
+        ASTCache.CodeCache, the messages and code object of a text are
+        stored, and a text run before is neither parsed, checked nor
+        translated again; for a program run on a VM.VM, the checked tree is
+        stored instead of the code, and only compiled to bytecode again."""
+        from CodeGen import Program
+        if cache is None:
+            return self.execute(self.translate(text))
+        entry = cache.load(text)
+        if entry is None:
+            stdout, sys.stdout = sys.stdout, StringIO()
+            try:
+                ast = self.parse(text)
+                if ast is not None and self.check(ast):
+                    ast = None
+                messages = sys.stdout.getvalue()
+            finally:
+                sys.stdout = stdout
+            sys.stdout.write(messages)
+            if ast is None:
+                cache.store(text, messages, None)
+                return None
+            program = self.translate_checked(ast)
+            # bytecode is not stored, as the constants of optimized
+            # programs are arrays, which marshal cannot store; the passes
+            # build new nodes, so ast is still the checked tree
+            if isinstance(program, Program):
+                cache.store(text, messages, (program.code, program.lines))
+            else:
+                cache.store(text, messages, ast)
+            return self.execute(program)
+        messages, program = entry
+        sys.stdout.write(messages)
+        if isinstance(program, tuple):
+            program = Program(*program)
+        elif program is not None:
+            program = self.compile_bytecode(self.optimized(program))
+        return self.execute(program)
+
+    def execute(self, program):
+        """Runs a program returned by translate, returns the value of its
+        return statement"""
+        from CodeGen import Program
+        if program is None:
+            return None
+        if isinstance(program, Program):
+            return program.run()
+        from VM import VM
+        return VM().run(program)
+
+    def compile_tokens(self, reader, print_tree=True):
+        return self.report(self.parse_tokens(reader), print_tree)
+
+    def report(self, ast, print_tree):
+        if ast is not None:
+            if print_tree:
+                ast.printTree()
+            self.check(ast)
+        return ast
+
+    def read_tokens(self, stream, chunk_size):
+        """Yields the tokens of a stream read in chunks of whole lines"""
+        rest = ''
+        while True:
+            chunk = stream.read(chunk_size)
+            data = rest + chunk
+            # no token or comment crosses a line, so a chunk can end after
+            # its last newline and the rest is carried over to the next one
+            cut = data.rfind('\n') + 1 if chunk else len(data)
+            if cut:
+                rest = data[cut:]
+                self.lexer.input(data[:cut])
+                for token in iter(self.lexer.token, None):
+                    yield token
+            else:
+                rest = data
+            if not chunk:
+                return
+
+    def compile_stream(self, stream, print_tree=True, chunk_size=65536):
+        """Like compile, but reads the stream in chunks and prints and checks
+        every top-level instruction as soon as it is parsed, then drops it.
+        Nothing is checked after the first syntax error."""
+        checker = TypeChecker()
+
+        def on_instruction(node):
+            if self.lexer.encountered_error:
+                return
+            if print_tree:
+                node.printTree()
+            checker.visit(node)
+
+        self.lexer.lineno = 1
+        self.lexer.encountered_error = False
+        self.parser.builder = AST
+        self.parser.on_instruction = on_instruction
+        tokens = self.read_tokens(stream, chunk_size)
+        try:
+            self.parser.parse(lexer=self.lexer, tracking=True,
+                              tokenfunc=lambda: next(tokens, None))
+        finally:
+            self.parser.on_instruction = None
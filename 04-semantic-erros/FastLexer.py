@@ -0,0 +1,140 @@
+#!/usr/bin/env python2
+
+from __future__ import print_function
+import re
+import scanner
+
+
+class Token(object):
+    """Token with the attributes of ply.lex.LexToken and end, the offset
+    after its text, which the values of numbers do not keep. Tokens are
+    made with Token.__new__ and their attributes set one by one, which is
+    cheaper than calling an __init__."""
+
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'end', 'lexer')
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value,
+                                          self.lineno, self.lexpos)
+
+    __repr__ = __str__
+
+
+def master_pattern():
+    """The token rules of scanner in the order ply.lex tries them: function
+    rules by definition, string rules by decreasing regex length and the
+    literals last. Ignored characters before a token are part of its match."""
+    functions, strings = [], []
+    for name in dir(scanner):
+        rule = getattr(scanner, name)
+        if not name.startswith('t_') or name in ('t_ignore', 't_error'):
+            continue
+        if callable(rule):
+            functions.append((rule.__code__.co_firstlineno, name[2:], rule.__doc__))
+        else:
+            strings.append((name[2:], rule))
+    functions.sort()
+    strings.sort(key=lambda rule: len(rule[1]), reverse=True)
+    rules = ([(name, regex) for _, name, regex in functions] + strings +
+             [('literal', '[%s]' % re.escape(scanner.literals))])
+    return '[%s]*(?:%s)' % (re.escape(scanner.t_ignore),
+                            '|'.join('(?P<%s>%s)' % rule for rule in rules))
+
+
+# rules are compiled with the flags ply.lex uses
+MASTER = re.compile(master_pattern(), re.VERBOSE)
+
+KEYWORDS = dict((keyword, keyword) for keyword in scanner.keywords)
+
+# group numbers of the rules handled specially
+ID = MASTER.groupindex['ID']
+LITERAL = MASTER.groupindex['literal']
+NEWLINE = MASTER.groupindex['newline']
+COMMENT = MASTER.groupindex['comment']
+INTNUM = MASTER.groupindex['INTNUM']
+FLOATNUM = MASTER.groupindex['FLOATNUM']
+
+
+class FastLexer(object):
+    """Lexer producing the same tokens as scanner.lexer, usable in its place
+    by the parser. All rules are matched by a single regex with finditer,
+    and tokens are made BATCH_SIZE at a time.
+
+    Illegal characters are reported when the tokens before them have been
+    taken, so messages come out in the same order as with ply.lex."""
+
+    BATCH_SIZE = 1024
+
+    def __init__(self):
+        self.lineno = 1
+        self.input('')
+
+    def input(self, data):
+        self.lexdata = data
+        # end of the lexed part of the input, lineno being the line there
+        self.lexpos = 0
+        self.matches = MASTER.finditer(data)
+        # match taken from matches but not lexed yet, if any
+        self.pending = None
+        # tokens lexed but not taken yet, last one first
+        self.batch = []
+
+    def token(self):
+        if not self.batch:
+            self.fill()
+            if not self.batch:
+                return None
+        return self.batch.pop()
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    def fill(self):
+        data, pos, lineno = self.lexdata, self.lexpos, self.lineno
+        matches = self.matches
+        new = Token.__new__
+        batch = []
+        append = batch.append
+        while len(batch) < self.BATCH_SIZE:
+            m, self.pending = self.pending or next(matches, None), None
+            start = len(data) if m is None else m.start()
+            if start != pos:
+                # what lies between two matches is ignored and illegal
+                # characters
+                if batch:
+                    self.pending = m
+                    break
+                for char in data[pos:start]:
+                    if char not in scanner.t_ignore:
+                        print("line %d: illegal character '%s'" % (lineno, char))
+                pos = start
+            if m is None:
+                break
+            pos = m.end()
+            group = m.lastindex
+            if group == COMMENT:
+                continue
+            if group == NEWLINE:
+                lineno += len(m.group(group))
+                continue
+            token = new(Token)
+            token.value = value = m.group(group)
+            token.lineno = lineno
+            token.lexpos = m.start(group)
+            token.end = pos
+            if group == ID:
+                token.type = KEYWORDS.get(value.upper(), 'ID')
+            elif group == LITERAL:
+                token.type = value
+            elif group == INTNUM:
+                token.type = 'INTNUM'
+                token.value = int(value)
+            elif group == FLOATNUM:
+                token.type = 'FLOATNUM'
+                token.value = float(value)
+            else:
+                token.type = m.lastgroup
+            append(token)
+        batch.reverse()
+        self.batch = batch
+        self.lexpos, self.lineno = pos, lineno
@@ -0,0 +1,316 @@
+#!/usr/bin/env python2
+
+from __future__ import print_function
+import sys
+from Compiler import Compiler
+from SymbolTable import SymbolTable
+from TypeChecker import TypeChecker
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+# block size used when looking for the unchanged head and tail of a text
+COMPARE_BLOCK = 4096
+
+
+class Statement(object):
+    """A top-level instruction with its source position.
+
+    Statements before the gap of their IncrementalCompiler store absolute
+    offsets and line numbers, statements after it store distances from the
+    end of the text, so edits earlier in the file do not invalidate them.
+    """
+
+    def __init__(self, node, start, end, lineno):
+        self.node = node
+        self.start = start
+        self.end = end
+        self.lineno = lineno
+        # line the node line numbers are relative to
+        self.parsed_lineno = lineno
+        # (name, old value, new value) of every binding made when checked
+        self.writes = []
+        # (line relative to parsed_lineno, message) pairs
+        self.errors = []
+
+
+class Environment(SymbolTable):
+    """Variables of a TypeChecker, logging the bindings of the outermost
+    scope made through it, which are all those the checker makes"""
+
+    def __init__(self):
+        super(Environment, self).__init__(None, "global")
+        self.log = []
+
+    def update(self, name, symbol):
+        stack = self.bindings.get(name)
+        if stack:
+            outermost = len(stack) == 1 and name in self.scopes[0][1]
+        else:
+            outermost = len(self.scopes) == 1
+        if outermost:
+            self.log.append((name, self.get(name), symbol))
+        super(Environment, self).update(name, symbol)
+
+    def restore(self, name, symbol):
+        """Sets the outermost binding of name, removes it if symbol is None"""
+        names = self.scopes[0][1]
+        if symbol is None:
+            names.discard(name)
+            self.bindings.pop(name, None)
+        else:
+            names.add(name)
+            self.bindings[name] = [symbol]
+
+
+class StatementChecker(TypeChecker):
+    """TypeChecker collecting errors and bindings one statement at a time"""
+
+    def __init__(self, symbols):
+        super(StatementChecker, self).__init__()
+        self.symbols = symbols
+        self.errors = []
+
+    def check(self, statement):
+        self.errors = statement.errors = []
+        self.symbols.log = statement.writes = []
+        self.parsed_lineno = statement.parsed_lineno
+        self.visit(statement.node)
+
+    def print_error(self, node, error):
+        self.errors.append((node.lineno - self.parsed_lineno, error))
+
+
+def common_prefix(a, b):
+    size = min(len(a), len(b))
+    pos = 0
+    while pos < size and a[pos:pos + COMPARE_BLOCK] == b[pos:pos + COMPARE_BLOCK]:
+        pos += COMPARE_BLOCK
+    end = min(pos + COMPARE_BLOCK, size)
+    while pos < end and a[pos] == b[pos]:
+        pos += 1
+    return min(pos, size)
+
+
+def common_suffix(a, b, limit):
+    size = min(len(a), len(b), limit)
+    count = 0
+    while (count + COMPARE_BLOCK <= size and
+           a[len(a) - count - COMPARE_BLOCK:len(a) - count] ==
+           b[len(b) - count - COMPARE_BLOCK:len(b) - count]):
+        count += COMPARE_BLOCK
+    while count < size and a[len(a) - count - 1] == b[len(b) - count - 1]:
+        count += 1
+    return count
+
+
+def same_variable(a, b):
+    if a is None or b is None:
+        return a is b
+    return a.type == b.type and list(a.size) == list(b.size)
+
+
+class IncrementalCompiler(Compiler):
+    """Re-checks a text after edits, re-parsing only the top-level
+    statements an edit touches. The type environment is kept at a cursor
+    that moves by undoing or replaying the bindings of each statement, and
+    checking stops once the environment agrees with the previous run.
+    """
+
+    def __init__(self):
+        super(IncrementalCompiler, self).__init__()
+        self.text = ''
+        self.lines = 0
+        self.statements = None
+        self.gap = 0
+        # self.env holds the variables before statement self.cursor
+        self.env = Environment()
+        self.cursor = 0
+        # lexer and parser messages; a text with any is re-parsed whole
+        self.parse_messages = ''
+
+    def update(self, text):
+        """Sets the new text, reusing whatever is unchanged from the old one"""
+        if self.statements is None or self.parse_messages:
+            self.reparse(text)
+            return
+        old = self.text
+        prefix = common_prefix(old, text)
+        suffix = common_suffix(old, text, min(len(old), len(text)) - prefix)
+        if prefix == len(old) and prefix == len(text):
+            return
+        self.edit(prefix, len(old) - suffix, text[prefix:len(text) - suffix])
+
+    def edit(self, start, end, replacement):
+        """Replaces text[start:end] with replacement"""
+        old = self.text
+        text = old[:start] + replacement + old[end:]
+        if self.statements is None or self.parse_messages:
+            self.reparse(text)
+            return
+
+        # the region re-parsed spans the statements overlapping the edit and
+        # the text up to the neighbouring statements; it is extended until
+        # a newline follows it, since no token or comment crosses a line
+        first = self.find_statement(lambda s: self.position(s)[1] >= start)
+        last = self.find_statement(lambda s: self.position(s)[0] > end) - 1
+        region_start = self.position(first - 1)[1] if first > 0 else 0
+        while True:
+            if last + 1 == len(self.statements):
+                region_end = len(old)
+                break
+            region_end = self.position(last + 1)[0]
+            tail_start = max(end, self.position(last)[1]) if last >= first else end
+            if '\n' in old[tail_start:region_end]:
+                break
+            last += 1
+        self.move_gap(last + 1)
+        self.seek(first)
+
+        self.text = text
+        self.lines = text.count('\n')
+        delta = len(replacement) - (end - start)
+        statements = self.parse_region(region_start, region_end + delta)
+        if statements is None or (
+                not statements and last - first + 1 == len(self.statements)):
+            # a text left without statements is a syntax error of its own
+            self.reparse(text)
+            return
+        replaced = self.statements[first:last + 1]
+        self.statements[first:last + 1] = statements
+        self.gap = first + len(statements)
+        self.check(replaced, len(statements))
+
+    def reparse(self, text):
+        self.text = text
+        self.lines = text.count('\n')
+        self.statements = []
+        self.gap = 0
+        self.env = Environment()
+        self.cursor = 0
+        messages = StringIO()
+        stdout, sys.stdout = sys.stdout, messages
+        try:
+            ast = self.parse(text)
+        finally:
+            sys.stdout = stdout
+        self.parse_messages = messages.getvalue()
+        if ast is not None:
+            self.statements = self.make_statements(ast, 0)
+            self.gap = len(self.statements)
+            self.check([], len(self.statements))
+
+    def parse_region(self, start, end):
+        """Parses text[start:end], returns its statements or None
+        if the lexer or parser reported anything"""
+        if not self.text[start:end].strip():
+            return []
+        line_start = self.text.rfind('\n', 0, start) + 1
+        # padding keeps columns in messages right
+        padding = ' ' * (start - line_start)
+        messages = StringIO()
+        stdout, sys.stdout = sys.stdout, messages
+        try:
+            ast = self.parse(padding + self.text[start:end],
+                             self.text.count('\n', 0, start) + 1)
+        finally:
+            sys.stdout = stdout
+        if ast is None or messages.getvalue():
+            return None
+        return self.make_statements(ast, line_start)
+
+    def make_statements(self, ast, offset):
+        statements = []
+        lineno, previous = 1, 0
+        for node, (first, last) in zip(ast.nodes, ast.spans):
+            start = first + offset
+            lineno += self.text.count('\n', previous, start)
+            previous = start
+            statements.append(Statement(node, start, last + offset + 1, lineno))
+        return statements
+
+    def position(self, index):
+        """Returns (start, end, lineno) of the statement at index"""
+        s = self.statements[index]
+        if index < self.gap:
+            return s.start, s.end, s.lineno
+        return len(self.text) - s.start, len(self.text) - s.end, self.lines - s.lineno
+
+    def move_gap(self, index):
+        statements = self.statements
+        size, lines = len(self.text), self.lines
+        while self.gap < index:
+            s = statements[self.gap]
+            s.start, s.end, s.lineno = size - s.start, size - s.end, lines - s.lineno
+            self.gap += 1
+        while self.gap > index:
+            self.gap -= 1
+            s = statements[self.gap]
+            s.start, s.end, s.lineno = size - s.start, size - s.end, lines - s.lineno
+
+    def find_statement(self, predicate):
+        """Index of the first statement satisfying a predicate that is
+        monotonic over the statement order"""
+        low, high = 0, len(self.statements)
+        while low < high:
+            middle = (low + high) // 2
+            if predicate(middle):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def seek(self, index):
+        """Moves the environment cursor to before the statement at index"""
+        statements = self.statements
+        while self.cursor < index:
+            for name, old, new in statements[self.cursor].writes:
+                self.env.restore(name, new)
+            self.cursor += 1
+        while self.cursor > index:
+            self.cursor -= 1
+            for name, old, new in reversed(statements[self.cursor].writes):
+                self.env.restore(name, old)
+
+    def check(self, replaced, count):
+        """Type checks the count statements at the cursor, which took the
+        place of replaced, and then the following ones for as long as the
+        environment differs from the previous run"""
+        # values of the previous run at the cursor, for the names whose
+        # values may differ
+        old_values = {}
+        for s in replaced:
+            for name, old, new in s.writes:
+                old_values[name] = new
+
+        checker = StatementChecker(self.env)
+        statements = self.statements
+        changed_end = self.cursor + count
+        while self.cursor < len(statements):
+            s = statements[self.cursor]
+            if self.cursor >= changed_end:
+                for name in list(old_values):
+                    if same_variable(self.env.get(name), old_values[name]):
+                        del old_values[name]
+                if not old_values:
+                    break
+                for name, old, new in s.writes:
+                    old_values[name] = new
+            checker.check(s)
+            for name, old, new in s.writes:
+                # a name not tracked yet had the same value in both runs
+                old_values.setdefault(name, old)
+            self.cursor += 1
+
+    def diagnostics(self):
+        """Returns the messages a full run would print, without the tree"""
+        lines = [self.parse_messages] if self.parse_messages else []
+        for index, s in enumerate(self.statements or []):
+            if s.errors:
+                lineno = self.position(index)[2]
+                lines.extend("Error in line {}: {}\n".format(lineno + line, error)
+                             for line, error in s.errors)
+        return ''.join(lines)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python2
+
+import AST
+from TypeChecker import TypeChecker
+
+
+class CheckError(Exception):
+    pass
+
+
+class ConstantChecker(TypeChecker):
+    """Checks subtrees without variables, whose results do not depend on
+    where they occur; an error aborts the check"""
+
+    def print_error(self, node, error):
+        raise CheckError(error)
+
+
+class Interner(object):
+    """Node builder for the parser that shares structurally identical
+    subtrees instead of building a node for every occurrence.
+
+    Literals, variables and expressions built only from literals are
+    shared. The line of a shared node is that of its first occurrence,
+    which no message uses: diagnostics are reported on the nodes that fail
+    to check, which are never shared, and runtime errors on the statements
+    they occur in, which are never shared either. Every shared subtree
+    without variables is type checked once, when it is first built, and
+    its result is kept in results for TypeChecker(results) to reuse.
+    Subtrees whose check reports an error are not shared, so that each
+    occurrence reports it with its own line. Other nodes are built as
+    they are by the AST classes.
+    """
+
+    def __init__(self):
+        # structural key -> shared node; children of shared nodes are
+        # shared themselves, so they are compared by identity
+        self.nodes = {}
+        # shared node without variables -> its check result
+        self.results = {}
+        self.checker = ConstantChecker(self.results)
+
+    def __getattr__(self, name):
+        return getattr(AST, name)
+
+    def share(self, key, lineno, cls, *args):
+        node = self.nodes.get(key)
+        if node is None:
+            node = cls(lineno, *args)
+            if cls is not AST.Variable:
+                try:
+                    self.results[node] = self.checker.visit(node)
+                except CheckError:
+                    # left to the checker of the whole tree to report
+                    return node
+            self.nodes[key] = node
+        return node
+
+    def constant(self, children):
+        return all(child in self.results for child in children)
+
+    def IntNum(self, lineno, value):
+        return self.share((AST.IntNum, type(value), value), lineno, AST.IntNum, value)
+
+    def FloatNum(self, lineno, value):
+        return self.share((AST.FloatNum, value), lineno, AST.FloatNum, value)
+
+    def String(self, lineno, value):
+        return self.share((AST.String, value), lineno, AST.String, value)
+
+    def Variable(self, lineno, name):
+        return self.share((AST.Variable, name), lineno, AST.Variable, name)
+
+    def Vector(self, lineno, elements):
+        if not self.constant(elements):
+            return AST.Vector(lineno, elements)
+        key = (AST.Vector,) + tuple(map(id, elements))
+        return self.share(key, lineno, AST.Vector, elements)
+
+    def Matrix(self, lineno, elements):
+        if not self.constant(elements):
+            return AST.Matrix(lineno, elements)
+        key = (AST.Matrix,) + tuple(map(id, elements))
+        return self.share(key, lineno, AST.Matrix, elements)
+
+    def FunctionCall(self, lineno, name, arguments):
+        if not self.constant(arguments):
+            return AST.FunctionCall(lineno, name, arguments)
+        key = (AST.FunctionCall, name) + tuple(map(id, arguments))
+        return self.share(key, lineno, AST.FunctionCall, name, arguments)
+
+    def UnaryExpr(self, lineno, operation, operand):
+        if not self.constant([operand]):
+            return AST.UnaryExpr(lineno, operation, operand)
+        key = (AST.UnaryExpr, operation, id(operand))
+        return self.share(key, lineno, AST.UnaryExpr, operation, operand)
+
+    def ArithmeticOperation(self, lineno, op, left, right):
+        if not self.constant([left, right]):
+            return AST.ArithmeticOperation(lineno, op, left, right)
+        key = (AST.ArithmeticOperation, op, id(left), id(right))
+        return self.share(key, lineno, AST.ArithmeticOperation, op, left, right)
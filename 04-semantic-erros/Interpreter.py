@@ -0,0 +1,257 @@
+#!/usr/bin/env python2
+
+from __future__ import print_function
+import operator
+import numpy as np
+import AST
+from SymbolTable import SymbolTable
+from TypeChecker import NodeVisitor
+
+
+class BreakException(Exception):
+    pass
+
+
+class ContinueException(Exception):
+    pass
+
+
+class ReturnValueException(Exception):
+
+    def __init__(self, value):
+        super(ReturnValueException, self).__init__()
+        self.value = value
+
+
+class InterpreterError(Exception):
+    """Error of a running program that the type checker cannot rule out"""
+
+
+def multiply(left, right):
+    # * of two matrices is the matrix product, otherwise it is elementwise
+    if (isinstance(left, np.ndarray) and isinstance(right, np.ndarray) and
+            left.ndim == 2 and right.ndim == 2):
+        return np.dot(left, right)
+    return left * right
+
+
+operations = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': multiply,
+    '/': operator.truediv,
+    '.+': operator.add,
+    '.-': operator.sub,
+    '.*': operator.mul,
+    './': operator.truediv,
+    '<': operator.lt,
+    '>': operator.gt,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+# ufuncs applying compound assignments to an array in place, when the
+# right side is not a matrix
+in_place_operations = {
+    '+=': np.add,
+    '-=': np.subtract,
+    '*=': np.multiply,
+    '/=': np.true_divide,
+}
+
+functions = {
+    'zeros': np.zeros,
+    'ones': np.ones,
+    'eye': lambda shape: np.eye(*shape),
+}
+
+
+def allocate(name, shape):
+    """Result of the function call name(*shape)"""
+    if len(shape) == 1:
+        shape *= 2
+    return functions[name.lower()](tuple(shape))
+
+
+def augment(op, old, value):
+    """Value of a variable after the compound assignment op of value to it,
+    computed in place if its old value is an array that fits the result"""
+    if (isinstance(old, np.ndarray) and
+            not (isinstance(value, np.ndarray) and value.ndim == 2 and op == '*=') and
+            np.result_type(old, value) == old.dtype and
+            np.broadcast(old, value).shape == old.shape):
+        return in_place_operations[op](old, value, out=old)
+    return operations[op[:-1]](old, value)
+
+
+def truth(value):
+    if isinstance(value, np.ndarray):
+        return bool(value.all())
+    return bool(value)
+
+
+class Interpreter(NodeVisitor):
+    """Runs checked programs.
+
+    Numbers are Python ints and floats, vectors and matrices are NumPy
+    arrays of floats, so that operations on them run as vectorized NumPy
+    calls: the dot operators are elementwise, * of two matrices is their
+    product and ' is a transposed view of its operand. Variables never
+    share an array, so arrays are updated in place by compound assignments
+    and element assignments: = copies the value of a variable or a view,
+    such as a transposition or a row of a matrix, while other values are
+    new arrays already. Variables are kept in a SymbolTable, all in the
+    one scope of the program as for the type checker, so the iterator of a
+    for loop keeps its last value after the loop.
+
+    For loops run over the range from start to end inclusive, and
+    references index from 0.
+    """
+
+    def __init__(self):
+        super(Interpreter, self).__init__()
+        self.memory = SymbolTable(None, "global")
+        # line of the statement being run
+        self.lineno = None
+
+    def run(self, ast):
+        """Runs the program ast and returns the value of its return
+        statement, or None if it has none or stops on an error"""
+        try:
+            self.visit(ast)
+        except ReturnValueException as e:
+            return e.value
+        except (InterpreterError, ArithmeticError, IndexError, ValueError) as e:
+            print("Runtime error in line {}: {}".format(self.lineno, e))
+        return None
+
+    def visit_Instructions(self, node):
+        for n in node.nodes:
+            self.lineno = n.lineno
+            yield n
+
+    def visit_FlowKeyword(self, node):
+        if node.keyword == 'BREAK':
+            raise BreakException()
+        raise ContinueException()
+
+    def visit_Print(self, node):
+        values = []
+        for argument in node.arguments:
+            values.append((yield argument))
+        print(*values)
+
+    def visit_Return(self, node):
+        value = None
+        if node.value is not None:
+            value = yield node.value
+        raise ReturnValueException(value)
+
+    def visit_String(self, node):
+        return node.value[1:-1]
+
+    def visit_Vector(self, node):
+        elements = []
+        for element in node.elements:
+            elements.append((yield element))
+        yield np.array(elements, dtype=float)
+
+    def visit_Reference(self, node):
+        value = yield node.name
+        coords = []
+        for coord in node.coords:
+            coords.append(int((yield coord)))
+        yield value[tuple(coords)]
+
+    def visit_FunctionCall(self, node):
+        shape = []
+        for argument in node.arguments:
+            shape.append(int((yield argument)))
+        yield allocate(node.name, shape)
+
+    def visit_While(self, node):
+        while truth((yield node.condition)):
+            try:
+                yield node.body
+            except BreakException:
+                break
+            except ContinueException:
+                pass
+
+    def visit_For(self, node):
+        start = yield node.range.start
+        end = yield node.range.end
+        name = node.iterator.name
+        for i in xrange(int(start), int(end) + 1):
+            self.memory.update(name, i)
+            try:
+                yield node.body
+            except BreakException:
+                break
+            except ContinueException:
+                pass
+
+    def visit_If(self, node):
+        if truth((yield node.condition)):
+            yield node.body
+        elif node.else_body is not None:
+            yield node.else_body
+
+    def visit_Variable(self, node):
+        value = self.memory.get(node.name)
+        if value is None:
+            raise InterpreterError("undefined variable {}".format(node.name))
+        return value
+
+    def visit_BinExpr(self, node):
+        left = yield node.left
+        right = yield node.right
+        yield operations[node.op](left, right)
+
+    def visit_Assignment(self, node):
+        # the target is evaluated before the value, as by the VM
+        target, op = node.left, node.op
+        if isinstance(target, AST.Reference):
+            array = yield target.name
+            coords = []
+            for coord in target.coords:
+                coords.append(int((yield coord)))
+            coords = tuple(coords)
+            if op == '=':
+                array[coords] = yield node.right
+            else:
+                item = array[coords]
+                array[coords] = operations[op[:-1]](item, (yield node.right))
+        elif op == '=':
+            value = yield node.right
+            if isinstance(value, np.ndarray) and (
+                    value.base is not None or isinstance(node.right, AST.Variable)):
+                value = value.copy()
+            self.memory.update(target.name, value)
+        else:
+            old = yield target
+            value = yield node.right
+            self.memory.update(target.name, augment(op, old, value))
+
+    def visit_IntNum(self, node):
+        return node.value
+
+    def visit_FloatNum(self, node):
+        return node.value
+
+    def visit_Constant(self, node):
+        return node.value.copy()
+
+    def visit_UnaryExpr(self, node):
+        value = yield node.operand
+        if node.operation == 'NEGATE':
+            yield -value
+        elif isinstance(value, np.ndarray):
+            yield value.T
+        else:
+            yield value
+
+    def visit_Error(self, node):
+        pass
@@ -1,6 +1,7 @@
 #!/usr/bin/env python2
 
 from __future__ import print_function
+import os
 import scanner
 import ply.yacc as yacc
 
@@ -9,6 +10,8 @@ import AST
 tokens = scanner.tokens
 literals = scanner.literals
 
+start = 'program'
+
 
 precedence = (
     ('nonassoc', 'IF'),
@@ -39,14 +42,31 @@ def p_error(p):
 # Main productions
 # -------------------------
 
+def p_program(p):
+    """program : instruction
+               | program instruction"""
+    # top-level instructions; a parser with an on_instruction callback
+    # hands each one over as soon as it is reduced instead of keeping it
+    if len(p) == 2:
+        p[0] = p.parser.builder.Instructions(p.lineno(1), [])
+    else:
+        p[0] = p[1]
+    if p.parser.on_instruction is not None:
+        p.parser.on_instruction(p[len(p) - 1])
+    else:
+        p[0].nodes.append(p[len(p) - 1])
+        p[0].spans.append(p.lexspan(len(p) - 1))
+
+
 def p_instructions(p):
     """instructions : instruction
-                    | instruction instructions"""
+                    | instructions instruction"""
+    # left recursion keeps the parser stack shallow and lets us append
     if len(p) == 2:
-        p[0] = AST.Instructions(p.lineno(1), [p[1]])
+        p[0] = p.parser.builder.Instructions(p.lineno(1), [p[1]])
     else:
-        p[0] = p[2]
-        p[0].nodes = [p[1]] + p[0].nodes
+        p[0] = p[1]
+        p[0].nodes.append(p[2])
 
 
 def p_instruction(p):
@@ -69,7 +89,7 @@ def p_statement(p):
 def p_flow_keyword(p):
     """flow_keyword : BREAK
                     | CONTINUE"""
-    p[0] = AST.FlowKeyword(p.lineno(1), p[1])
+    p[0] = p.parser.builder.FlowKeyword(p.lineno(1), p[1])
 
 
 def p_expression(p):
@@ -86,33 +106,33 @@ def p_block(p):
 
 def p_print(p):
     """print : PRINT print_body"""
-    p[0] = AST.Print(p.lineno(1), p[2])
+    p[0] = p.parser.builder.Print(p.lineno(1), p[2])
 
 
 def p_print_body(p):
     """print_body : string
                   | expression
-                  | string ',' print_body
-                  | expression ',' print_body"""
+                  | print_body ',' string
+                  | print_body ',' expression"""
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[3]
-        p[0] = [p[1]] + p[0]
+        p[0] = p[1]
+        p[0].append(p[3])
 
 
 def p_return(p):
     """return : RETURN expression
               | RETURN"""
     if len(p) == 2:
-        p[0] = AST.Return(p.lineno(1))
+        p[0] = p.parser.builder.Return(p.lineno(1))
     else:
-        p[0] = AST.Return(p.lineno(1), p[2])
+        p[0] = p.parser.builder.Return(p.lineno(1), p[2])
 
 
 def p_string(p):
     """string : STRING"""
-    p[0] = AST.String(p.lineno(1), p[1])
+    p[0] = p.parser.builder.String(p.lineno(1), p[1])
 
 # -------------------------
 # Matrices
@@ -123,9 +143,9 @@ def p_vector(p):
     """vector : '[' vector_body ']'
               | '[' ']'"""
     if len(p) == 3:
-        p[0] = AST.Vector(p.lineno(1), [])
+        p[0] = p.parser.builder.Vector(p.lineno(1), [])
     else:
-        p[0] = AST.Vector(p.lineno(1), p[2])
+        p[0] = p.parser.builder.Vector(p.lineno(1), p[2])
 
 
 def p_vector_body(p):
@@ -135,16 +155,16 @@ def p_vector_body(p):
         p[0] = [p[1]]
     else:
         p[0] = p[1]
-        p[0] += [p[3]]
+        p[0].append(p[3])
 
 
 def p_matrix(p):
     """matrix : '[' matrix_body ']'
               | '[' ']'"""
     if len(p) == 3:
-        p[0] = AST.Matrix(p.lineno(1), [])
+        p[0] = p.parser.builder.Matrix(p.lineno(1), [])
     else:
-        p[0] = AST.Matrix(p.lineno(1), p[2])
+        p[0] = p.parser.builder.Matrix(p.lineno(1), p[2])
 
 
 def p_matrix_body(p):
@@ -154,7 +174,7 @@ def p_matrix_body(p):
         p[0] = [p[1]]
     else:
         p[0] = p[1]
-        p[0] += [p[3]]
+        p[0].append(p[3])
 
 
 # -------------------------
@@ -163,7 +183,7 @@ def p_matrix_body(p):
 
 def p_array_range(p):
     """array_range : var '[' expression ',' expression ']'"""
-    p[0] = AST.Reference(p.lineno(1), p[1], [p[3], p[5]])
+    p[0] = p.parser.builder.Reference(p.lineno(1), p[1], [p[3], p[5]])
 
 
 # -------------------------
@@ -173,7 +193,10 @@ def p_array_range(p):
 def p_fun(p):
     """fun : fun_name '(' vector_body ')'
            | fun_name '(' error ')'"""
-    p[0] = AST.FunctionCall(p.lineno(1), p[1], p[3])
+    # after a syntax error in the arguments the call has none, as builders
+    # take a list
+    arguments = [] if p.slice[3].type == 'error' else p[3]
+    p[0] = p.parser.builder.FunctionCall(p.lineno(1), p[1], arguments)
 
 
 def p_fun_name(p):
@@ -195,12 +218,14 @@ def p_loop(p):
 
 def p_while(p):
     """while : WHILE '(' expression ')' instruction"""
-    p[0] = AST.While(p.lineno(1), p[3], p[5])
+    p[0] = p.parser.builder.While(p.lineno(1), p[3], p[5])
 
 
 def p_for(p):
     """for : FOR ID '=' numeric_expression ':' numeric_expression instruction"""
-    p[0] = AST.For(p.lineno(1), AST.Variable(p.lineno(1), p[2]), p[4], p[6], p[7])
+    builder = p.parser.builder
+    p[0] = builder.For(p.lineno(1), builder.Variable(p.lineno(1), p[2]),
+                       p[4], p[6], p[7])
 
 
 # -------------------------
@@ -214,7 +239,7 @@ def p_conditional(p):
         else_body = None
     else:
         else_body = p[7]
-    p[0] = AST.If(p.lineno(1), p[3], p[5], else_body)
+    p[0] = p.parser.builder.If(p.lineno(1), p[3], p[5], else_body)
 
 
 # -------------------------
@@ -230,7 +255,7 @@ def p_assignment_lhs(p):
 def p_assignment(p):
     """assignment : assignment_lhs assignment_operator expression
                   | assignment_lhs '=' string"""
-    p[0] = AST.Assignment(p.lineno(1), p[2], p[1], p[3])
+    p[0] = p.parser.builder.Assignment(p.lineno(1), p[2], p[1], p[3])
 
 
 def p_assignment_operator(p):
@@ -250,19 +275,20 @@ def p_var(p):
     """var : ID
            | var '[' vector_body ']'"""
     if len(p) == 2:
-        p[0] = AST.Variable(p.lineno(1), p[1])
+        p[0] = p.parser.builder.Variable(p.lineno(1), p[1])
     else:
-        p[0] = AST.Reference(p.lineno(1), p[1], p[3])
+        p[0] = p.parser.builder.Reference(p.lineno(1), p[1], p[3])
 
 
 def p_num(p):
     """num : INTNUM
            | FLOATNUM
            | var"""
-    if isinstance(p[1], (int, long)):
-        p[0] = AST.IntNum(p.lineno(1), p[1])
-    elif isinstance(p[1], float):
-        p[0] = AST.FloatNum(p.lineno(1), p[1])
+    # dispatch on the symbol, as an Arena builder represents nodes as ints
+    if p.slice[1].type == 'INTNUM':
+        p[0] = p.parser.builder.IntNum(p.lineno(1), p[1])
+    elif p.slice[1].type == 'FLOATNUM':
+        p[0] = p.parser.builder.FloatNum(p.lineno(1), p[1])
     else:
         p[0] = p[1]
 
@@ -279,12 +305,12 @@ def p_unary_op(p):
 
 def p_neg(p):
     """negation : '-' numeric_expression %prec UMINUS"""
-    p[0] = AST.UnaryExpr(p.lineno(1), 'NEGATE', p[2])
+    p[0] = p.parser.builder.UnaryExpr(p.lineno(1), 'NEGATE', p[2])
 
 
 def p_transposition(p):
     r"""transposition : numeric_expression '\''"""
-    p[0] = AST.UnaryExpr(p.lineno(1), 'TRANSPOSE', p[1])
+    p[0] = p.parser.builder.UnaryExpr(p.lineno(1), 'TRANSPOSE', p[1])
 
 
 def p_numeric_expression(p):
@@ -309,7 +335,7 @@ def p_bin_numeric_expression(p):
                           | numeric_expression DOTSUB numeric_expression
                           | numeric_expression DOTMUL numeric_expression
                           | numeric_expression DOTDIV numeric_expression"""
-    p[0] = AST.ArithmeticOperation(p.lineno(1), p[2], p[1], p[3])
+    p[0] = p.parser.builder.ArithmeticOperation(p.lineno(1), p[2], p[1], p[3])
 
 
 # -------------------------
@@ -327,7 +353,21 @@ def p_comparison_expression(p):
     if p[1] == '(':
         p[0] = p[2]
     else:
-        p[0] = AST.Comparison(p.lineno(1), p[2], p[1], p[3])
+        p[0] = p.parser.builder.Comparison(p.lineno(1), p[2], p[1], p[3])
+
+
+# tables are loaded from parsetab.py next to this module; when the grammar
+# signature no longer matches, ply builds them in memory, and running this
+# module writes them
+parser = yacc.yacc(debug=False, write_tables=False,
+                   outputdir=os.path.dirname(os.path.abspath(__file__)))
+# node constructors used by the actions; an Arena.Arena can take its place
+parser.builder = AST
+# called with every top-level instruction instead of collecting them
+parser.on_instruction = None
 
 
-parser = yacc.yacc()
+if __name__ == '__main__':
+    scanner.write_table()
+    yacc.yacc(debug=False,
+              outputdir=os.path.dirname(os.path.abspath(__file__)))
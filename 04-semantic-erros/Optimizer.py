@@ -0,0 +1,594 @@
+#!/usr/bin/env python2
+"""Optimization passes over checked programs.
+
+A pass returns the optimized tree and leaves the one it was given alone:
+nodes are rebuilt, as plain AST nodes, only where one of their children
+changed, so trees kept in an Arena or shared by an Interner stay valid.
+New nodes take the line of the node they replace, for runtime errors.
+"""
+
+import operator
+import numpy as np
+import AST
+import Interpreter
+from TypeChecker import NodeVisitor
+
+# largest array computed while optimizing, in elements
+MAX_ELEMENTS = 10000
+
+
+def constant(node):
+    return isinstance(node, (AST.IntNum, AST.FloatNum, AST.Constant))
+
+
+def make_constant(lineno, value):
+    """Node of value, or None if it is not a finite number or array of at
+    most MAX_ELEMENTS elements, such as the None of a failed compute"""
+    if isinstance(value, np.ndarray):
+        if value.size > MAX_ELEMENTS or not np.isfinite(value).all():
+            return None
+        return AST.Constant(lineno, value)
+    if isinstance(value, (int, long)) and not isinstance(value, bool):
+        return AST.IntNum(lineno, value)
+    if isinstance(value, float) and np.isfinite(value):
+        return AST.FloatNum(lineno, value)
+    return None
+
+
+def compute(func, *args):
+    """func(*args), or None if it fails; NumPy is to raise on any floating
+    point error, which the program would report as a warning instead"""
+    try:
+        return func(*args)
+    except (ArithmeticError, ValueError):
+        return None
+
+
+# nodes without children, tested first as most nodes are
+LEAVES = (AST.Variable, AST.IntNum, AST.FloatNum, AST.String, AST.Constant,
+          AST.FlowKeyword, AST.Error)
+
+
+def children(node):
+    """Children of node in the order they run, leaving out the variables
+    that are only assigned: targets of = and iterators of for loops"""
+    if isinstance(node, LEAVES):
+        return []
+    if isinstance(node, AST.Instructions):
+        return node.nodes
+    if isinstance(node, AST.Assignment):
+        if node.op == '=' and isinstance(node.left, AST.Variable):
+            return [node.right]
+        return [node.left, node.right]
+    if isinstance(node, AST.BinExpr):
+        return [node.left, node.right]
+    if isinstance(node, AST.UnaryExpr):
+        return [node.operand]
+    if isinstance(node, AST.Vector):
+        return node.elements
+    if isinstance(node, AST.Reference):
+        return [node.name] + node.coords
+    if isinstance(node, (AST.Print, AST.FunctionCall)):
+        return node.arguments
+    if isinstance(node, AST.Return):
+        return [] if node.value is None else [node.value]
+    if isinstance(node, AST.While):
+        return [node.condition, node.body]
+    if isinstance(node, AST.For):
+        return [node.range.start, node.range.end, node.body]
+    if isinstance(node, AST.If):
+        if node.else_body is None:
+            return [node.condition, node.body]
+        return [node.condition, node.body, node.else_body]
+    return []
+
+
+def walk(node):
+    """Yields node and its descendants, as listed by children, in preorder"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(children(node)))
+
+
+def variables(node):
+    """Names of the variables assigned in node, element assignments and
+    compound assignments included, and of those whose values it reads"""
+    assigned, read = set(), set()
+    for n in walk(node):
+        if isinstance(n, AST.Variable):
+            read.add(n.name)
+        elif isinstance(n, AST.Assignment):
+            target = n.left
+            if isinstance(target, AST.Reference):
+                target = target.name
+            assigned.add(target.name)
+        elif isinstance(n, AST.For):
+            assigned.add(n.iterator.name)
+    return assigned, read
+
+
+def reads(node):
+    return variables(node)[1]
+
+
+def assigned(node):
+    return variables(node)[0]
+
+
+def safe(node):
+    """Whether evaluating node cannot fail"""
+    if isinstance(node, (AST.IntNum, AST.FloatNum, AST.String, AST.Constant)):
+        return True
+    if isinstance(node, AST.Matrix):
+        rows = node.elements
+        return all(isinstance(row, AST.Vector) and safe(row) and
+                   len(row.elements) == len(rows[0].elements) for row in rows)
+    if isinstance(node, AST.Vector):
+        return all(isinstance(element, (AST.IntNum, AST.FloatNum))
+                   for element in node.elements)
+    return False
+
+
+def signature(node):
+    """Tuple equal for equal expressions"""
+    items = []
+    for n in walk(node):
+        if isinstance(n, AST.Constant):
+            label = n.value.shape, n.value.tostring()
+        else:
+            # repr tells 0.0 from -0.0
+            label = repr(getattr(n, 'value', None)), getattr(n, 'name', None), \
+                getattr(n, 'op', None), getattr(n, 'operation', None)
+        items.append((n.__class__.__name__, label, len(children(n))))
+    return tuple(items)
+
+
+class Transformer(NodeVisitor):
+    """Base of the passes. Its visit methods visit the children of a node
+    and rebuild it if any changed; enter(node) may replace a node before its
+    children are visited, and leave(node) after.
+
+    The visit methods yield their result in a 1-tuple, as a node yielded by
+    itself would be visited by NodeVisitor.
+    """
+
+    def transform(self, ast):
+        node, = self.visit(ast)
+        return node
+
+    def enter(self, node):
+        return None
+
+    def leave(self, node):
+        return node
+
+    def visit_Node(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            return replacement,
+        return self.leave(node),
+
+    def visit_Instructions(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        nodes = node.nodes
+        new_nodes = []
+        for n in nodes:
+            new, = yield n
+            new_nodes.append(new)
+        if any(new is not n for new, n in zip(new_nodes, nodes)):
+            node = AST.Instructions(node.lineno, new_nodes)
+        yield self.leave(node),
+
+    def visit_Print(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        arguments = node.arguments
+        new_arguments = []
+        for argument in arguments:
+            new, = yield argument
+            new_arguments.append(new)
+        if any(new is not a for new, a in zip(new_arguments, arguments)):
+            node = AST.Print(node.lineno, new_arguments)
+        yield self.leave(node),
+
+    def visit_Return(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        value = node.value
+        if value is not None:
+            new, = yield value
+            if new is not value:
+                node = AST.Return(node.lineno, new)
+        yield self.leave(node),
+
+    def visit_Vector(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        elements = node.elements
+        new_elements = []
+        for element in elements:
+            new, = yield element
+            new_elements.append(new)
+        if any(new is not e for new, e in zip(new_elements, elements)):
+            node = getattr(AST, node.__class__.__name__)(node.lineno, new_elements)
+        yield self.leave(node),
+
+    def visit_Reference(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        coords = node.coords
+        new_coords = []
+        for coord in coords:
+            new, = yield coord
+            new_coords.append(new)
+        if any(new is not c for new, c in zip(new_coords, coords)):
+            node = AST.Reference(node.lineno, node.name, new_coords)
+        yield self.leave(node),
+
+    def visit_FunctionCall(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        arguments = node.arguments
+        new_arguments = []
+        for argument in arguments:
+            new, = yield argument
+            new_arguments.append(new)
+        if any(new is not a for new, a in zip(new_arguments, arguments)):
+            node = AST.FunctionCall(node.lineno, node.name, new_arguments)
+        yield self.leave(node),
+
+    def visit_While(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        condition, body = node.condition, node.body
+        new_condition, = yield condition
+        new_body, = yield body
+        if new_condition is not condition or new_body is not body:
+            node = AST.While(node.lineno, new_condition, new_body)
+        yield self.leave(node),
+
+    def visit_For(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        start, end, body = node.range.start, node.range.end, node.body
+        new_start, = yield start
+        new_end, = yield end
+        new_body, = yield body
+        if new_start is not start or new_end is not end or new_body is not body:
+            node = AST.For(node.lineno, node.iterator, new_start, new_end, new_body)
+        yield self.leave(node),
+
+    def visit_If(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        condition, body, else_body = node.condition, node.body, node.else_body
+        new_condition, = yield condition
+        new_body, = yield body
+        new_else_body = else_body
+        if else_body is not None:
+            new_else_body, = yield else_body
+        if (new_condition is not condition or new_body is not body or
+                new_else_body is not else_body):
+            node = AST.If(node.lineno, new_condition, new_body, new_else_body)
+        yield self.leave(node),
+
+    def visit_BinExpr(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        left, right = node.left, node.right
+        new_left, = yield left
+        new_right, = yield right
+        if new_left is not left or new_right is not right:
+            node = getattr(AST, node.__class__.__name__)(
+                node.lineno, node.op, new_left, new_right)
+        yield self.leave(node),
+
+    def visit_UnaryExpr(self, node):
+        replacement = self.enter(node)
+        if replacement is not None:
+            yield replacement,
+        operand = node.operand
+        new, = yield operand
+        if new is not operand:
+            node = AST.UnaryExpr(node.lineno, node.operation, new)
+        yield self.leave(node),
+
+
+class ConstantFolder(Transformer):
+    """Folds arithmetic on numbers and literal arrays, literal arrays and
+    calls of zeros, ones and eye with literal sizes into constants, and
+    removes double negations and transpositions, counting the nodes it
+    eliminates.
+
+    Values are computed with the operations of the interpreter, so the
+    program computes the same; operations that fail, such as a division
+    by zero, are left for the program to report when it runs. Arrays are
+    kept as Constant nodes, which give a new copy of their value each time
+    they are evaluated.
+    """
+
+    def __init__(self):
+        super(ConstantFolder, self).__init__()
+        self.eliminated = 0
+
+    def fold(self, ast):
+        """Returns ast with its constants folded"""
+        with np.errstate(all='raise'):
+            return self.transform(ast)
+
+    def leave(self, node):
+        if isinstance(node, AST.ArithmeticOperation):
+            folded = self.fold_operation(node)
+        elif isinstance(node, AST.UnaryExpr):
+            folded = self.fold_unary(node)
+        elif isinstance(node, AST.Vector):
+            folded = self.fold_vector(node)
+        elif isinstance(node, AST.FunctionCall):
+            folded = self.fold_call(node)
+        else:
+            return node
+        return node if folded is None else folded
+
+    def fold_operation(self, node):
+        if constant(node.left) and constant(node.right):
+            value = compute(Interpreter.operations[node.op],
+                            node.left.value, node.right.value)
+            folded = make_constant(node.lineno, value)
+            if folded is not None:
+                self.eliminated += 2
+            return folded
+
+    def fold_unary(self, node):
+        operand = node.operand
+        folded = None
+        if isinstance(operand, AST.UnaryExpr) and operand.operation == node.operation:
+            # x'' and -(-x) are x
+            self.eliminated += 1
+            folded = operand.operand
+        elif node.operation == 'NEGATE':
+            if constant(operand):
+                folded = make_constant(node.lineno, -operand.value)
+        elif isinstance(operand, (AST.IntNum, AST.FloatNum)):
+            folded = operand
+        elif isinstance(operand, AST.Constant):
+            folded = AST.Constant(node.lineno, operand.value.T.copy())
+        if folded is not None:
+            self.eliminated += 1
+        return folded
+
+    def fold_vector(self, node):
+        elements = node.elements
+        if all(constant(element) for element in elements):
+            value = compute(np.array, [element.value for element in elements], float)
+            folded = make_constant(node.lineno, value)
+            if folded is not None:
+                self.eliminated += len(elements)
+            return folded
+
+    def fold_call(self, node):
+        arguments = node.arguments
+        if all(isinstance(argument, AST.IntNum) for argument in arguments):
+            shape = [argument.value for argument in arguments]
+            size = shape[0] ** 2 if len(shape) == 1 else reduce(operator.mul, shape)
+            if size <= MAX_ELEMENTS:
+                folded = make_constant(node.lineno, compute(
+                    Interpreter.allocate, node.name, shape))
+                if folded is not None:
+                    self.eliminated += len(arguments)
+                return folded
+
+
+class DeadCodeEliminator(Transformer):
+    """Removes the statements of a block that follow a break, continue or
+    return, and the assignments by = to variables that are never read,
+    when their value cannot fail to evaluate. Reads in unreachable
+    statements count, so that one pass over the tree does both. Each
+    removal is described by a line in transformations."""
+
+    def __init__(self):
+        super(DeadCodeEliminator, self).__init__()
+        self.transformations = []
+        # names assigned but never read
+        self.unused = None
+
+    def eliminate(self, ast):
+        assigned, read = variables(ast)
+        self.unused = assigned - read
+        return self.transform(ast)
+
+    def visit_Instructions(self, node):
+        nodes = node.nodes
+        new_nodes = []
+        for n in nodes:
+            if new_nodes and isinstance(new_nodes[-1], (AST.FlowKeyword, AST.Return)):
+                self.transformations.append(
+                    "line {}: removed unreachable statement".format(n.lineno))
+                continue
+            if (isinstance(n, AST.Assignment) and n.op == '=' and
+                    isinstance(n.left, AST.Variable) and
+                    n.left.name in self.unused and safe(n.right)):
+                self.transformations.append(
+                    "line {}: removed unused assignment to {}".format(n.lineno, n.left.name))
+                continue
+            new, = yield n
+            new_nodes.append(new)
+        if len(new_nodes) != len(nodes) or any(
+                new is not n for new, n in zip(new_nodes, nodes)):
+            node = AST.Instructions(node.lineno, new_nodes)
+        yield node,
+
+
+STATEMENTS = (AST.Assignment, AST.Print, AST.Return, AST.FlowKeyword,
+              AST.While, AST.For, AST.If, AST.Error)
+
+
+def hoistable(node):
+    """Whether node is an expression that may be hoisted; references are
+    not, as they may be the target of an assignment"""
+    return (isinstance(node, (AST.BinExpr, AST.UnaryExpr, AST.FunctionCall,
+                              AST.Vector)) and
+            not isinstance(node, (AST.Assignment, AST.Comparison)))
+
+
+def costly(node):
+    """Whether the expression node may build arrays or multiply matrices;
+    for numbers alone, testing whether a hoisted value is set costs about
+    as much as computing it again"""
+    for n in walk(node):
+        if isinstance(n, (AST.FunctionCall, AST.Vector, AST.Constant)):
+            return True
+        if (isinstance(n, AST.BinExpr) and n.op == '*' and
+                not constant(n.left) and not constant(n.right)):
+            return True
+    return False
+
+
+class LoopOptimizer(Transformer):
+    """Hoists the costly expressions of a loop that read no variable the
+    loop assigns out of it, innermost loops first.
+
+    The value of such an expression is the same in every iteration, so it
+    is computed once per run of the loop, into a variable $tN, the first
+    time a statement using it runs. A variable $hN tells whether it has
+    been computed: before the loop, $hN = 0 and $tN = 0 are added, then
+    the statement is preceded by if ($hN == 0) { $tN = ...; $hN = 1; }.
+    The expression is thus still evaluated where it was, on the line it
+    was, and never when the program would not have evaluated it. Only the
+    expressions of statements in a block of the loop are hoisted, and only
+    out of loops in a block. The names of the variables cannot be those
+    of program variables.
+
+    Each hoisted expression is described by a line in transformations.
+    """
+
+    def __init__(self):
+        super(LoopOptimizer, self).__init__()
+        self.transformations = []
+        self.variables = 0
+
+    def optimize(self, ast):
+        return self.transform(ast)
+
+    def visit_Instructions(self, node):
+        nodes = node.nodes
+        new_nodes = []
+        for n in nodes:
+            new, = yield n
+            if isinstance(new, (AST.For, AST.While)):
+                new, prelude = self.hoist(new)
+                new_nodes.extend(prelude)
+            new_nodes.append(new)
+        if len(new_nodes) != len(nodes) or any(
+                new is not n for new, n in zip(new_nodes, nodes)):
+            node = AST.Instructions(node.lineno, new_nodes)
+        yield node,
+
+    def hoist(self, loop):
+        """Returns the loop with its invariant expressions hoisted, and the
+        statements to run before it"""
+        hoister = Hoister(self, loop)
+        body = hoister.transform(loop.body)
+        if body is loop.body:
+            return loop, []
+        if isinstance(loop, AST.For):
+            loop = AST.For(loop.lineno, loop.iterator, loop.range.start,
+                           loop.range.end, body)
+        else:
+            loop = AST.While(loop.lineno, loop.condition, body)
+        prelude = []
+        for value, flag in sorted(hoister.variables.values()):
+            for name in (flag, value):
+                prelude.append(AST.Assignment(
+                    loop.lineno, '=', AST.Variable(loop.lineno, name),
+                    AST.IntNum(loop.lineno, 0)))
+        return loop, prelude
+
+
+class Hoister(Transformer):
+    """Replaces the hoisted expressions of the body of a loop for
+    LoopOptimizer, and inserts the statements computing them"""
+
+    def __init__(self, optimizer, loop):
+        super(Hoister, self).__init__()
+        self.optimizer = optimizer
+        self.loop = loop
+        self.assigned = assigned(loop)
+        # signature of a hoisted expression -> (value name, flag name)
+        self.variables = {}
+        # the statement of a block about to be visited
+        self.block_statement = None
+        # (statement, signatures of the expressions hoisted from it, the
+        # statements computing them) of the statements being visited,
+        # innermost last; the last two are None for statements that are
+        # not directly in a block, which nothing is hoisted from
+        self.statements = []
+        # statements computing the expressions of the last statement left
+        self.guards = None
+
+    def visit_Instructions(self, node):
+        nodes = node.nodes
+        new_nodes = []
+        for n in nodes:
+            self.block_statement = n
+            new, = yield n
+            new_nodes.extend(self.guards)
+            new_nodes.append(new)
+        if len(new_nodes) != len(nodes) or any(
+                new is not n for new, n in zip(new_nodes, nodes)):
+            node = AST.Instructions(node.lineno, new_nodes)
+        yield node,
+
+    def enter(self, node):
+        if isinstance(node, STATEMENTS):
+            if node is self.block_statement:
+                self.statements.append((node, set(), []))
+            else:
+                self.statements.append((node, None, None))
+            return None
+        if not self.statements or not hoistable(node):
+            return None
+        statement, hoisted, guards = self.statements[-1]
+        if (hoisted is None or not costly(node) or
+                not reads(node).isdisjoint(self.assigned)):
+            return None
+        key = signature(node)
+        names = self.variables.get(key)
+        if names is None:
+            optimizer = self.optimizer
+            optimizer.variables += 1
+            names = self.variables[key] = ('$t{}'.format(optimizer.variables),
+                                           '$h{}'.format(optimizer.variables))
+            optimizer.transformations.append(
+                "line {}: hoisted an expression out of the loop of line {}".format(
+                    statement.lineno, self.loop.lineno))
+        value, flag = names
+        if key not in hoisted:
+            hoisted.add(key)
+            lineno = statement.lineno
+            guards.append(AST.If(
+                lineno,
+                AST.Comparison(lineno, '==', AST.Variable(lineno, flag), AST.IntNum(lineno, 0)),
+                AST.Instructions(lineno, [
+                    AST.Assignment(lineno, '=', AST.Variable(lineno, value), node),
+                    AST.Assignment(lineno, '=', AST.Variable(lineno, flag), AST.IntNum(lineno, 1))])))
+        return AST.Variable(node.lineno, value)
+
+    def leave(self, node):
+        if isinstance(node, STATEMENTS):
+            _, _, self.guards = self.statements.pop()
+            if self.guards is None:
+                self.guards = []
+        return node
@@ -1,37 +1,80 @@
 #!/usr/bin/env python2
 
 
+class Symbol(object):
+    pass
+
+
 class VariableSymbol(Symbol):
 
     def __init__(self, name, type):
-        pass
-    #
+        self.name = name
+        self.type = type
 
 
 class SymbolTable(object):
+    """Symbols of nested scopes.
+
+    Instead of a dict per scope, the table keeps for every name the stack of
+    its bindings, innermost last, and for every scope the names bound in it.
+    get is then a single dict lookup whatever the depth, pushScope copies
+    nothing and popScope only touches the names bound in the scope it ends.
+    Names not bound in the table are looked up in the parent table.
+    """
 
     def __init__(self, parent, name): # parent scope and symbol table name
-        pass
-    #
+        self.parent = parent
+        self.name = name
+        # name -> bindings of name, innermost last
+        self.bindings = {}
+        # (scope name, names bound in the scope), innermost last
+        self.scopes = [(name, set())]
 
     def put(self, name, symbol): # put variable symbol or fundef under <name> entry
-        pass
-    #
+        names = self.scopes[-1][1]
+        stack = self.bindings.setdefault(name, [])
+        if name in names:
+            stack[-1] = symbol
+        else:
+            names.add(name)
+            stack.append(symbol)
+
+    def update(self, name, symbol):
+        """Rebinds name in the innermost scope binding it, puts it in the
+        current scope if none does"""
+        stack = self.bindings.get(name)
+        if stack:
+            stack[-1] = symbol
+        elif self.parent is not None and self.parent.get(name) is not None:
+            self.parent.update(name, symbol)
+        else:
+            self.put(name, symbol)
 
     def get(self, name): # get variable symbol or fundef from <name> entry
-        pass
-    #
+        stack = self.bindings.get(name)
+        if stack:
+            return stack[-1]
+        if self.parent is not None:
+            return self.parent.get(name)
+        return None
 
     def getParentScope(self):
-        pass
-    #
+        """Name of the scope enclosing the current one, None for the outermost
+        scope of the table"""
+        if len(self.scopes) < 2:
+            return None
+        return self.scopes[-2][0]
 
     def pushScope(self, name):
-        pass
-    #
+        self.scopes.append((name, set()))
 
     def popScope(self):
-        pass
-    #
-
-
+        if len(self.scopes) < 2:
+            raise IndexError("popScope of the outermost scope of {}".format(self.name))
+        _, names = self.scopes.pop()
+        bindings = self.bindings
+        for name in names:
+            stack = bindings[name]
+            stack.pop()
+            if not stack:
+                del bindings[name]
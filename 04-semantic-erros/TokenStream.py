@@ -0,0 +1,150 @@
+#!/usr/bin/env python2
+"""Token streams stored in a binary file that is read through mmap.
+
+The file holds the source text, then one column per token attribute and
+the names of the token types, and ends with a fixed size trailer:
+
+    source           the lexed text, at offset 0
+    type ids         one byte per token, an index into the type names
+    lines            unsigned 32 bit line numbers
+    starts, ends     unsigned 32 bit offsets of the token text in source
+    type names       the type names, separated by spaces
+    trailer          TRAILER: magic, version, token count, source size
+                     and size of the type names
+
+Columns start at offsets aligned to ALIGNMENT and numbers are little
+endian. As the source comes first, token offsets are offsets into the
+whole file, and a TokenReader can use its mapping as the lexer input.
+The offsets limit the source to MAX_SOURCE_SIZE bytes.
+"""
+
+from array import array
+from itertools import izip
+import mmap
+import struct
+import sys
+import numpy as np
+import scanner
+from FastLexer import FastLexer, Token
+
+MAGIC = b'MTOK'
+VERSION = 2
+TRAILER = struct.Struct('<4sHxxQQI')
+ALIGNMENT = 8
+MAX_SOURCE_SIZE = 2 ** 32 - 1
+
+# type code of every column after the type ids, and its type in the file
+COLUMNS = ('I', 'I', 'I')
+TYPES = ('<u1',) + ('<u4',) * len(COLUMNS)
+
+
+def align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_column(stream, offset, column):
+    stream.write(b'\0' * (align(offset) - offset))
+    if sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+    column.tofile(stream)
+    return align(offset) + column.itemsize * len(column)
+
+
+def write_tokens(text, stream):
+    """Lexes text and writes its tokens to a binary stream, returns the
+    number of tokens"""
+    if len(text) > MAX_SOURCE_SIZE:
+        raise ValueError("source of {0} bytes is too large for a token "
+                         "stream".format(len(text)))
+    type_names = list(scanner.tokens) + list(scanner.literals)
+    type_ids = dict((name, index) for index, name in enumerate(type_names))
+    columns = [array('B')] + [array(typecode) for typecode in COLUMNS]
+    kinds, lines, starts, ends = columns
+    lexer = FastLexer()
+    lexer.input(text)
+    for token in lexer:
+        kinds.append(type_ids[token.type])
+        lines.append(token.lineno)
+        starts.append(token.lexpos)
+        ends.append(token.end)
+
+    stream.write(text)
+    offset = len(text)
+    for column in columns:
+        offset = write_column(stream, offset, column)
+    names = ' '.join(type_names).encode('ascii')
+    stream.write(names)
+    stream.write(TRAILER.pack(MAGIC, VERSION, len(kinds), len(text), len(names)))
+    return len(kinds)
+
+
+class TokenReader(object):
+    """Lexer replaying the tokens of a file written by write_tokens, for
+    the parser to use in place of scanner.lexer without any input.
+
+    The columns are arrays over the mapping, and tokens are made from
+    BATCH_SIZE of their rows at a time, so a reader holds no copy of the
+    file."""
+
+    BATCH_SIZE = 1024
+
+    def __init__(self, file):
+        self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mapping) < TRAILER.size:
+            raise ValueError("not a token stream")
+        magic, version, count, source_size, names_size = TRAILER.unpack_from(
+            self.mapping, len(self.mapping) - TRAILER.size)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a token stream")
+
+        # number of tokens; a reader has no __len__, as the parser takes
+        # an empty lexer for a missing one
+        self.count = count
+        offset = source_size
+        columns = []
+        for dtype in TYPES:
+            offset = align(offset)
+            column = np.frombuffer(self.mapping, dtype, count, offset)
+            columns.append(column)
+            offset += column.nbytes
+        self.kinds, self.lines, self.starts, self.ends = columns
+        self.type_names = self.mapping[offset:offset + names_size].split(' ')
+        self.converters = [{'INTNUM': int, 'FLOATNUM': float}.get(name)
+                           for name in self.type_names]
+
+        # the source is at the start of the mapping, so the mapping serves
+        # as the lexer input for error messages
+        self.lexdata = self.mapping
+        self.rewind()
+
+    def rewind(self):
+        """Starts over from the first token"""
+        self.tokens = self.make_tokens()
+
+    def token(self):
+        return next(self.tokens, None)
+
+    def make_tokens(self):
+        mapping, type_names, converters = self.mapping, self.type_names, self.converters
+        new = Token.__new__
+        for first in xrange(0, self.count, self.BATCH_SIZE):
+            rows = slice(first, first + self.BATCH_SIZE)
+            # tolist gives ints, which index the mapping faster
+            for kind, lineno, start, end in izip(
+                    self.kinds[rows].tolist(), self.lines[rows].tolist(),
+                    self.starts[rows].tolist(), self.ends[rows].tolist()):
+                token = new(Token)
+                token.type = type_names[kind]
+                token.value = mapping[start:end]
+                if converters[kind] is not None:
+                    token.value = converters[kind](token.value)
+                token.lineno = lineno
+                token.lexpos = start
+                token.end = end
+                yield token
+
+    def close(self):
+        # the columns must go before the mapping they are arrays over
+        self.kinds = self.lines = self.starts = self.ends = None
+        self.mapping.close()
@@ -1,4 +1,5 @@
 from __future__ import print_function
+import sys
 import AST
 
 
@@ -11,128 +12,147 @@ def addToClass(cls):
 
 
 class TreePrinter:
+    """Trees are printed with an explicit stack rather than recursion, so
+    that arbitrarily deep trees can be printed. Each node class defines
+    printItems, returning (indent, item) pairs in output order, where an
+    item is either a line of text or a node to be expanded in turn.
+
+    Lines are written to the stream in chunks of CHUNK_LINES lines."""
+
+    CHUNK_LINES = 4096
+
+    # indent prefixes by depth, cached up to a bounded depth
+    indents = [""]
+    MAX_CACHED_INDENT = 256
 
     @classmethod
-    def makeIndent(_self, indent):
-        return ''.join("|  " * indent)
+    def makeIndent(cls, indent):
+        if indent < len(cls.indents):
+            return cls.indents[indent]
+        if indent > cls.MAX_CACHED_INDENT:
+            return "|  " * indent
+        while len(cls.indents) <= indent:
+            cls.indents.append(cls.indents[-1] + "|  ")
+        return cls.indents[indent]
+
+    @addToClass(AST.Node)
+    def treeLines(self, indent=0):
+        """Yields the lines of the tree, each ending with a newline"""
+        makeIndent = TreePrinter.makeIndent
+        Node = AST.Node
+        stack = [(indent, self)]
+        while stack:
+            indent, item = stack.pop()
+            if isinstance(item, Node):
+                stack.extend(reversed(item.printItems(indent)))
+            else:
+                yield makeIndent(indent) + item + "\n"
 
     @addToClass(AST.Node)
-    def printTree(self, indent=0):
+    def printTree(self, indent=0, stream=None):
+        if stream is None:
+            stream = sys.stdout
+        chunk = []
+        for line in self.treeLines(indent):
+            chunk.append(line)
+            if len(chunk) == TreePrinter.CHUNK_LINES:
+                stream.write(''.join(chunk))
+                del chunk[:]
+        stream.write(''.join(chunk))
+
+    @addToClass(AST.Node)
+    def printItems(self, indent):
         raise Exception("printTree not defined in class " +
                         self.__class__.__name__)
 
     @addToClass(AST.Instructions)
-    def printTree(self, indent=0):
-        for n in self.nodes:
-            n.printTree(indent)
+    def printItems(self, indent):
+        return [(indent, n) for n in self.nodes]
 
     @addToClass(AST.FlowKeyword)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + self.keyword)
+    def printItems(self, indent):
+        return [(indent, self.keyword)]
 
     @addToClass(AST.Print)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + 'PRINT')
-        for arg in self.arguments:
-            arg.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, 'PRINT')] + [(indent + 1, arg) for arg in self.arguments]
 
     @addToClass(AST.Return)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + 'RETURN')
+    def printItems(self, indent):
+        items = [(indent, 'RETURN')]
         if self.value is not None:
-            self.value.printTree(indent + 1)
+            items.append((indent + 1, self.value))
+        return items
 
     @addToClass(AST.String)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + self.value)
+    def printItems(self, indent):
+        return [(indent, self.value)]
 
     @addToClass(AST.Vector)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + "VECTOR")
-        for e in self.elements:
-            e.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, "VECTOR")] + [(indent + 1, e) for e in self.elements]
 
     @addToClass(AST.Matrix)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + "MATRIX")
-        for e in self.elements:
-            e.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, "MATRIX")] + [(indent + 1, e) for e in self.elements]
 
     @addToClass(AST.Reference)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + "REF")
-        self.name.printTree(indent + 1)
-        for c in self.coords:
-            c.printTree(indent + 1)
+    def printItems(self, indent):
+        return ([(indent, "REF"), (indent + 1, self.name)] +
+                [(indent + 1, c) for c in self.coords])
 
     @addToClass(AST.FunctionCall)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + self.name)
-        for e in self.arguments:
-            e.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, self.name)] + [(indent + 1, e) for e in self.arguments]
 
     @addToClass(AST.While)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + 'WHILE')
-        self.condition.printTree(indent + 1)
-        self.body.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, 'WHILE'), (indent + 1, self.condition),
+                (indent + 1, self.body)]
 
     @addToClass(AST.For)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + 'FOR')
-        self.iterator.printTree(indent + 1)
-        self.range.printTree(indent + 1)
-        self.body.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, 'FOR'), (indent + 1, self.iterator),
+                (indent + 1, self.range), (indent + 1, self.body)]
 
     @addToClass(AST.Range)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + 'RANGE')
-        self.start.printTree(indent + 1)
-        self.end.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, 'RANGE'), (indent + 1, self.start),
+                (indent + 1, self.end)]
 
     @addToClass(AST.Variable)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + self.name)
+    def printItems(self, indent):
+        return [(indent, self.name)]
 
     @addToClass(AST.If)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + 'IF')
-        self.condition.printTree(indent + 1)
-        print(TreePrinter.makeIndent(indent) + 'THEN')
-        self.body.printTree(indent + 1)
+    def printItems(self, indent):
+        items = [(indent, 'IF'), (indent + 1, self.condition),
+                 (indent, 'THEN'), (indent + 1, self.body)]
         if self.else_body is not None:
-            print(TreePrinter.makeIndent(indent) + 'ELSE')
-            self.else_body.printTree(indent + 1)
+            items += [(indent, 'ELSE'), (indent + 1, self.else_body)]
+        return items
 
     @addToClass(AST.BinExpr)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + self.op)
-        self.left.printTree(indent + 1)
-        self.right.printTree(indent + 1)
-
-    @addToClass(AST.ArithmeticOperation)
-    def printTree(self, indent=0):
-        AST.BinExpr.printTree(self, indent)
-
-    @addToClass(AST.Assignment)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + self.op)
-        self.left.printTree(indent + 1)
-        self.right.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, self.op), (indent + 1, self.left),
+                (indent + 1, self.right)]
 
     @addToClass(AST.IntNum)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + str(self.value))
+    def printItems(self, indent):
+        return [(indent, str(self.value))]
 
     @addToClass(AST.FloatNum)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + str(self.value))
+    def printItems(self, indent):
+        return [(indent, str(self.value))]
+
+    @addToClass(AST.Constant)
+    def printItems(self, indent):
+        return [(indent, str(self.value.tolist()))]
 
     @addToClass(AST.UnaryExpr)
-    def printTree(self, indent=0):
-        print(TreePrinter.makeIndent(indent) + self.operation)
-        self.operand.printTree(indent + 1)
+    def printItems(self, indent):
+        return [(indent, self.operation), (indent + 1, self.operand)]
 
     @addToClass(AST.Error)
-    def printTree(self, indent=0):
-        pass
+    def printItems(self, indent):
+        return []
@@ -1,98 +1,228 @@
 #!/usr/bin/python
 
-from collections import defaultdict
 from copy import copy
+import sys
+from types import GeneratorType
 import AST
-
-allowed_operations = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: "")))
-
-allowed_operations["+"]["int"]["int"] = "int"
-allowed_operations["+"]["float"]["int"] = "float"
-allowed_operations["+"]["int"]["float"] = "float"
-allowed_operations["+"]["vector"]["vector"] = "vector"
-allowed_operations["+"]["matrix"]["matrix"] = "matrix"
-
-allowed_operations["-"]["int"]["int"] = "int"
-allowed_operations["-"]["float"]["int"] = "float"
-allowed_operations["-"]["int"]["float"] = "float"
-allowed_operations["-"]["vector"]["vector"] = "vector"
-allowed_operations["-"]["matrix"]["matrix"] = "matrix"
-
-allowed_operations["*"]["int"]["int"] = "int"
-allowed_operations["*"]["float"]["int"] = "float"
-allowed_operations["*"]["int"]["float"] = "float"
-allowed_operations["*"]["vector"]["vector"] = "vector"
-allowed_operations["*"]["matrix"]["matrix"] = "matrix"
-allowed_operations["*"]["vector"]["int"] = "vector"
-allowed_operations["*"]["int"]["vector"] = "vector"
-allowed_operations["*"]["matrix"]["int"] = "matrix"
-allowed_operations["*"]["int"]["matrix"] = "matrix"
-allowed_operations["*"]["vector"]["float"] = "vector"
-allowed_operations["*"]["float"]["vector"] = "vector"
-allowed_operations["*"]["matrix"]["float"] = "matrix"
-allowed_operations["*"]["float"]["matrix"] = "matrix"
-
-allowed_operations["/"]["int"]["int"] = "float"
-allowed_operations["/"]["float"]["int"] = "float"
-allowed_operations["/"]["int"]["float"] = "float"
-allowed_operations["/"]["vector"]["int"] = "vector"
-allowed_operations["/"]["int"]["vector"] = "vector"
-allowed_operations["/"]["matrix"]["int"] = "matrix"
-allowed_operations["/"]["int"]["matrix"] = "matrix"
-allowed_operations["/"]["vector"]["int"] = "vector"
-allowed_operations["/"]["matrix"]["int"] = "matrix"
-allowed_operations["/"]["vector"]["float"] = "vector"
-allowed_operations["/"]["matrix"]["float"] = "matrix"
-
-allowed_operations[".+"]["matrix"]["int"] = "matrix"
-allowed_operations[".+"]["matrix"]["float"] = "matrix"
-allowed_operations[".+"]["vector"]["int"] = "vector"
-allowed_operations[".+"]["vector"]["float"] = "vector"
-
-allowed_operations[".-"]["matrix"]["int"] = "matrix"
-allowed_operations[".-"]["matrix"]["float"] = "matrix"
-allowed_operations[".-"]["vector"]["int"] = "vector"
-allowed_operations[".-"]["vector"]["float"] = "vector"
-
-allowed_operations[".*"]["matrix"]["int"] = "matrix"
-allowed_operations[".*"]["matrix"]["float"] = "matrix"
-allowed_operations[".*"]["vector"]["int"] = "vector"
-allowed_operations[".*"]["vector"]["float"] = "vector"
-
-allowed_operations["./"]["matrix"]["int"] = "matrix"
-allowed_operations["./"]["matrix"]["float"] = "matrix"
-allowed_operations["./"]["vector"]["int"] = "vector"
-allowed_operations["./"]["vector"]["float"] = "vector"
+from SymbolTable import SymbolTable
+
+# (operator, left type, right type) -> result type of every allowed operation
+allowed_operations = {}
+
+allowed_operations["+", "int", "int"] = "int"
+allowed_operations["+", "float", "int"] = "float"
+allowed_operations["+", "int", "float"] = "float"
+allowed_operations["+", "float", "float"] = "float"
+allowed_operations["+", "vector", "vector"] = "vector"
+allowed_operations["+", "matrix", "matrix"] = "matrix"
+
+allowed_operations["-", "int", "int"] = "int"
+allowed_operations["-", "float", "int"] = "float"
+allowed_operations["-", "int", "float"] = "float"
+allowed_operations["-", "float", "float"] = "float"
+allowed_operations["-", "vector", "vector"] = "vector"
+allowed_operations["-", "matrix", "matrix"] = "matrix"
+
+allowed_operations["*", "int", "int"] = "int"
+allowed_operations["*", "float", "int"] = "float"
+allowed_operations["*", "int", "float"] = "float"
+allowed_operations["*", "float", "float"] = "float"
+allowed_operations["*", "vector", "vector"] = "vector"
+allowed_operations["*", "matrix", "matrix"] = "matrix"
+allowed_operations["*", "vector", "int"] = "vector"
+allowed_operations["*", "int", "vector"] = "vector"
+allowed_operations["*", "matrix", "int"] = "matrix"
+allowed_operations["*", "int", "matrix"] = "matrix"
+allowed_operations["*", "vector", "float"] = "vector"
+allowed_operations["*", "float", "vector"] = "vector"
+allowed_operations["*", "matrix", "float"] = "matrix"
+allowed_operations["*", "float", "matrix"] = "matrix"
+
+allowed_operations["/", "int", "int"] = "float"
+allowed_operations["/", "float", "int"] = "float"
+allowed_operations["/", "int", "float"] = "float"
+allowed_operations["/", "float", "float"] = "float"
+allowed_operations["/", "vector", "int"] = "vector"
+allowed_operations["/", "int", "vector"] = "vector"
+allowed_operations["/", "matrix", "int"] = "matrix"
+allowed_operations["/", "int", "matrix"] = "matrix"
+allowed_operations["/", "vector", "float"] = "vector"
+allowed_operations["/", "matrix", "float"] = "matrix"
+
+allowed_operations[".+", "matrix", "int"] = "matrix"
+allowed_operations[".+", "matrix", "float"] = "matrix"
+allowed_operations[".+", "vector", "int"] = "vector"
+allowed_operations[".+", "vector", "float"] = "vector"
+allowed_operations[".+", "vector", "vector"] = "vector"
+allowed_operations[".+", "matrix", "matrix"] = "matrix"
+
+allowed_operations[".-", "matrix", "int"] = "matrix"
+allowed_operations[".-", "matrix", "float"] = "matrix"
+allowed_operations[".-", "vector", "int"] = "vector"
+allowed_operations[".-", "vector", "float"] = "vector"
+allowed_operations[".-", "vector", "vector"] = "vector"
+allowed_operations[".-", "matrix", "matrix"] = "matrix"
+
+allowed_operations[".*", "matrix", "int"] = "matrix"
+allowed_operations[".*", "matrix", "float"] = "matrix"
+allowed_operations[".*", "vector", "int"] = "vector"
+allowed_operations[".*", "vector", "float"] = "vector"
+allowed_operations[".*", "vector", "vector"] = "vector"
+allowed_operations[".*", "matrix", "matrix"] = "matrix"
+
+allowed_operations["./", "matrix", "int"] = "matrix"
+allowed_operations["./", "matrix", "float"] = "matrix"
+allowed_operations["./", "vector", "int"] = "vector"
+allowed_operations["./", "vector", "float"] = "vector"
+allowed_operations["./", "vector", "vector"] = "vector"
+allowed_operations["./", "matrix", "matrix"] = "matrix"
+
+# comparisons of numbers give an int, 0 or 1
+for op in ("<", ">", "==", "!=", "<=", ">="):
+    for left in ("int", "float"):
+        for right in ("int", "float"):
+            allowed_operations[op, left, right] = "int"
 
 op_to_string = {
     '+': 'ADD',
     '-': 'SUB',
     '*': 'MUL',
     '/': 'DIV',
+    '.+': 'DOTADD',
+    '.-': 'DOTSUB',
+    '.*': 'DOTMUL',
+    './': 'DOTDIV',
+    '<': 'LT',
+    '>': 'GT',
+    '==': 'EQ',
+    '!=': 'NEQ',
+    '<=': 'LEQ',
+    '>=': 'GEQ',
 }
 
+# types interned to indices into the rows of operation_types
+TYPES = ("int", "float", "vector", "matrix")
+TYPE_IDS = dict((name, index) for index, name in enumerate(TYPES))
+
+# operation_types[op][left][right] is the result type of an operation, or
+# "" if it is not allowed, for every operator of the grammar; rows are
+# tuples indexed by type id, so lookups are read-only and allocate nothing
+operation_types = dict(
+    (op, tuple(tuple(allowed_operations.get((op, left, right), "")
+                     for right in TYPES)
+               for left in TYPES))
+    for op in op_to_string)
+
+
+def result_type(op, left, right):
+    """Type of the result of op on values of types left and right, "" if
+    the operation is not allowed"""
+    return operation_types[op][TYPE_IDS[left]][TYPE_IDS[right]]
+
 
 class NodeVisitor(object):
     loop = 0
-    variables = defaultdict(lambda: None)
+
+    def __init__(self):
+        # bound visit methods by node class
+        self.handlers = {}
 
     def visit(self, node):
-        method = 'visit_' + node.__class__.__name__
-        visitor = getattr(self, method)
-        return visitor(node)
+        """Visits node without recursing through the Python stack.
+
+        A visit method may be a generator: yielding a node visits that node
+        and sends back its result, and the first value yielded that is not
+        a node becomes the method's own result (None if there is none). An
+        exception raised by the visit of a yielded node is raised in the
+        generator at its yield.
+        """
+        value = self.handler(node)(node)
+        if not isinstance(value, GeneratorType):
+            return value
+        stack = [value]
+        value = error = None
+        while stack:
+            try:
+                if error is None:
+                    item = stack[-1].send(value)
+                else:
+                    thrown, error = error, None
+                    item = stack[-1].throw(*thrown)
+            except StopIteration:
+                stack.pop()
+                value = None
+                continue
+            except Exception:
+                stack.pop()
+                if not stack:
+                    raise
+                error = sys.exc_info()
+                continue
+            if isinstance(item, AST.Node):
+                try:
+                    value = self.handler(item)(item)
+                except Exception:
+                    error = sys.exc_info()
+                    continue
+                if isinstance(value, GeneratorType):
+                    stack.append(value)
+                    value = None
+            else:
+                stack.pop()
+                value = item
+        return value
+
+    def handler(self, node):
+        try:
+            return self.handlers[node.__class__]
+        except KeyError:
+            handler = self.handlers[node.__class__] = self.find_handler(node.__class__)
+            return handler
+
+    def find_handler(self, cls):
+        """Returns the visit method of the closest class in the MRO of cls"""
+        for base in cls.__mro__:
+            handler = getattr(self, 'visit_' + base.__name__, None)
+            if handler is not None:
+                return handler
+        raise AttributeError("{} has no visit method for {}".format(
+            self.__class__.__name__, cls.__name__))
 
 
 class TypeChecker(NodeVisitor):
 
+    def __init__(self, results=None):
+        super(TypeChecker, self).__init__()
+        # kept per instance so that separate checks do not share variables
+        self.symbols = SymbolTable(None, "global")
+        # results of shared subtrees checked beforehand, by node, such as
+        # the results of an Interner.Interner
+        self.results = results
+        # number of errors reported
+        self.errors = 0
+
+    def find_handler(self, cls):
+        handler = super(TypeChecker, self).find_handler(cls)
+        if self.results is None:
+            return handler
+        results = self.results
+
+        def visit(node):
+            try:
+                return results[node]
+            except KeyError:
+                return handler(node)
+        return visit
+
     def visit_Instructions(self, node):
         # print("visit_Instructions")
         for n in node.nodes:
-            self.visit(n)
+            yield n
 
     def visit_FlowKeyword(self, node):
         # print("visit_Flowkeyword")
         if self.loop == 0:
-            TypeChecker.print_error(node, "flow keyword {} outside loop".format(node.keyword))
+            self.print_error(node, "flow keyword {} outside loop".format(node.keyword))
 
     def visit_Print(self, node):
         # print("visit_Print")
@@ -113,7 +243,7 @@ class TypeChecker(NodeVisitor):
         if all(map(lambda x: x == size2, sizes)):
             return self.Variable("matrix", [size1, size2])
         else:
-            TypeChecker.print_error(node, "vectors with different sizes in matrix initialization")
+            self.print_error(node, "vectors with different sizes in matrix initialization")
             return None
 
     def visit_Vector(self, node):
@@ -122,17 +252,17 @@ class TypeChecker(NodeVisitor):
 
     def visit_Reference(self, node):
         # print("visit_Reference")
-        v = self.variables[node.name.name]
+        v = self.symbols.get(node.name.name)
         if not v:
-            TypeChecker.print_error(node, "undefined variable {}".format(node.name.name))
+            self.print_error(node, "undefined variable {}".format(node.name.name))
             return None
         if len(node.coords) > len(v.size):
-            TypeChecker.print_error(node, "to many dimensions in vector reference")
+            self.print_error(node, "to many dimensions in vector reference")
             return None
         error = False
         for coord, size in zip(node.coords, v.size):
             if isinstance(coord, AST.IntNum) and coord.value >= size:
-                TypeChecker.print_error(node, "reference {} is over vector size {}".format(coord.value, size))
+                self.print_error(node, "reference {} is over vector size {}".format(coord.value, size))
                 error = True
         if error:
             return None
@@ -151,13 +281,16 @@ class TypeChecker(NodeVisitor):
     def visit_While(self, node):
         # print("visit_While")
         self.loop += 1
-        self.visit(node.body)
+        yield node.body
         self.loop -= 1
 
     def visit_For(self, node):
         # print("visit_For")
         self.loop += 1
-        self.visit(node.body)
+        # loops are not scopes: the iterator is assigned like any variable
+        # and keeps its last value after the loop
+        self.symbols.update(node.iterator.name, self.Variable("int", [], node.iterator.name))
+        yield node.body
         self.loop -= 1
 
     def visit_Range(self, node):
@@ -166,7 +299,7 @@ class TypeChecker(NodeVisitor):
 
     def visit_Variable(self, node):
         # print("visit_Variable")
-        return self.variables[node.name]
+        return self.symbols.get(node.name)
 
     def visit_If(self, node):
         # print("visit_if")
@@ -175,47 +308,45 @@ class TypeChecker(NodeVisitor):
     def visit_BinExpr(self, node):
         # print("visit_BinExpr")
 
-        var1 = self.visit(node.left)
-        var2 = self.visit(node.right)
+        var1 = yield node.left
+        var2 = yield node.right
         if not var1:
-            TypeChecker.print_error(node, "undefined variable {}".format(node.left.name))
-            return None
+            self.print_error(node, "undefined variable {}".format(node.left.name))
+            return
         if not var2:
-            TypeChecker.print_error(node, "undefined variable {}".format(node.right.name))
-            return None
+            self.print_error(node, "undefined variable {}".format(node.right.name))
+            return
         op = node.op
-        newtype = allowed_operations[op[0]][var1.type][var2.type]
+        newtype = result_type(op, var1.type, var2.type)
         if newtype:
             new_var = copy(var1)
             new_var.type = newtype
-            return new_var
+            # a number times a matrix has the size of the matrix
+            new_var.size = var1.size or var2.size
+            yield new_var
         else:
-            TypeChecker.print_error(node, "cannot {} {} and {}".format(op_to_string[op], var1.type, var2.type))
-            return None
-
-    def visit_ArithmeticOperation(self, node):
-        # print("visit_ArithmeticOperation")
-        return self.visit_BinExpr(node)
+            self.print_error(node, "cannot {} {} and {}".format(op_to_string[op], var1.type, var2.type))
 
     def visit_Assignment(self, node):
         # print("visit_Assignment")
-        var1 = self.visit(node.left)
-        var2 = self.visit(node.right)
+        var1 = yield node.left
+        var2 = yield node.right
         if not var2:
-            return None
+            return
         name = node.left.name
         op = node.op
         if op == "=":
-            self.variables[name] = self.Variable(var2.type, var2.size, name)
+            self.symbols.update(name, self.Variable(var2.type, var2.size, name))
         else:
             if not var1:
-                TypeChecker.print_error(node, "undefined variable {}".format(name))
-                return None
-            newtype = allowed_operations[op[0]][var1.type][var2.type]
+                self.print_error(node, "undefined variable {}".format(name))
+                return
+            # compound assignments, such as +=, apply the operator before =
+            newtype = result_type(op[:-1], var1.type, var2.type)
             if newtype:
-                self.variables[name] = self.Variable(newtype, var2.size, name)
+                self.symbols.update(name, self.Variable(newtype, var1.size or var2.size, name))
             else:
-                TypeChecker.print_error(node, "cannot assign {} to {}".format(var2.type, var1.type))
+                self.print_error(node, "cannot assign {} to {}".format(var2.type, var1.type))
 
     def visit_IntNum(self, node):
         # print("visit_IntNum")
@@ -227,18 +358,17 @@ class TypeChecker(NodeVisitor):
 
     def visit_UnaryExpr(self, node):
         # print("visit_UnaryExpr")
-        pass
-
-    def visit_Comparison(self, node):
-        # print("visit_Comparison")
-        pass
+        var = yield node.operand
+        if var and node.operation == 'TRANSPOSE':
+            var = self.Variable(var.type, var.size[::-1], var.name)
+        yield var
 
     def visit_Error(self, node):
         # print("visit_Error")
         pass
 
-    @staticmethod
-    def print_error(node, error):
+    def print_error(self, node, error):
+        self.errors += 1
         print("Error in line {}: {}".format(node.lineno, error))
 
     class Variable(object):
@@ -0,0 +1,124 @@
+#!/usr/bin/env python2
+
+from __future__ import print_function
+import numpy as np
+from Bytecode import (
+    LOAD_CONST, LOAD, STORE, COPY, COPY_VIEW, BINARY, AUGMENT, NEGATE,
+    TRANSPOSE, BUILD_VECTOR, CALL, INDEX, LOAD_ITEM, STORE_ITEM, JUMP,
+    JUMP_IF_FALSE, RANGE, FOR_NEXT, POP, PRINT, RETURN, OPERATORS, AUGMENTS)
+from Interpreter import InterpreterError, allocate, augment, operations
+
+
+class VM(object):
+    """Runs a Bytecode.Code with a single dispatch loop, keeping variables
+    in a list indexed by slot. Produces the same output as running the
+    program with Interpreter.Interpreter."""
+
+    def __init__(self):
+        # line of the instruction being run
+        self.lineno = None
+
+    def run(self, code):
+        """Runs code and returns the value of its return statement, or None
+        if it has none or stops on an error"""
+        slots = [None] * len(code.names)
+        stack = []
+        try:
+            return self.execute(code, slots, stack)
+        except (InterpreterError, ArithmeticError, IndexError, ValueError) as e:
+            print("Runtime error in line {}: {}".format(self.lineno, e))
+        return None
+
+    def execute(self, code, slots, stack):
+        instructions, consts, names = code.code, code.consts, code.names
+        binary = [operations[op] for op in OPERATORS]
+        augmented = [operations[op[:-1]] for op in AUGMENTS]
+        ndarray = np.ndarray
+        push, pop = stack.append, stack.pop
+        pc = 0
+        try:
+            while True:
+                op = instructions[pc]
+                arg = instructions[pc + 1]
+                pc += 2
+                if op == LOAD:
+                    value = slots[arg]
+                    if value is None:
+                        raise InterpreterError("undefined variable {}".format(names[arg]))
+                    push(value)
+                elif op == LOAD_CONST:
+                    push(consts[arg])
+                elif op == STORE:
+                    slots[arg] = pop()
+                elif op == BINARY:
+                    right = pop()
+                    stack[-1] = binary[arg](stack[-1], right)
+                elif op == JUMP_IF_FALSE:
+                    value = pop()
+                    if isinstance(value, ndarray):
+                        value = value.all()
+                    if not value:
+                        pc = arg
+                elif op == JUMP:
+                    pc = arg
+                elif op == FOR_NEXT:
+                    i = stack[-2]
+                    if i > stack[-1]:
+                        del stack[-2:]
+                        pc = arg
+                    else:
+                        stack[-2] = i + 1
+                        push(i)
+                elif op == COPY_VIEW:
+                    value = stack[-1]
+                    if isinstance(value, ndarray) and value.base is not None:
+                        stack[-1] = value.copy()
+                elif op == COPY:
+                    if isinstance(stack[-1], ndarray):
+                        stack[-1] = stack[-1].copy()
+                elif op == AUGMENT:
+                    right = pop()
+                    if isinstance(stack[-1], ndarray):
+                        stack[-1] = augment(AUGMENTS[arg], stack[-1], right)
+                    else:
+                        stack[-1] = augmented[arg](stack[-1], right)
+                elif op == INDEX:
+                    coords = tuple(int(coord) for coord in stack[-arg:])
+                    del stack[-arg:]
+                    stack[-1] = stack[-1][coords]
+                elif op == LOAD_ITEM:
+                    coords = tuple(int(coord) for coord in stack[-arg:])
+                    push(stack[-arg - 1][coords])
+                elif op == STORE_ITEM:
+                    value = pop()
+                    coords = tuple(int(coord) for coord in stack[-arg:])
+                    del stack[-arg:]
+                    pop()[coords] = value
+                elif op == NEGATE:
+                    stack[-1] = -stack[-1]
+                elif op == TRANSPOSE:
+                    if isinstance(stack[-1], ndarray):
+                        stack[-1] = stack[-1].T
+                elif op == BUILD_VECTOR:
+                    elements = stack[len(stack) - arg:]
+                    del stack[len(stack) - arg:]
+                    push(np.array(elements, dtype=float))
+                elif op == CALL:
+                    shape = [int(size) for size in stack[len(stack) - arg:]]
+                    del stack[len(stack) - arg:]
+                    stack[-1] = allocate(stack[-1], shape)
+                elif op == RANGE:
+                    stack[-2] = int(stack[-2])
+                    stack[-1] = int(stack[-1])
+                elif op == POP:
+                    del stack[-arg:]
+                elif op == PRINT:
+                    values = stack[len(stack) - arg:]
+                    del stack[len(stack) - arg:]
+                    print(*values)
+                elif op == RETURN:
+                    return pop()
+                else:
+                    raise RuntimeError("bad opcode {}".format(op))
+        finally:
+            self.lineno = code.lines[(pc - 2) // 2]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python2
+"""Checks many .m files on a pool of worker processes.
+
+Usage: python batch.py [-j JOBS] PATH...
+A PATH may be a file, a glob pattern or a directory searched for .m files.
+Diagnostics are printed per file in input order, followed by a summary.
+"""
+
+from __future__ import print_function
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import timeit
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+compiler = None
+
+
+def expand_paths(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, name)
+                             for name in sorted(names) if name.endswith('.m'))
+        elif glob.has_magic(path):
+            files.extend(sorted(glob.glob(path)))
+        else:
+            files.append(path)
+    return files
+
+
+def init_worker():
+    # the tables are loaded once per worker process, on import
+    global compiler
+    from Compiler import Compiler
+    compiler = Compiler()
+
+
+def check_file(filename):
+    """Returns (filename, line count, diagnostics) for one file"""
+    try:
+        with open(filename) as source:
+            text = source.read()
+    except IOError:
+        return filename, 0, "Cannot open {0} file\n".format(filename)
+    # diagnostics are printed by the scanner, parser and checker
+    stdout = sys.stdout
+    sys.stdout = StringIO()
+    try:
+        compiler.compile(text, print_tree=False)
+        diagnostics = sys.stdout.getvalue()
+    except Exception as e:
+        # a bug of the checker on one file must not stop the batch; the
+        # session may be left in any state, so the next file gets a new one
+        diagnostics = sys.stdout.getvalue() + "internal error: {0}: {1}\n".format(
+            type(e).__name__, e)
+        init_worker()
+    finally:
+        sys.stdout = stdout
+    return filename, text.count('\n'), diagnostics
+
+
+def main(argv):
+    arg_parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    arg_parser.add_argument('-j', '--jobs', type=int, default=None,
+                            help="number of worker processes "
+                                 "(default: number of CPUs)")
+    arg_parser.add_argument('paths', nargs='+', metavar='PATH')
+    args = arg_parser.parse_args(argv)
+
+    files = expand_paths(args.paths)
+    start = timeit.default_timer()
+    pool = multiprocessing.Pool(args.jobs, initializer=init_worker)
+    lines = 0
+    try:
+        chunksize = max(1, len(files) // (4 * (args.jobs or multiprocessing.cpu_count())))
+        for filename, count, diagnostics in pool.imap(check_file, files, chunksize):
+            lines += count
+            if diagnostics:
+                print("==> {0} <==".format(filename))
+                print(diagnostics, end='')
+    finally:
+        pool.close()
+        pool.join()
+    elapsed = timeit.default_timer() - start
+
+    print("Checked {0} files, {1} lines in {2:.2f} s ({3:.1f} files/s, {4:.0f} lines/s)"
+          .format(len(files), lines, elapsed,
+                  len(files) / elapsed, lines / elapsed))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,827 @@
+#!/usr/bin/env python2
+"""Performance benchmarks for the compiler stages.
+
+Usage: python benchmarks.py [name ...]
+Runs all benchmarks when no name is given.
+"""
+
+from __future__ import print_function
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+
+benchmarks = {}
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+
+def benchmark(func):
+    benchmarks[func.__name__] = func
+    return func
+
+
+def measure(func, *args, **kwargs):
+    """Returns the best wall clock time of func(*args) over `repeat` runs"""
+    best = None
+    for _ in range(kwargs.get('repeat', 3)):
+        start = timeit.default_timer()
+        func(*args)
+        elapsed = timeit.default_timer() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def parse(text):
+    import Mparser
+    lexer = Mparser.scanner.lexer
+    lexer.lineno = 1
+    lexer.encountered_error = False
+    return Mparser.parser.parse(text, lexer=lexer)
+
+
+def generate_assignments(count):
+    return ''.join("a{0} = {0} + b * 2;\n".format(i) for i in range(count))
+
+
+def generate_matrix(rows, columns):
+    row = '[' + ', '.join(str(i) for i in range(columns)) + ']'
+    return 'A = [' + ', '.join([row] * rows) + '];\n'
+
+
+@benchmark
+def parse_statements():
+    """Parse time should grow linearly with the number of statements"""
+    print("{:>10} {:>10} {:>12}".format("statements", "seconds", "us/statement"))
+    for count in (1000, 10000, 100000):
+        text = generate_assignments(count)
+        elapsed = measure(parse, text)
+        print("{:>10} {:>10.3f} {:>12.2f}".format(
+            count, elapsed, elapsed / count * 1e6))
+
+
+@benchmark
+def parse_matrix_literal():
+    """Parse time of a single large [[...]] literal"""
+    print("{:>10} {:>10} {:>12}".format("elements", "seconds", "us/element"))
+    for size in (100, 300, 1000):
+        text = generate_matrix(size, size)
+        elapsed = measure(parse, text, repeat=1)
+        print("{:>10} {:>10.3f} {:>12.2f}".format(
+            size * size, elapsed, elapsed / (size * size) * 1e6))
+
+
+@benchmark
+def incremental_edit():
+    """Edit-to-diagnostics latency should not depend on the file size"""
+    from Incremental import IncrementalCompiler
+    print("{:>10} {:>12} {:>12}".format("lines", "full (s)", "edit (ms)"))
+    for count in (5000, 50000):
+        text = "b = 1;\n" + generate_assignments(count)
+        compiler = IncrementalCompiler()
+        full = measure(compiler.update, text, repeat=1)
+        # flip one literal in the middle of the file back and forth
+        old = "a{0} = {0} +".format(count // 2)
+        new = "a{0} = {1} +".format(count // 2, count)
+        edited = text.replace(old, new)
+
+        def edit():
+            compiler.update(edited)
+            compiler.update(text)
+        elapsed = measure(edit) / 2
+        print("{:>10} {:>12.3f} {:>12.3f}".format(count, full, elapsed * 1e3))
+
+
+def node_fields(node):
+    return [name for cls in type(node).__mro__
+            for name in getattr(cls, '__slots__', ())]
+
+
+class PlainNode(object):
+    """Stand-in for an AST node keeping its fields in a __dict__"""
+
+
+def walk_nodes(node):
+    """Yields node and every node reachable from it"""
+    import AST
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, AST.Node):
+            yield node
+            stack.extend(getattr(node, name) for name in node_fields(node))
+
+
+@benchmark
+def ast_memory():
+    """Bytes per AST node, with __slots__ and with a per-instance __dict__"""
+    # tracemalloc is not available on Python 2, so the node objects
+    # themselves are measured with sys.getsizeof
+    text = generate_assignments(20000)
+    ast = parse(text)
+    count = slotted = plain = 0
+    for node in walk_nodes(ast):
+        copy = PlainNode()
+        copy.__dict__.update((name, getattr(node, name))
+                             for name in node_fields(node))
+        count += 1
+        slotted += sys.getsizeof(node)
+        plain += sys.getsizeof(copy) + sys.getsizeof(copy.__dict__)
+    print("{:>10} nodes".format(count))
+    print("{:>10.1f} bytes/node with __dict__".format(plain / float(count)))
+    print("{:>10.1f} bytes/node with __slots__".format(slotted / float(count)))
+
+    from Compiler import Compiler
+    arena = Compiler(arena=True).parse(text).arena
+    arena_size = arena.nbytes() + sys.getsizeof(arena.pool)
+    print("{:>10.1f} bytes/node in an Arena".format(arena_size / float(len(arena))))
+
+
+def deep_expression(depth):
+    """Left-leaning chain 1 + 1 + ... of depth additions"""
+    import AST
+    node = AST.IntNum(1, 1)
+    for _ in range(depth):
+        node = AST.ArithmeticOperation(1, '+', node, AST.IntNum(1, 1))
+    return node
+
+
+@benchmark
+def visit_dispatch():
+    """TypeChecker node visits per second on a deep expression tree"""
+    from TypeChecker import TypeChecker
+    depth, rounds = 200, 500
+    tree = deep_expression(depth)
+
+    def check():
+        checker = TypeChecker()
+        for _ in range(rounds):
+            checker.visit(tree)
+    elapsed = measure(check)
+    visits = (2 * depth + 1) * rounds
+    print("{:>10.0f} visits/s".format(visits / elapsed))
+
+
+@benchmark
+def deep_tree():
+    """Checking and printing trees far deeper than the recursion limit"""
+    from TypeChecker import TypeChecker
+    import TreePrinter
+    tree = deep_expression(1000000)
+    elapsed = measure(TypeChecker().visit, tree, repeat=1)
+    print("{:>10} deep check {:>8.3f} s".format(1000000, elapsed))
+    # output grows with the square of the depth, so a smaller tree is printed
+    tree = deep_expression(5000)
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        elapsed = measure(tree.printTree, repeat=1)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    print("{:>10} deep print {:>8.3f} s".format(5000, elapsed))
+
+
+@benchmark
+def tree_print():
+    """Tree dump throughput, checked against the 03-ast/samples goldens"""
+    import glob
+    import TreePrinter
+    try:
+        from StringIO import StringIO
+    except ImportError:
+        from io import StringIO
+    samples = os.path.join(here, os.pardir, '03-ast', 'samples')
+    for golden in sorted(glob.glob(os.path.join(samples, '*.tree'))):
+        with open(golden[:-len('.tree')] + '.m') as source:
+            text = source.read()
+        with open(golden) as expected:
+            expected = expected.read()
+        output = StringIO()
+        parse(text).printTree(stream=output)
+        print("{:>16} {}".format(os.path.basename(golden),
+              "matches" if output.getvalue() == expected else "differs"))
+
+        tree = parse(text * 2000)
+        lines = sum(1 for _ in tree.treeLines())
+        with open(os.devnull, 'w') as devnull:
+            def print_lines():
+                # one print() per line, as the printer used to do
+                for line in tree.treeLines():
+                    print(line[:-1], file=devnull)
+            unbuffered = measure(print_lines, repeat=1)
+            buffered = measure(tree.printTree, 0, devnull, repeat=1)
+        print("{:>16} {:>10.0f} lines/s with print(), {:>10.0f} lines/s buffered"
+              .format('', lines / unbuffered, lines / buffered))
+
+
+STARTUP_SCRIPT = """
+import timeit
+start = timeit.default_timer()
+import Mparser
+Mparser.parser.parse('a = 1;', lexer=Mparser.scanner.lexer)
+print(timeit.default_timer() - start)
+"""
+
+
+def startup_latency(directory, fresh_tables):
+    runs = []
+    with open(os.devnull, 'w') as devnull:
+        for _ in range(10):
+            if fresh_tables:
+                for name in os.listdir(directory):
+                    if name.startswith(('lextab.', 'parsetab.')):
+                        os.remove(os.path.join(directory, name))
+            output = subprocess.check_output(
+                [sys.executable, '-c', STARTUP_SCRIPT], cwd=directory,
+                stderr=devnull)
+            runs.append(float(output))
+    return sorted(runs)[len(runs) // 2]
+
+
+@benchmark
+def startup():
+    """Import-to-first-parse latency of a fresh interpreter"""
+    cached = startup_latency(here, False)
+    uncached_dir = tempfile.mkdtemp()
+    try:
+        for name in ('AST.py', 'Mparser.py', 'scanner.py'):
+            shutil.copy(os.path.join(here, name), uncached_dir)
+        uncached = startup_latency(uncached_dir, True)
+    finally:
+        shutil.rmtree(uncached_dir)
+    print("{:>16} {:>10.3f} ms".format("cached tables", cached * 1e3))
+    print("{:>16} {:>10.3f} ms".format("tables rebuilt", uncached * 1e3))
+
+
+STREAM_SCRIPT = """
+from __future__ import print_function
+import sys
+import timeit
+from Compiler import Compiler
+
+
+class FirstWrite(object):
+    def __init__(self):
+        self.time = None
+
+    def write(self, text):
+        if self.time is None:
+            self.time = timeit.default_timer()
+
+start = timeit.default_timer()
+output = sys.stdout = FirstWrite()
+with open(sys.argv[2]) as source:
+    if sys.argv[1] == 'stream':
+        Compiler().compile_stream(source, print_tree=False)
+    else:
+        Compiler().compile(source.read(), print_tree=False)
+end = timeit.default_timer()
+sys.stdout = sys.__stdout__
+# ru_maxrss would keep the peak of the forked benchmark process
+with open('/proc/self/status') as status:
+    memory = dict(line.split(':') for line in status)
+print(output.time - start, end - start, memory['VmHWM'].split()[0])
+"""
+
+
+@benchmark
+def stream():
+    """Time to the first diagnostic and peak memory, whole file vs streamed"""
+    print("{:>10} {:>8} {:>14} {:>10} {:>12}".format(
+        "lines", "mode", "first error s", "total s", "max RSS MB"))
+    for count in (50000, 200000):
+        handle, filename = tempfile.mkstemp(suffix='.m')
+        try:
+            with os.fdopen(handle, 'w') as source:
+                # the type error is reported on the first line
+                source.write("b = 1 + [1, 2];\nb = 1;\n" +
+                             generate_assignments(count))
+            for mode in ('whole', 'stream'):
+                output = subprocess.check_output(
+                    [sys.executable, '-c', STREAM_SCRIPT, mode, filename],
+                    cwd=here)
+                first, total, rss = output.split()
+                # VmHWM is in kilobytes
+                print("{:>10} {:>8} {:>14.3f} {:>10.3f} {:>12.1f}".format(
+                    count, mode, float(first), float(total), int(rss) / 1024.0))
+        finally:
+            os.remove(filename)
+
+
+INPUT_SCRIPT = """
+from __future__ import print_function
+import sys
+import timeit
+import scanner
+
+start = timeit.default_timer()
+with open(sys.argv[2]) as source:
+    text = scanner.map_file(source) if sys.argv[1] == 'mmap' else source.read()
+    loaded = timeit.default_timer()
+    lexer = scanner.lexer
+    lexer.input(text)
+    tokens = sum(1 for _ in iter(lexer.token, None))
+    end = timeit.default_timer()
+    # memory while the input is still referenced
+    with open('/proc/self/status') as status:
+        memory = dict(line.split(':') for line in status)
+print(loaded - start, end - start, tokens,
+      memory['VmHWM'].split()[0], memory['RssAnon'].split()[0])
+"""
+
+
+@benchmark
+def mmap_input():
+    """Lexing a large file read into a string vs from a memory map.
+
+    The input size in MB is taken from $BENCHMARK_INPUT_MB (default 32).
+    Mapped pages are counted in the peak RSS once touched, but they are
+    backed by the file and can be dropped by the OS under memory pressure,
+    unlike the anonymous memory holding a string."""
+    size = int(os.environ.get('BENCHMARK_INPUT_MB', 32)) * 1024 * 1024
+    handle, filename = tempfile.mkstemp(suffix='.m')
+    try:
+        block = generate_assignments(10000)
+        with os.fdopen(handle, 'w') as source:
+            for _ in range(max(1, size // len(block))):
+                source.write(block)
+        print("{:>6} {:>8} {:>8} {:>10} {:>12} {:>12}".format(
+            "mode", "load s", "total s", "MB/s", "peak RSS MB", "anon RSS MB"))
+        for mode in ('read', 'mmap'):
+            output = subprocess.check_output(
+                [sys.executable, '-c', INPUT_SCRIPT, mode, filename], cwd=here)
+            loaded, total, tokens, peak, anon = output.split()
+            print("{:>6} {:>8.3f} {:>8.3f} {:>10.2f} {:>12.1f} {:>12.1f}".format(
+                mode, float(loaded), float(total),
+                os.path.getsize(filename) / float(total) / 1024 / 1024,
+                int(peak) / 1024.0, int(anon) / 1024.0))
+    finally:
+        os.remove(filename)
+
+
+def format_tokens(lexer, text):
+    """Tokens of text as printed by 01-scanner/main.py"""
+    import scanner
+    lexer.lineno = 1
+    lexer.input(text)
+    line_index = scanner.LineIndex(text)
+    return ''.join("(%d,%d): %s(%s)\n" % (tok.lineno, line_index.column(tok.lexpos),
+                                          tok.type, tok.value)
+                   for tok in iter(lexer.token, None))
+
+
+@benchmark
+def lexer_throughput():
+    """Tokens per second of ply.lex and FastLexer, checked against the
+    expected output of 01-scanner"""
+    import scanner
+    from FastLexer import FastLexer
+    scanner_dir = os.path.join(here, os.pardir, '01-scanner')
+    with open(os.path.join(scanner_dir, 'small_example.txt')) as source:
+        example = source.read()
+    with open(os.path.join(scanner_dir, 'small_expected.txt')) as expected:
+        expected = expected.read()
+    text = generate_assignments(100000)
+    print("{:>10} {:>12} {:>10}".format("lexer", "tokens/s", "expected"))
+    for name, make_lexer in (('ply.lex', scanner.lexer.clone),
+                             ('FastLexer', FastLexer)):
+        matches = format_tokens(make_lexer(), example) == expected
+        lexer = make_lexer()
+
+        def lex():
+            lexer.input(text)
+            return sum(1 for _ in iter(lexer.token, None))
+        count = lex()
+        elapsed = measure(lex)
+        print("{:>10} {:>12.0f} {:>10}".format(
+            name, count / elapsed, "matches" if matches else "differs"))
+
+
+@benchmark
+def token_stream():
+    """Parsing from a token stream file written once, vs lexing every time"""
+    import TreePrinter
+    import TokenStream
+    from Compiler import Compiler
+    text = generate_assignments(100000)
+    handle, filename = tempfile.mkstemp(suffix='.tok')
+    try:
+        with os.fdopen(handle, 'wb') as stream:
+            write = measure(TokenStream.write_tokens, text, stream, repeat=1)
+        with open(filename, 'rb') as stream:
+            reader = TokenStream.TokenReader(stream)
+            compiler = Compiler()
+            trees = []
+            for ast in (compiler.parse(text), compiler.parse_tokens(reader)):
+                trees.append(''.join(ast.treeLines()))
+            from_text = measure(compiler.parse, text)
+            from_tokens = measure(compiler.parse_tokens, reader)
+            reader.close()
+        print("{:>10} tokens, {:.1f} bytes/token on disk".format(
+            reader.count, (os.path.getsize(filename) - len(text)) /
+            float(reader.count)))
+        print("{:>24} {:>8.3f} s".format("write stream", write))
+        print("{:>24} {:>8.3f} s".format("lex and parse text", from_text))
+        print("{:>24} {:>8.3f} s".format("parse stream", from_tokens))
+        print("{:>24} {}".format("trees", "match" if trees[0] == trees[1]
+                                 else "differ"))
+    finally:
+        os.remove(filename)
+
+
+@benchmark
+def ast_cache():
+    """Loading a tree from the ASTCache vs parsing the text"""
+    from ASTCache import ASTCache
+    from Compiler import Compiler
+    directory = tempfile.mkdtemp()
+    try:
+        cache = ASTCache(directory)
+        print("{:>10} {:>10} {:>10} {:>8} {:>12}".format(
+            "statements", "parse s", "load s", "speedup", "entry bytes"))
+        for count in (10000, 100000):
+            text = generate_assignments(count)
+            compiler = Compiler(cache=cache)
+            parsed = measure(compiler.parse, text, repeat=1)
+            cache.store(text, '', compiler.parse(text))
+            loaded = measure(cache.load, text)
+            print("{:>10} {:>10.3f} {:>10.4f} {:>8.1f} {:>12}".format(
+                count, parsed, loaded, parsed / loaded,
+                os.path.getsize(cache.path(text))))
+    finally:
+        shutil.rmtree(directory)
+
+
+def token_edits(text, count, seed):
+    """Yields count variants of text with one token deleted, doubled or
+    replaced by another of its tokens, as typed by someone mid-edit"""
+    import random
+    import scanner
+    lexer = scanner.lexer.clone()
+    lexer.input(text)
+    tokens = [(token.lexpos, len(str(token.value))) for token in iter(lexer.token, None)]
+    rnd = random.Random(seed)
+    for _ in range(count):
+        start, size = rnd.choice(tokens)
+        end = start + size
+        kind = rnd.randint(0, 2)
+        if kind == 0:
+            yield text[:start] + text[end:]
+        elif kind == 1:
+            yield text[:end] + ' ' + text[start:end] + text[end:]
+        else:
+            other, other_size = rnd.choice(tokens)
+            yield text[:start] + text[other:other + other_size] + text[end:]
+
+
+def compile_output(compiler, text):
+    """Everything compile prints for text, or the exception it raises"""
+    from StringIO import StringIO
+    stdout, sys.stdout = sys.stdout, StringIO()
+    try:
+        compiler.compile(text)
+        return sys.stdout.getvalue()
+    except Exception as e:
+        return "{}{}: {}".format(sys.stdout.getvalue(), type(e).__name__, e)
+    finally:
+        sys.stdout = stdout
+
+
+@benchmark
+def arena_error_recovery():
+    """Parse time with AST and Arena builders on sample files with one
+    token edited, the inputs error recovery runs on; the builders must
+    print the same trees and messages"""
+    from Compiler import Compiler
+    directory = os.path.join(here, 'samples')
+    texts = []
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name)) as source:
+            texts.extend(token_edits(source.read(), 100, name))
+    print("{:>8} {:>10} {:>10}".format("builder", "programs", "seconds"))
+    outputs = []
+    for arena in (False, True):
+        compiler = Compiler(arena=arena)
+        start = timeit.default_timer()
+        outputs.append([compile_output(compiler, text) for text in texts])
+        elapsed = timeit.default_timer() - start
+        print("{:>8} {:>10} {:>10.3f}".format("arena" if arena else "ast", len(texts), elapsed))
+    differ = [text for text, ast, arena in zip(texts, *outputs) if ast != arena]
+    print("outputs differ on {} programs".format(len(differ)))
+    if differ:
+        print("first:\n" + differ[0])
+
+def generate_constants(count):
+    """Statements repeating the same literals and constant expressions"""
+    return ''.join("a{0} = zeros(5) * 2;\nb{0} = [1, 2, 3] * 0.5;\n"
+                   "c{0} = a{0} + ones(5) * (1 + 2 * 3);\n".format(i)
+                   for i in range(count))
+
+
+@benchmark
+def hash_consing():
+    """Nodes, memory and check time with and without shared subtrees"""
+    from Compiler import Compiler
+    text = generate_constants(20000)
+    print("{:>8} {:>12} {:>10} {:>10} {:>10}".format(
+        "share", "node objects", "MB", "parse s", "check s"))
+    for share in (False, True):
+        compiler = Compiler(share=share)
+        parsed = measure(compiler.parse, text, repeat=1)
+        ast = compiler.parse(text)
+        checked = measure(compiler.check, ast, repeat=1)
+        nodes = dict((id(node), node) for node in walk_nodes(ast))
+        size = sum(sys.getsizeof(node) for node in nodes.values())
+        print("{:>8} {:>12} {:>10.2f} {:>10.3f} {:>10.3f}".format(
+            str(share), len(nodes), size / 1024.0 / 1024, parsed, checked))
+
+
+def generate_mistyped(count):
+    """Binary expressions, nearly all of whose operand types do not match"""
+    lines = ["v = [1, 2];\nm = zeros(2);\n"]
+    for i in range(count):
+        lines.append("x{0} = v + {0};\ny{0} = m .* v;\nz{0} = v - m;\n"
+                     "w{0} = {0} / 2;\n".format(i))
+    return ''.join(lines)
+
+
+@benchmark
+def mistyped_operations():
+    """visit_BinExpr throughput on expressions that are mostly type errors"""
+    import gc
+    import AST
+    from TypeChecker import TypeChecker
+    count = 50000
+    ast = parse(generate_mistyped(count))
+    expressions = sum(isinstance(node, AST.ArithmeticOperation)
+                      for node in walk_nodes(ast))
+
+    def check():
+        TypeChecker().visit(ast)
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        gc.collect()
+        objects = len(gc.get_objects())
+        elapsed = measure(check)
+        gc.collect()
+        objects = len(gc.get_objects()) - objects
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    print("{:>10} expressions, {} errors".format(expressions, 3 * count))
+    print("{:>10.0f} expressions/s".format(expressions / elapsed))
+    print("{:>10} objects left after checking".format(objects))
+
+
+def generate_nested_loops(names, depth, per_body):
+    """Nests of depth loops, each innermost body assigning per_body distinct
+    names from the iterators, names names in total"""
+    lines = []
+    for nest in range(names // per_body):
+        for level in range(depth):
+            lines.append("for i{0} = 1:10 {{\n".format(level))
+        for k in range(nest * per_body, (nest + 1) * per_body):
+            lines.append("n{0} = i{1} + {0};\n".format(k, k % depth))
+        lines.append("}\n" * depth)
+    return ''.join(lines)
+
+
+class CopiedScopes(object):
+    """Scopes made by copying the enclosing scope, for comparison"""
+
+    def __init__(self):
+        self.scopes = [{}]
+
+    def put(self, name, symbol):
+        self.scopes[-1][name] = symbol
+
+    def get(self, name):
+        return self.scopes[-1].get(name)
+
+    def pushScope(self, name):
+        self.scopes.append(dict(self.scopes[-1]))
+
+    def popScope(self):
+        self.scopes.pop()
+
+
+@benchmark
+def symbol_table():
+    """Checking 100k distinct names in nested loops, and the scope
+    operations alone compared with scopes copying their parent"""
+    from SymbolTable import SymbolTable
+    from TypeChecker import TypeChecker
+    names, depth = 100000, 4
+    ast = parse(generate_nested_loops(names, depth, 100))
+    elapsed = measure(TypeChecker().visit, ast, repeat=1)
+    print("{:>10} names in loops of depth {}, checked in {:.3f} s".format(
+        names, depth, elapsed))
+
+    keys = ["n{}".format(k) for k in range(names)]
+
+    def scopes(table):
+        # loops entered 1000 times with the 100k names bound
+        for k, name in enumerate(keys):
+            table.put(name, k)
+        for k in range(1000):
+            table.pushScope("for")
+            table.put("i", k)
+            table.get(keys[k])
+            table.popScope()
+    print("{:>10} {:>10}".format("scopes", "seconds"))
+    for name, make in (("stacks", lambda: SymbolTable(None, "global")),
+                       ("copies", CopiedScopes)):
+        print("{:>10} {:>10.3f}".format(name, measure(lambda: scopes(make()), repeat=1)))
+
+
+MATRIX_SETUP = "A = ones(1000, 1000);\nB = eye(1000);\n"
+
+MATRIX_SCRIPTS = (
+    ("allocate", "C = zeros(1000, 1000);\n"),
+    ("elementwise", "C = A .* B .+ A ./ 2;\n"),
+    ("product", "C = A * B;\n"),
+    ("transposed product", "C = A' * B;\n"),
+    ("in place +=", "for k = 1:10 A += B;\n"),
+    ("element loop", "for i = 0:999 A[i, i] = i;\n"),
+)
+
+
+def list_product(a, b):
+    columns = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, column)) for column in columns]
+            for row in a]
+
+
+@benchmark
+def interpreter():
+    """Running scripts on 1000x1000 matrices, less the time of the setup
+    allocating them, and a product of nested lists for comparison"""
+    from Interpreter import Interpreter
+    setup = parse(MATRIX_SETUP)
+    base = measure(Interpreter().run, setup)
+    print("{:>20} {:>10}".format("script", "seconds"))
+    for name, script in MATRIX_SCRIPTS:
+        ast = parse(MATRIX_SETUP + script)
+        elapsed = measure(Interpreter().run, ast) - base
+        print("{:>20} {:>10.4f}".format(name, elapsed))
+    size = 200
+    a = [[1.0] * size for _ in range(size)]
+    elapsed = measure(list_product, a, a, repeat=1)
+    print("{:>20} {:>10.4f} for {}x{}, about {:.0f} s for 1000x1000".format(
+        "nested lists product", elapsed, size, size, elapsed * (1000 / size) ** 3))
+
+
+SCALAR_SCRIPTS = (
+    ("for", "s = 0;\nfor i = 1:200000 {\n    s += i * 2 - 1;\n"
+            "    if (s > 1000000) s = s - 1000000;\n}\n"),
+    ("while", "k = 0;\nn = 0;\nwhile (k < 200000) {\n    k = k + 1;\n"
+              "    if (k / 3 == 7) continue;\n    n += 1;\n}\n"),
+    ("nested", "t = 0.5;\nfor i = 1:400 {\n    for j = 1:500 {\n"
+               "        t = t * 0.5 + j;\n    }\n}\n"),
+)
+
+
+@benchmark
+def bytecode_vm():
+    """Loops over scalars run by the tree-walking Interpreter and by the
+    bytecode VM"""
+    from Interpreter import Interpreter
+    from Bytecode import BytecodeCompiler
+    from VM import VM
+    print("{:>10} {:>12} {:>12} {:>10} {:>8}".format(
+        "script", "interpreter", "vm", "compile", "speedup"))
+    for name, script in SCALAR_SCRIPTS:
+        ast = parse(script)
+        walked = measure(Interpreter().run, ast, repeat=1)
+        compiled = measure(BytecodeCompiler().compile, ast, repeat=1)
+        code = BytecodeCompiler().compile(ast)
+        ran = measure(VM().run, code, repeat=1)
+        print("{:>10} {:>12.3f} {:>12.3f} {:>10.4f} {:>7.1f}x".format(
+            name, walked, ran, compiled, walked / ran))
+
+
+
+@benchmark
+def python_codegen():
+    """Loops over scalars run by the VM and translated to Python by CodeGen,
+    then a first and a repeated run of a long script through a CodeCache"""
+    from ASTCache import CodeCache
+    from Bytecode import BytecodeCompiler
+    from CodeGen import CodeGenerator
+    from Compiler import Compiler
+    from VM import VM
+    print("{:>10} {:>10} {:>10} {:>10} {:>8}".format(
+        "script", "vm", "python", "translate", "speedup"))
+    for name, script in SCALAR_SCRIPTS:
+        ast = parse(script)
+        ran = measure(VM().run, BytecodeCompiler().compile(ast), repeat=1)
+        translated = measure(CodeGenerator().translate, ast, repeat=1)
+        program = CodeGenerator().translate(ast)
+        executed = measure(program.run, repeat=1)
+        print("{:>10} {:>10.3f} {:>10.3f} {:>10.4f} {:>7.1f}x".format(
+            name, ran, executed, translated, ran / executed))
+    directory = tempfile.mkdtemp()
+    try:
+        print("{:>10} {:>10} {:>10} {:>8}".format(
+            "statements", "first s", "repeat s", "speedup"))
+        for count in (1000, 10000):
+            text = "b = 1;\n" + generate_assignments(count)
+            cache = CodeCache(directory)
+            first = measure(Compiler().run_python, text, cache, repeat=1)
+            repeated = measure(Compiler().run_python, text, cache)
+            print("{:>10} {:>10.3f} {:>10.4f} {:>8.1f}".format(
+                count, first, repeated, first / repeated))
+    finally:
+        shutil.rmtree(directory)
+
+
+FOLDED_LOOP = ("for i = 1:20000 {\n"
+               "    A = eye(3) * 2 + ones(3) * (1 + 2 * 3);\n"
+               "    v = [1, 2, 3] .* 2 - -(-[1, 1, 1]);\n"
+               "    t = -(-i) + 2 * 3;\n}\n")
+
+
+@benchmark
+def constant_folding():
+    """Check plus interpreter run time of scripts full of constant
+    subexpressions, with and without the passes of Optimizer"""
+    from Compiler import Compiler
+    from Interpreter import Interpreter
+
+    def check_and_run(compiler, ast):
+        compiler.check(ast)
+        Interpreter().run(compiler.optimized(ast))
+
+    print("{:>10} {:>10} {:>10} {:>10} {:>8}".format(
+        "script", "eliminated", "plain s", "folded s", "speedup"))
+    for name, script in (("statements", generate_constants(5000)),
+                         ("loop", FOLDED_LOOP)):
+        ast = parse(script)
+        plain = measure(check_and_run, Compiler(), ast, repeat=1)
+        compiler = Compiler(optimize=True)
+        folded = measure(check_and_run, compiler, ast, repeat=1)
+        print("{:>10} {:>10} {:>10.3f} {:>10.3f} {:>7.1f}x".format(
+            name, compiler.eliminated, plain, folded, plain / folded))
+
+HOISTED_LOOP = ("k = 2;\n"
+                "P = ones(40) * k;\n"
+                "s = 0;\n"
+                "for i = 1:5000 {\n"
+                "    A = P * P;\n"
+                "    B = eye(200) * k;\n"
+                "    s += A[0, 0] + i;\n"
+                "    u = 1;\n"
+                "    if (s < 0) {\n"
+                "        break;\n"
+                "        B[0, 0] = s;\n"
+                "    }\n"
+                "}\n")
+
+
+@benchmark
+def loop_optimizer():
+    """Check plus run time of a loop with invariant matrix expressions and
+    dead code, with and without Optimizer.DeadCodeEliminator and
+    Optimizer.LoopOptimizer, on the interpreter and the VM"""
+    from Compiler import Compiler
+    from Interpreter import Interpreter
+    from Bytecode import BytecodeCompiler
+    from VM import VM
+    from Optimizer import ConstantFolder
+
+    def fold(compiler, ast):
+        return ConstantFolder().fold(ast)
+
+    def check_and_run(compiler, ast, optimize, vm):
+        compiler.check(ast)
+        ast = optimize(compiler, ast)
+        if vm:
+            VM().run(BytecodeCompiler().compile(ast))
+        else:
+            Interpreter().run(ast)
+
+    ast = parse(HOISTED_LOOP)
+    print("{:>12} {:>8} {:>10} {:>12} {:>8}".format(
+        "backend", "applied", "folded s", "optimized s", "speedup"))
+    for name, vm in (("interpreter", False), ("vm", True)):
+        folded = measure(check_and_run, Compiler(), ast, fold, vm, repeat=1)
+        compiler = Compiler(optimize=True)
+        optimized = measure(check_and_run, compiler, ast, Compiler.optimized, vm,
+                            repeat=1)
+        print("{:>12} {:>8} {:>10.3f} {:>12.3f} {:>7.1f}x".format(
+            name, len(compiler.transformations), folded, optimized,
+            folded / optimized))
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or sorted(benchmarks)
+    for name in names:
+        print("== " + name)
+        benchmarks[name]()
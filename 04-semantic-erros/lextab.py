@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ADDASSIGN', 'BREAK', 'CONTINUE', 'DIVASSIGN', 'DOTADD', 'DOTDIV', 'DOTMUL', 'DOTSUB', 'ELSE', 'EQ', 'EYE', 'FLOATNUM', 'FOR', 'GEQ', 'ID', 'IF', 'INTNUM', 'LEQ', 'MULASSIGN', 'NEQ', 'ONES', 'PRINT', 'RETURN', 'STRING', 'SUBASSIGN', 'WHILE', 'ZEROS'))
+_lexreflags   = 64
+_lexliterals  = "+-*/=()[]{}:',;<>"
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FLOATNUM>\\d* ((\\d\\.|\\.\\d) \\d* ([eE][+-]?\\d+)? | \\d([eE][+-]?\\d+)))|(?P<t_INTNUM>\\d+)|(?P<t_newline>\\n+)|(?P<t_comment>[#].*)|(?P<t_STRING>"([^"\\\\\\n]|\\\\.)*" )|(?P<t_ID>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_DOTMUL>\\.\\*)|(?P<t_DOTADD>\\.\\+)|(?P<t_ADDASSIGN>\\+=)|(?P<t_DOTDIV>\\./)|(?P<t_MULASSIGN>\\*=)|(?P<t_DOTSUB>\\.-)|(?P<t_LEQ><=)|(?P<t_GEQ>>=)|(?P<t_SUBASSIGN>-=)|(?P<t_NEQ>!=)|(?P<t_DIVASSIGN>/=)|(?P<t_EQ>==)', [None, ('t_FLOATNUM', 'FLOATNUM'), None, None, None, None, ('t_INTNUM', 'INTNUM'), ('t_newline', 'newline'), ('t_comment', 'comment'), ('t_STRING', 'STRING'), None, ('t_ID', 'ID'), (None, 'DOTMUL'), (None, 'DOTADD'), (None, 'ADDASSIGN'), (None, 'DOTDIV'), (None, 'MULASSIGN'), (None, 'DOTSUB'), (None, 'LEQ'), (None, 'GEQ'), (None, 'SUBASSIGN'), (None, 'NEQ'), (None, 'DIVASSIGN'), (None, 'EQ')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_signature = 'fb8e301ba5e03cc8394aa98b42f00dba'
@@ -1,26 +1,70 @@
 #!/usr/bin/env python2
 import sys
-import ply.yacc as yacc
-import Mparser
-from TreePrinter import TreePrinter
-from TypeChecker import TypeChecker
+import scanner
+import TokenStream
+from ASTCache import ASTCache, CodeCache
+from Compiler import Compiler
 
 
 if __name__ == '__main__':
 
+    # --arena stores the tree in flat arrays instead of AST objects
+    arena = '--arena' in sys.argv
+    # --stream checks the file statement by statement while reading it
+    stream = '--stream' in sys.argv
+    # --mmap lexes straight from a memory map of the file
+    use_mmap = '--mmap' in sys.argv
+    # --fast-lexer uses FastLexer in place of ply.lex
+    fast_lexer = '--fast-lexer' in sys.argv
+    # --tokens reads a token stream written by 01-scanner/main.py --binary
+    tokens = '--tokens' in sys.argv
+    # --share shares repeated literals and constant subexpressions
+    share = '--share' in sys.argv
+    # --run interprets the file if it has no errors, instead of printing
+    # its tree
+    run = '--run' in sys.argv
+    # --vm runs the file on the bytecode VM rather than the interpreter
+    vm = '--vm' in sys.argv
+    # --python runs the file translated to Python source, keeping the code
+    # object in a cache so that unchanged files are not even parsed again
+    python = '--python' in sys.argv
+    # --optimize runs the file after folding its constants, removing dead
+    # code and hoisting loop invariants, and reports what was done on stderr
+    optimize = '--optimize' in sys.argv
+    # --no-cache always parses the file instead of loading a cached tree
+    use_cache = '--no-cache' not in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg not in
+            ('--arena', '--stream', '--mmap', '--fast-lexer', '--tokens',
+             '--no-cache', '--share', '--run', '--vm', '--python',
+             '--optimize')]
     try:
-        filename = sys.argv[1] if len(sys.argv) > 1 else "example.txt"
+        filename = args[0] if args else "example.txt"
         file = open(filename, "r")
     except IOError:
         print("Cannot open {0} file".format(filename))
         sys.exit(0)
 
-    parser = Mparser.parser
-    text = file.read()
-    lexer = Mparser.scanner.lexer
-    lexer.encountered_error = False
-    ast = parser.parse(text, lexer=lexer, tracking=True)
-    if not lexer.encountered_error and ast is not None:
-        ast.printTree()
-        typeChecker = TypeChecker()
-        typeChecker.visit(ast)
+    if tokens:
+        Compiler(arena).compile_tokens(TokenStream.TokenReader(file))
+    elif stream:
+        Compiler(fast_lexer=fast_lexer).compile_stream(file)
+    else:
+        text = scanner.map_file(file) if use_mmap else file.read()
+        if python:
+            compiler = Compiler(arena, fast_lexer, share=share,
+                                optimize=optimize)
+            compiler.run_python(
+                text, CodeCache(optimize=optimize) if use_cache else None)
+        else:
+            # shared trees are not cached, as the cache does not keep the
+            # check results of their shared subtrees
+            cache = ASTCache() if use_cache and not share else None
+            compiler = Compiler(arena, fast_lexer, cache, share, optimize)
+            if run or vm:
+                compiler.run(text, vm)
+            else:
+                compiler.compile(text)
+        if compiler.eliminated is not None:
+            sys.stderr.write("{} nodes eliminated\n".format(compiler.eliminated))
+            for transformation in compiler.transformations:
+                sys.stderr.write(transformation + "\n")
@@ -0,0 +1,116 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "programnonassocIFnonassocELSEright=ADDASSIGNSUBASSIGNMULASSIGNDIVASSIGNnonassoc<>EQNEQGEQLEQleft+-leftDOTADDDOTSUBleft*/leftDOTMULDOTDIVrightUMINUSright'ADDASSIGN BREAK CONTINUE DIVASSIGN DOTADD DOTDIV DOTMUL DOTSUB ELSE EQ EYE FLOATNUM FOR GEQ ID IF INTNUM LEQ MULASSIGN NEQ ONES PRINT RETURN STRING SUBASSIGN WHILE ZEROSprogram : instruction\n               | program instructioninstructions : instruction\n                    | instructions instructioninstruction : block\n                   | conditional\n                   | loop\n                   | statement ';'\n                   | error ';'statement : assignment\n                 | flow_keyword\n                 | return\n                 | printflow_keyword : BREAK\n                    | CONTINUEexpression : comparison_expression\n                  | numeric_expressionblock : '{' instructions '}'\n             | '{' error '}'print : PRINT print_bodyprint_body : string\n                  | expression\n                  | print_body ',' string\n                  | print_body ',' expressionreturn : RETURN expression\n              | RETURNstring : STRINGvector : '[' vector_body ']'\n              | '[' ']'vector_body : numeric_expression\n                   | vector_body ',' numeric_expressionmatrix : '[' matrix_body ']'\n              | '[' ']'matrix_body : vector\n                   | matrix_body ',' vectorarray_range : var '[' expression ',' expression ']'fun : fun_name '(' vector_body ')'\n           | fun_name '(' error ')'fun_name : ZEROS\n                | ONES\n                | EYEloop : while\n            | forwhile : WHILE '(' expression ')' instructionfor : FOR ID '=' numeric_expression ':' numeric_expression instructionconditional : IF '(' expression ')' instruction %prec IF\n                   | IF '(' expression ')' instruction ELSE instructionassignment_lhs : var\n                      | array_rangeassignment : assignment_lhs assignment_operator expression\n                  | assignment_lhs '=' stringassignment_operator : '='\n                           | ADDASSIGN\n                           | SUBASSIGN\n                           | MULASSIGN\n                           | DIVASSIGNvar : ID\n           | var '[' vector_body ']'num : INTNUM\n           | FLOATNUM\n           | varunary_op : negation\n                | transpositionnegation : '-' numeric_expression %prec UMINUStransposition : numeric_expression '\\''numeric_expression : num\n                          | matrix\n                          | vector\n                          | unary_op\n                          | fun\n                          | '(' numeric_expression ')'numeric_expression : numeric_expression '+' numeric_expression\n                          | numeric_expression '-' numeric_expression\n                          | numeric_expression '*' numeric_expression\n                          | numeric_expression '/' numeric_expression\n                          | numeric_expression DOTADD numeric_expression\n                          | numeric_expression DOTSUB numeric_expression\n                          | numeric_expression DOTMUL numeric_expression\n                          | numeric_expression DOTDIV numeric_expressioncomparison_expression : numeric_expression '<' numeric_expression\n           | numeric_expression '>' numeric_expression\n           | numeric_expression EQ numeric_expression\n           | numeric_expression NEQ numeric_expression\n           | numeric_expression GEQ numeric_expression\n           | numeric_expression LEQ numeric_expression\n           | '(' comparison_expression ')'"
+    
+_lr_action_items = {'SUBASSIGN':([5,14,15,17,134,149,],[51,-48,-57,-49,-58,-36,]),'DOTDIV':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,89,91,92,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,129,133,134,135,138,139,142,148,],[-57,-60,-66,-69,66,-59,-67,-62,-61,-63,-68,-70,-65,66,-64,66,-29,-68,66,-79,66,-78,66,66,66,66,66,66,66,66,66,66,66,-71,66,-32,-28,-29,66,-58,66,-37,-38,66,66,]),'RETURN':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[1,-6,-43,1,-57,-1,-42,-7,1,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,1,-3,-65,-64,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,1,-58,1,-37,-38,-44,-46,1,1,-45,-47,]),'FLOATNUM':([1,3,33,34,41,50,51,52,53,54,55,56,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[27,27,27,27,27,27,-54,-56,-55,27,-53,-52,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'DOTADD':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,89,91,92,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,129,133,134,135,138,139,142,148,],[-57,-60,-66,-69,75,-59,-67,-62,-61,-63,-68,-70,-65,75,-64,75,-29,-68,75,-79,75,-78,75,-74,75,-75,-77,-76,75,75,75,75,75,-71,75,-32,-28,-29,75,-58,75,-37,-38,75,75,]),'WHILE':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[4,-6,-43,4,-57,-1,-42,-7,4,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,4,-3,-65,-64,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,4,-58,4,-37,-38,-44,-46,4,4,-45,-47,]),'PRINT':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[3,-6,-43,3,-57,-1,-42,-7,3,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,3,-3,-65,-64,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,3,-58,3,-37,-38,-44,-46,3,3,-45,-47,]),'DOTMUL':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,89,91,92,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,129,133,134,135,138,139,142,148,],[-57,-60,-66,-69,68,-59,-67,-62,-61,-63,-68,-70,-65,68,-64,68,-29,-68,68,-79,68,-78,68,68,68,68,68,68,68,68,68,68,68,-71,68,-32,-28,-29,68,-58,68,-37,-38,68,68,]),'NEQ':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,91,99,106,108,109,110,111,112,113,114,121,125,127,134,135,138,139,],[-57,-60,-66,-69,80,-59,-67,-62,-61,-63,-68,-70,-65,80,-64,-29,80,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,-58,80,-37,-38,]),'GEQ':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,91,99,106,108,109,110,111,112,113,114,121,125,127,134,135,138,139,],[-57,-60,-66,-69,67,-59,-67,-62,-61,-63,-68,-70,-65,67,-64,-29,67,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,-58,67,-37,-38,]),'INTNUM':([1,3,33,34,41,50,51,52,53,54,55,56,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[31,31,31,31,31,31,-54,-56,-55,31,-53,-52,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),"'":([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,89,91,92,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,129,133,134,135,138,139,142,148,],[-57,-60,-66,-69,69,-59,-67,-62,-61,-63,-68,-70,-65,69,69,69,-29,-68,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-71,69,-32,-28,-29,69,-58,69,-37,-38,69,69,]),']':([15,26,27,28,29,30,31,32,35,37,41,42,43,44,69,83,87,88,89,90,91,92,98,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,125,127,129,134,138,139,140,141,142,145,147,],[-57,-16,-60,-66,-69,-17,-59,-67,-62,-61,91,-63,-68,-70,-65,-64,125,127,-30,129,-29,-34,134,-30,-79,-84,-78,-72,-74,-73,-75,-77,-76,-85,-81,-82,-80,-83,-86,-71,-32,-28,-29,-58,-37,-38,-35,147,-31,149,-29,]),')':([15,26,27,28,29,30,31,32,35,37,42,43,44,69,81,82,83,89,91,94,102,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,127,134,135,138,139,142,],[-57,-16,-60,-66,-69,-17,-59,-67,-62,-61,-63,-68,-70,-65,120,121,-64,-30,-29,132,137,-79,-84,-78,-72,-74,-73,-75,-77,-76,-85,-81,-82,-80,-83,-86,-71,121,138,139,-32,-28,-58,121,-37,-38,-31,]),'(':([1,3,4,16,33,34,36,38,39,40,41,50,51,52,53,54,55,56,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[33,33,50,61,33,84,85,-41,-40,-39,84,33,-54,-56,-55,33,-53,-52,100,33,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,33,84,100,84,33,84,84,]),'+':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,89,91,92,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,129,133,134,135,138,139,142,148,],[-57,-60,-66,-69,70,-59,-67,-62,-61,-63,-68,-70,-65,70,-64,70,-29,-68,70,-79,70,-78,-72,-74,-73,-75,-77,-76,70,70,70,70,70,-71,70,-32,-28,-29,70,-58,70,-37,-38,70,70,]),'*':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,89,91,92,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,129,133,134,135,138,139,142,148,],[-57,-60,-66,-69,71,-59,-67,-62,-61,-63,-68,-70,-65,71,-64,71,-29,-68,71,-79,71,-78,71,-74,71,-75,71,71,71,71,71,71,71,-71,71,-32,-28,-29,71,-58,71,-37,-38,71,71,]),'-':([1,3,15,27,28,29,30,31,32,33,34,35,37,41,42,43,44,50,51,52,53,54,55,56,60,61,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,89,90,91,92,93,97,99,100,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,128,129,133,134,135,136,138,139,141,142,144,148,],[34,34,-57,-60,-66,-69,72,-59,-67,34,34,-62,-61,34,-63,-68,-70,34,-54,-56,-55,34,-53,-52,34,34,34,34,34,-65,34,34,34,34,34,34,34,34,34,34,34,72,-64,34,34,34,72,34,-29,-68,34,34,72,34,-79,72,-78,-72,-74,-73,-75,-77,-76,72,72,72,72,72,-71,72,-32,-28,34,-29,72,-58,72,34,-37,-38,34,72,34,72,]),',':([15,26,27,28,29,30,31,32,35,37,42,43,44,46,47,48,49,69,83,87,88,89,91,92,98,99,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,123,125,127,129,130,131,134,138,139,140,142,147,],[-57,-16,-60,-66,-69,-17,-59,-67,-62,-61,-63,-68,-70,-27,-21,93,-22,-65,-64,126,128,-30,-29,-34,128,-17,136,-79,-84,-78,-72,-74,-73,-75,-77,-76,-85,-81,-82,-80,-83,-86,-71,128,-32,-28,-29,-23,-24,-58,-37,-38,-35,-31,-29,]),'/':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,89,91,92,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,129,133,134,135,138,139,142,148,],[-57,-60,-66,-69,73,-59,-67,-62,-61,-63,-68,-70,-65,73,-64,73,-29,-68,73,-79,73,-78,73,-74,73,-75,73,73,73,73,73,73,73,-71,73,-32,-28,-29,73,-58,73,-37,-38,73,73,]),'DIVASSIGN':([5,14,15,17,134,149,],[52,-48,-57,-49,-58,-36,]),'ADDASSIGN':([5,14,15,17,134,149,],[55,-48,-57,-49,-58,-36,]),';':([1,8,9,10,12,13,15,19,21,23,26,27,28,29,30,31,32,35,37,42,43,44,45,46,47,48,49,65,69,83,91,95,96,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,125,127,130,131,134,138,139,],[-26,58,-13,-12,-10,-11,-57,-14,-15,62,-16,-60,-66,-69,-17,-59,-67,-62,-61,-63,-68,-70,-25,-27,-21,-20,-22,62,-65,-64,-29,-50,-51,-79,-84,-78,-72,-74,-73,-75,-77,-76,-85,-81,-82,-80,-83,-86,-71,-32,-28,-23,-24,-58,-37,-38,]),':':([15,27,28,29,31,32,35,37,42,43,44,69,83,91,106,108,109,110,111,112,113,114,121,125,127,133,134,138,139,],[-57,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-65,-64,-29,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,144,-58,-37,-38,]),'=':([5,14,15,17,59,134,149,],[56,-48,-57,-49,97,-58,-36,]),'<':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,91,99,106,108,109,110,111,112,113,114,121,125,127,134,135,138,139,],[-57,-60,-66,-69,79,-59,-67,-62,-61,-63,-68,-70,-65,79,-64,-29,79,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,-58,79,-37,-38,]),'$end':([2,6,7,18,20,22,25,57,58,62,103,105,143,146,151,152,],[-6,-43,0,-1,-42,-7,-5,-2,-8,-9,-18,-19,-44,-46,-45,-47,]),'EYE':([1,3,33,34,41,50,51,52,53,54,55,56,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[38,38,38,38,38,38,-54,-56,-55,38,-53,-52,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'STRING':([3,56,93,],[46,46,46,]),'FOR':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[11,-6,-43,11,-57,-1,-42,-7,11,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,11,-3,-65,-64,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,11,-58,11,-37,-38,-44,-46,11,11,-45,-47,]),'ELSE':([2,6,20,22,25,58,62,103,105,143,146,151,152,],[-6,-43,-42,-7,-5,-8,-9,-18,-19,-44,150,-45,-47,]),'ONES':([1,3,33,34,41,50,51,52,53,54,55,56,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[39,39,39,39,39,39,-54,-56,-55,39,-53,-52,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'ZEROS':([1,3,33,34,41,50,51,52,53,54,55,56,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[40,40,40,40,40,40,-54,-56,-55,40,-53,-52,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'[':([1,3,14,15,33,34,37,41,50,51,52,53,54,55,56,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,126,128,134,136,141,144,],[41,41,60,-57,41,41,86,90,41,-54,-56,-55,41,-53,-52,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,90,41,41,41,141,41,-58,41,41,41,]),'DOTSUB':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,89,91,92,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,125,127,129,133,134,135,138,139,142,148,],[-57,-60,-66,-69,74,-59,-67,-62,-61,-63,-68,-70,-65,74,-64,74,-29,-68,74,-79,74,-78,74,-74,74,-75,-77,-76,74,74,74,74,74,-71,74,-32,-28,-29,74,-58,74,-37,-38,74,74,]),'EQ':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,91,99,106,108,109,110,111,112,113,114,121,125,127,134,135,138,139,],[-57,-60,-66,-69,78,-59,-67,-62,-61,-63,-68,-70,-65,78,-64,-29,78,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,-58,78,-37,-38,]),'ID':([0,1,2,3,6,7,11,15,18,20,22,24,25,27,28,29,31,32,33,34,35,37,41,42,43,44,50,51,52,53,54,55,56,57,58,60,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,85,86,90,91,93,97,100,103,104,105,106,108,109,110,111,112,113,114,121,125,127,128,132,134,136,137,138,139,141,143,144,146,148,150,151,152,],[15,15,-6,15,-43,15,59,-57,-1,-42,-7,15,-5,-60,-66,-69,-59,-67,15,15,-62,-61,15,-63,-68,-70,15,-54,-56,-55,15,-53,-52,-2,-8,15,15,-9,15,-3,15,15,15,-65,15,15,15,15,15,15,15,15,15,15,15,-64,15,15,15,15,-29,15,15,15,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,15,15,-58,15,15,-37,-38,15,-44,15,-46,15,15,-45,-47,]),'IF':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[16,-6,-43,16,-57,-1,-42,-7,16,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,16,-3,-65,-64,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,16,-58,16,-37,-38,-44,-46,16,16,-45,-47,]),'BREAK':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[19,-6,-43,19,-57,-1,-42,-7,19,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,19,-3,-65,-64,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,19,-58,19,-37,-38,-44,-46,19,19,-45,-47,]),'LEQ':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,91,99,106,108,109,110,111,112,113,114,121,125,127,134,135,138,139,],[-57,-60,-66,-69,76,-59,-67,-62,-61,-63,-68,-70,-65,76,-64,-29,76,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,-58,76,-37,-38,]),'CONTINUE':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[21,-6,-43,21,-57,-1,-42,-7,21,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,21,-3,-65,-64,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,21,-58,21,-37,-38,-44,-46,21,21,-45,-47,]),'MULASSIGN':([5,14,15,17,134,149,],[53,-48,-57,-49,-58,-36,]),'error':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,85,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[23,-6,-43,23,-57,-1,-42,-7,65,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,23,-3,-65,-64,124,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,23,-58,23,-37,-38,-44,-46,23,23,-45,-47,]),'{':([0,2,6,7,15,18,20,22,24,25,27,28,29,31,32,35,37,42,43,44,57,58,62,63,64,69,83,91,103,104,105,106,108,109,110,111,112,113,114,121,125,127,132,134,137,138,139,143,146,148,150,151,152,],[24,-6,-43,24,-57,-1,-42,-7,24,-5,-60,-66,-69,-59,-67,-62,-61,-63,-68,-70,-2,-8,-9,24,-3,-65,-64,-29,-18,-4,-19,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,24,-58,24,-37,-38,-44,-46,24,24,-45,-47,]),'>':([15,27,28,29,30,31,32,35,37,42,43,44,69,82,83,91,99,106,108,109,110,111,112,113,114,121,125,127,134,135,138,139,],[-57,-60,-66,-69,77,-59,-67,-62,-61,-63,-68,-70,-65,77,-64,-29,77,-79,-78,-72,-74,-73,-75,-77,-76,-71,-32,-28,-58,77,-37,-38,]),'}':([2,6,20,22,25,58,62,63,64,65,103,104,105,143,146,151,152,],[-6,-43,-42,-7,-5,-8,-9,103,-3,105,-18,-4,-19,-44,-46,-45,-47,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'matrix_body':([41,90,],[87,87,]),'conditional':([0,7,24,63,132,137,148,150,],[2,2,2,2,2,2,2,2,]),'comparison_expression':([1,3,33,50,54,60,61,93,100,136,],[26,26,81,26,26,26,26,26,81,26,]),'vector_body':([41,60,85,86,90,141,],[88,98,123,98,88,88,]),'numeric_expression':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[30,30,82,83,89,30,30,99,30,106,107,108,109,110,111,112,113,114,115,116,117,118,119,122,89,89,89,30,133,135,142,30,89,148,]),'num':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'unary_op':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'fun_name':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'assignment_lhs':([0,7,24,63,132,137,148,150,],[5,5,5,5,5,5,5,5,]),'matrix':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'for':([0,7,24,63,132,137,148,150,],[6,6,6,6,6,6,6,6,]),'negation':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'program':([0,],[7,]),'statement':([0,7,24,63,132,137,148,150,],[8,8,8,8,8,8,8,8,]),'var':([0,1,3,7,24,33,34,41,50,54,60,61,63,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,132,136,137,141,144,148,150,],[14,37,37,14,14,37,37,37,37,37,37,37,14,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,14,37,14,37,37,14,14,]),'assignment_operator':([5,],[54,]),'return':([0,7,24,63,132,137,148,150,],[10,10,10,10,10,10,10,10,]),'string':([3,56,93,],[47,96,130,]),'assignment':([0,7,24,63,132,137,148,150,],[12,12,12,12,12,12,12,12,]),'flow_keyword':([0,7,24,63,132,137,148,150,],[13,13,13,13,13,13,13,13,]),'print':([0,7,24,63,132,137,148,150,],[9,9,9,9,9,9,9,9,]),'instructions':([24,],[63,]),'print_body':([3,],[48,]),'array_range':([0,7,24,63,132,137,148,150,],[17,17,17,17,17,17,17,17,]),'instruction':([0,7,24,63,132,137,148,150,],[18,57,64,104,143,146,151,152,]),'while':([0,7,24,63,132,137,148,150,],[20,20,20,20,20,20,20,20,]),'vector':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,126,128,136,141,144,],[43,43,43,43,92,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,92,43,43,43,140,43,43,43,43,]),'block':([0,7,24,63,132,137,148,150,],[25,25,25,25,25,25,25,25,]),'fun':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'expression':([1,3,50,54,60,61,93,136,],[45,49,94,95,101,102,131,145,]),'transposition':([1,3,33,34,41,50,54,60,61,66,67,68,70,71,72,73,74,75,76,77,78,79,80,84,85,86,90,93,97,100,128,136,141,144,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'loop':([0,7,24,63,132,137,148,150,],[22,22,22,22,22,22,22,22,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> instruction','program',1,'p_program','Mparser.py',46),
+  ('program -> program instruction','program',2,'p_program','Mparser.py',47),
+  ('instructions -> instruction','instructions',1,'p_instructions','Mparser.py',62),
+  ('instructions -> instructions instruction','instructions',2,'p_instructions','Mparser.py',63),
+  ('instruction -> block','instruction',1,'p_instruction','Mparser.py',73),
+  ('instruction -> conditional','instruction',1,'p_instruction','Mparser.py',74),
+  ('instruction -> loop','instruction',1,'p_instruction','Mparser.py',75),
+  ('instruction -> statement ;','instruction',2,'p_instruction','Mparser.py',76),
+  ('instruction -> error ;','instruction',2,'p_instruction','Mparser.py',77),
+  ('statement -> assignment','statement',1,'p_statement','Mparser.py',82),
+  ('statement -> flow_keyword','statement',1,'p_statement','Mparser.py',83),
+  ('statement -> return','statement',1,'p_statement','Mparser.py',84),
+  ('statement -> print','statement',1,'p_statement','Mparser.py',85),
+  ('flow_keyword -> BREAK','flow_keyword',1,'p_flow_keyword','Mparser.py',90),
+  ('flow_keyword -> CONTINUE','flow_keyword',1,'p_flow_keyword','Mparser.py',91),
+  ('expression -> comparison_expression','expression',1,'p_expression','Mparser.py',96),
+  ('expression -> numeric_expression','expression',1,'p_expression','Mparser.py',97),
+  ('block -> { instructions }','block',3,'p_block','Mparser.py',102),
+  ('block -> { error }','block',3,'p_block','Mparser.py',103),
+  ('print -> PRINT print_body','print',2,'p_print','Mparser.py',108),
+  ('print_body -> string','print_body',1,'p_print_body','Mparser.py',113),
+  ('print_body -> expression','print_body',1,'p_print_body','Mparser.py',114),
+  ('print_body -> print_body , string','print_body',3,'p_print_body','Mparser.py',115),
+  ('print_body -> print_body , expression','print_body',3,'p_print_body','Mparser.py',116),
+  ('return -> RETURN expression','return',2,'p_return','Mparser.py',125),
+  ('return -> RETURN','return',1,'p_return','Mparser.py',126),
+  ('string -> STRING','string',1,'p_string','Mparser.py',134),
+  ('vector -> [ vector_body ]','vector',3,'p_vector','Mparser.py',143),
+  ('vector -> [ ]','vector',2,'p_vector','Mparser.py',144),
+  ('vector_body -> numeric_expression','vector_body',1,'p_vector_body','Mparser.py',152),
+  ('vector_body -> vector_body , numeric_expression','vector_body',3,'p_vector_body','Mparser.py',153),
+  ('matrix -> [ matrix_body ]','matrix',3,'p_matrix','Mparser.py',162),
+  ('matrix -> [ ]','matrix',2,'p_matrix','Mparser.py',163),
+  ('matrix_body -> vector','matrix_body',1,'p_matrix_body','Mparser.py',171),
+  ('matrix_body -> matrix_body , vector','matrix_body',3,'p_matrix_body','Mparser.py',172),
+  ('array_range -> var [ expression , expression ]','array_range',6,'p_array_range','Mparser.py',185),
+  ('fun -> fun_name ( vector_body )','fun',4,'p_fun','Mparser.py',194),
+  ('fun -> fun_name ( error )','fun',4,'p_fun','Mparser.py',195),
+  ('fun_name -> ZEROS','fun_name',1,'p_fun_name','Mparser.py',200),
+  ('fun_name -> ONES','fun_name',1,'p_fun_name','Mparser.py',201),
+  ('fun_name -> EYE','fun_name',1,'p_fun_name','Mparser.py',202),
+  ('loop -> while','loop',1,'p_loop','Mparser.py',211),
+  ('loop -> for','loop',1,'p_loop','Mparser.py',212),
+  ('while -> WHILE ( expression ) instruction','while',5,'p_while','Mparser.py',217),
+  ('for -> FOR ID = numeric_expression : numeric_expression instruction','for',7,'p_for','Mparser.py',222),
+  ('conditional -> IF ( expression ) instruction','conditional',5,'p_conditional','Mparser.py',233),
+  ('conditional -> IF ( expression ) instruction ELSE instruction','conditional',7,'p_conditional','Mparser.py',234),
+  ('assignment_lhs -> var','assignment_lhs',1,'p_assignment_lhs','Mparser.py',247),
+  ('assignment_lhs -> array_range','assignment_lhs',1,'p_assignment_lhs','Mparser.py',248),
+  ('assignment -> assignment_lhs assignment_operator expression','assignment',3,'p_assignment','Mparser.py',253),
+  ('assignment -> assignment_lhs = string','assignment',3,'p_assignment','Mparser.py',254),
+  ('assignment_operator -> =','assignment_operator',1,'p_assignment_operator','Mparser.py',259),
+  ('assignment_operator -> ADDASSIGN','assignment_operator',1,'p_assignment_operator','Mparser.py',260),
+  ('assignment_operator -> SUBASSIGN','assignment_operator',1,'p_assignment_operator','Mparser.py',261),
+  ('assignment_operator -> MULASSIGN','assignment_operator',1,'p_assignment_operator','Mparser.py',262),
+  ('assignment_operator -> DIVASSIGN','assignment_operator',1,'p_assignment_operator','Mparser.py',263),
+  ('var -> ID','var',1,'p_var','Mparser.py',272),
+  ('var -> var [ vector_body ]','var',4,'p_var','Mparser.py',273),
+  ('num -> INTNUM','num',1,'p_num','Mparser.py',281),
+  ('num -> FLOATNUM','num',1,'p_num','Mparser.py',282),
+  ('num -> var','num',1,'p_num','Mparser.py',283),
+  ('unary_op -> negation','unary_op',1,'p_unary_op','Mparser.py',298),
+  ('unary_op -> transposition','unary_op',1,'p_unary_op','Mparser.py',299),
+  ('negation -> - numeric_expression','negation',2,'p_neg','Mparser.py',304),
+  ("transposition -> numeric_expression '",'transposition',2,'p_transposition','Mparser.py',309),
+  ('numeric_expression -> num','numeric_expression',1,'p_numeric_expression','Mparser.py',314),
+  ('numeric_expression -> matrix','numeric_expression',1,'p_numeric_expression','Mparser.py',315),
+  ('numeric_expression -> vector','numeric_expression',1,'p_numeric_expression','Mparser.py',316),
+  ('numeric_expression -> unary_op','numeric_expression',1,'p_numeric_expression','Mparser.py',317),
+  ('numeric_expression -> fun','numeric_expression',1,'p_numeric_expression','Mparser.py',318),
+  ('numeric_expression -> ( numeric_expression )','numeric_expression',3,'p_numeric_expression','Mparser.py',319),
+  ('numeric_expression -> numeric_expression + numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',327),
+  ('numeric_expression -> numeric_expression - numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',328),
+  ('numeric_expression -> numeric_expression * numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',329),
+  ('numeric_expression -> numeric_expression / numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',330),
+  ('numeric_expression -> numeric_expression DOTADD numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',331),
+  ('numeric_expression -> numeric_expression DOTSUB numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',332),
+  ('numeric_expression -> numeric_expression DOTMUL numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',333),
+  ('numeric_expression -> numeric_expression DOTDIV numeric_expression','numeric_expression',3,'p_bin_numeric_expression','Mparser.py',334),
+  ('comparison_expression -> numeric_expression < numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',343),
+  ('comparison_expression -> numeric_expression > numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',344),
+  ('comparison_expression -> numeric_expression EQ numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',345),
+  ('comparison_expression -> numeric_expression NEQ numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',346),
+  ('comparison_expression -> numeric_expression GEQ numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',347),
+  ('comparison_expression -> numeric_expression LEQ numeric_expression','comparison_expression',3,'p_comparison_expression','Mparser.py',348),
+  ('comparison_expression -> ( comparison_expression )','comparison_expression',3,'p_comparison_expression','Mparser.py',349),
+]
@@ -1,5 +1,10 @@
 #!/usr/bin/env python2
 
+import bisect
+import hashlib
+import mmap
+import os
+import re
 import sys
 import ply.lex as lex
 literals = "+-*/=()[]{}:',;<>"
@@ -74,10 +79,87 @@ def t_ID(t):
     return t
 
 
-def find_column(input, token):
-    line_start = input.rfind('\n', 0, token.lexpos) + 1
-    return (token.lexpos - line_start) + 1
+def map_file(file):
+    """Maps an open file into memory read-only; the lexer accepts the
+    result in place of a string and the OS pages it in on demand"""
+    if os.fstat(file.fileno()).st_size == 0:
+        # empty files cannot be mapped
+        return ''
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class LineIndex(object):
+    """Start offsets of every line of an input, built once per input.
+
+    Mapped files are not indexed, as the index would take more memory than
+    the file; their columns are found by searching back for a newline."""
+
+    def __init__(self, input):
+        self.input = input
+        if isinstance(input, mmap.mmap):
+            self.line_starts = None
+        else:
+            self.line_starts = [0]
+            self.line_starts.extend(m.end() for m in re.finditer('\n', input))
 
+    def column(self, lexpos):
+        if self.line_starts is None:
+            return lexpos - self.input.rfind('\n', 0, lexpos)
+        line = bisect.bisect_right(self.line_starts, lexpos) - 1
+        return (lexpos - self.line_starts[line]) + 1
 
-lexer = lex.lex()
+
+_line_index = None
+
+
+def find_column(input, token):
+    # the index of the last seen input is kept, as callers pass the same
+    # text for every token of it
+    global _line_index
+    line_index = _line_index
+    if line_index is None or line_index.input is not input:
+        line_index = _line_index = LineIndex(input)
+    return line_index.column(token.lexpos)
+
+
+# generated tables are kept next to this module
+table_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def rules_signature():
+    """Hash of the token rules, used to tell whether lextab is stale: the
+    regex of every rule, which is the docstring of a function rule"""
+    rules = []
+    for name, rule in sorted(globals().items()):
+        if name.startswith('t_'):
+            if callable(rule):
+                rule = rule.__doc__
+            rules.append((name, rule))
+    spec = repr((tokens, literals, rules))
+    return hashlib.md5(spec.encode('utf-8')).hexdigest()
+
+
+def build_lexer():
+    """Lexer loaded from lextab, or built from the rules if lextab is stale;
+    the table is never written here, see write_table"""
+    try:
+        import lextab
+        if getattr(lextab, '_signature', None) == rules_signature():
+            return lex.lex(optimize=1, lextab=lextab)
+    except ImportError:
+        pass
+    return lex.lex()
+
+
+def write_table():
+    """Regenerates lextab.py, which is done ahead of time by running
+    Mparser.py rather than on import, as processes importing the scanner
+    at once would race on the file"""
+    lexer = lex.lex()
+    lexer.writetab('lextab', table_dir)
+    with open(os.path.join(table_dir, 'lextab.py'), 'a') as tab:
+        tab.write('_signature = %r\n' % rules_signature())
+
+
+lexer = build_lexer()
 fh = None
@@ -0,0 +1,38 @@
+#!/usr/bin/env python2
+"""Re-checks a file whenever it changes, reusing the unchanged statements.
+
+Usage: python watch.py FILE
+"""
+
+from __future__ import print_function
+import os
+import sys
+import time
+import timeit
+from Incremental import IncrementalCompiler
+
+
+if __name__ == '__main__':
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else "example.txt"
+    compiler = IncrementalCompiler()
+    mtime = None
+    while True:
+        try:
+            current = os.stat(filename).st_mtime
+            if current != mtime:
+                mtime = current
+                with open(filename) as source:
+                    text = source.read()
+                start = timeit.default_timer()
+                compiler.update(text)
+                elapsed = timeit.default_timer() - start
+                print(compiler.diagnostics(), end='')
+                print("-- checked in {0:.1f} ms".format(elapsed * 1e3))
+                sys.stdout.flush()
+            time.sleep(0.2)
+        except OSError:
+            print("Cannot open {0} file".format(filename))
+            sys.exit(0)
+        except KeyboardInterrupt:
+            break